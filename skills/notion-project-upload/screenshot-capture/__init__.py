@@ -4,7 +4,20 @@ Screenshot Capture Module for notion-project-upload skill
 프로젝트 분석 → 캡처 전략 → 실행 → Notion 업로드 자동화
 """
 
+from .app_logs import LogDrainer
+from .app_supervisor import AppServer, AppSupervisor
+from .batch import BatchJob, BatchJobResult, BatchSummary, iter_batch, run_batch
+from .browser_pool import BrowserPool
+from .capture_executor import AsyncCaptureExecutor
 from .capture_manager import CaptureManager, CaptureReport, CaptureResult
+from .capture_planner import CaptureGroup, plan_captures
+from .image_encoding import EncodedImage, ImageEncoder
+from .network_profile import NetworkFilter, NetworkProfile, NetworkStats
+from .rate_limit import TokenBucket
+from .render_cache import RenderCache, RenderCacheStats
+from .selector_cache import SelectorCache
+from .stability import StabilityProfile
+from .static_build import BuildCache, StaticSiteServer
 from .strategies import (
     CaptureStrategy,
     CaptureItem,
@@ -16,12 +29,26 @@ from .strategies import (
     format_capture_plan_preview,
 )
 from .terminal_renderer import TerminalRenderer
+from .upload_cache import UploadCache
+from .workspace import CaptureWorkspace
 from .notion_file_upload import NotionFileUploader, NotionUploadError, FileValidationError
 
 __all__ = [
+    "AppServer",
+    "AppSupervisor",
+    "LogDrainer",
+    "BrowserPool",
+    "AsyncCaptureExecutor",
+    "BatchJob",
+    "BatchJobResult",
+    "BatchSummary",
+    "iter_batch",
+    "run_batch",
     "CaptureManager",
     "CaptureReport",
     "CaptureResult",
+    "CaptureGroup",
+    "plan_captures",
     "CaptureStrategy",
     "CaptureItem",
     "CaptureMethod",
@@ -31,7 +58,21 @@ __all__ = [
     "determine_capture_strategy",
     "format_capture_plan_preview",
     "TerminalRenderer",
+    "ImageEncoder",
+    "EncodedImage",
+    "RenderCache",
+    "RenderCacheStats",
+    "CaptureWorkspace",
     "NotionFileUploader",
     "NotionUploadError",
     "FileValidationError",
+    "UploadCache",
+    "SelectorCache",
+    "StabilityProfile",
+    "BuildCache",
+    "StaticSiteServer",
+    "TokenBucket",
+    "NetworkProfile",
+    "NetworkFilter",
+    "NetworkStats",
 ]
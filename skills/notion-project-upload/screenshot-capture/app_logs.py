@@ -0,0 +1,114 @@
+"""
+App Log Drainer
+===============
+실행 중인 앱의 stdout/stderr 파이프를 백그라운드 스레드로 계속 비운다.
+
+- 파이프를 읽지 않으면 로그가 많은 개발 서버가 버퍼가 차서 멈춘다 → 항상 drain
+- 스트림별로 최근 max_lines줄만 보관 (ring buffer), ANSI 색상 코드 제거
+- 한 줄은 MAX_LINE_BYTES까지만 읽고 나머지는 버림 → 줄바꿈 없는 출력에도 메모리 일정
+- 프레임워크별 "ready" 로그 패턴(예: Streamlit "You can now view", Vite "Local:")이
+  보이면 ready 이벤트 설정 → readiness probe가 backoff 없이 바로 확인
+- tail()로 최근 로그를 시간 순으로 합쳐 실패 진단에 사용
+
+프레임워크별 패턴은 strategies.FRAMEWORK_SIGNATURES의 readiness["ready_patterns"].
+
+Usage:
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, ...)
+    logs = LogDrainer(process, ready_patterns=[r"You can now view"])
+    logs.ready.wait(timeout=30)
+    print(logs.tail())
+"""
+
+import itertools
+import re
+import subprocess
+import threading
+from collections import deque
+from typing import IO, Optional
+
+from .command_output import MAX_LINE_BYTES
+
+
+DEFAULT_LOG_LINES = 200  # 스트림별 보관 줄 수
+LOG_TAIL_LINES = 20      # tail() 기본 줄 수
+MAX_LINE_LENGTH = 1000   # 진행 표시줄 등 긴 줄은 잘라서 보관
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+STREAMS = ("stdout", "stderr")
+
+
+class LogDrainer:
+    """앱 프로세스 출력 drain + ring buffer + ready 로그 감지"""
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        ready_patterns=(),
+        max_lines: int = DEFAULT_LOG_LINES,
+    ):
+        """
+        Args:
+            process: stdout/stderr=PIPE로 실행한 앱 프로세스
+            ready_patterns: 기동 완료를 알리는 로그 정규식들
+            max_lines: 스트림별 보관 줄 수
+        """
+        self.ready = threading.Event()
+        self.ready_line: Optional[str] = None
+        self._patterns = [re.compile(p) for p in ready_patterns]
+        self._buffers = {name: deque(maxlen=max_lines) for name in STREAMS}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+        for name in STREAMS:
+            stream = getattr(process, name)
+            if stream is None:
+                continue
+            thread = threading.Thread(
+                target=self._drain, args=(name, stream), name=f"app-log-{name}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def lines(self, stream: str) -> list[str]:
+        """스트림 하나의 보관 중인 로그"""
+        with self._lock:
+            return [text for _, text in self._buffers[stream]]
+
+    def tail(self, lines: int = LOG_TAIL_LINES) -> str:
+        """stdout/stderr를 출력 순서대로 합친 최근 로그"""
+        with self._lock:
+            merged = sorted(
+                (seq, name, text) for name in STREAMS for seq, text in self._buffers[name]
+            )
+        return "\n".join(
+            f"[{name}] {text}" if name == "stderr" else text
+            for _, name, text in merged[-lines:]
+        )
+
+    def join(self, timeout: float = 1.0) -> None:
+        """프로세스 종료 후 남은 출력을 마저 읽을 때까지 대기"""
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _drain(self, name: str, stream: IO[bytes]) -> None:
+        buffer = self._buffers[name]
+        truncated = False  # MAX_LINE_BYTES를 넘은 줄의 나머지를 건너뛰는 중
+        try:
+            for raw in iter(lambda: stream.readline(MAX_LINE_BYTES), b""):
+                skip, truncated = truncated, not raw.endswith(b"\n")
+                if skip:
+                    continue
+                text = ANSI_ESCAPE.sub("", raw.decode(errors="replace")).rstrip()[:MAX_LINE_LENGTH]
+                if not text:
+                    continue
+                with self._lock:
+                    buffer.append((next(self._seq), text))
+                if not self.ready.is_set() and any(p.search(text) for p in self._patterns):
+                    self.ready_line = text
+                    self.ready.set()
+        except (OSError, ValueError):
+            pass  # 종료 중 파이프가 닫힘
+        finally:
+            stream.close()
@@ -0,0 +1,392 @@
+"""
+App Supervisor
+==============
+캡처용 웹앱 서버를 auto_capture 호출 사이에 살려 두고 재사용하는 레지스트리.
+
+- 키: 프로젝트 경로, 재사용 조건: 소스 fingerprint(파일 경로/크기/mtime + 실행 명령) 동일
+- 재사용 전 health check (프로세스 생존 + TCP/HTTP 응답), 실패하면 재기동
+- fingerprint가 바뀌면 기존 서버를 내리고 새로 기동
+- 사용 중이 아닌 서버는 idle_ttl 동안 쓰이지 않으면 백그라운드 reaper가 종료
+- 기동(readiness 대기, 정적 빌드)은 lock 밖에서 — 프로젝트별 in-flight Event로 같은 프로젝트의
+  동시 acquire만 기다리게 하고, 다른 프로젝트의 acquire / release / reaper는 막지 않음
+- 서버 종료는 모두 여기서 (프로세스 그룹 SIGTERM → SIGKILL), 프로세스 종료 시 atexit 정리
+- 포트: 기동마다 빈 포트를 할당하고(고정 포트 지정 시 그 포트), readiness 후 그 포트를
+  실제로 앱 프로세스 그룹이 LISTEN 중인지 확인 → 다른 프로그램을 캡처하는 사고 방지
+- 앱 stdout/stderr는 LogDrainer가 계속 비우고(파이프 막힘 방지) 최근 로그를 보관,
+  ready 로그 줄은 readiness probe의 조기 신호로 사용. 기동 실패 시 로그 tail은
+  failure_log()로 조회
+- build_cache가 주어지면 React/Vite 프로젝트는 개발 서버 대신 캐시된 프로덕션 빌드를
+  프로세스 내 정적 서버로 서빙 (빌드 실패 시 개발 서버로 fallback)
+
+README 등 문서(.md/.rst) 수정은 fingerprint에서 제외 → 문서만 고친 재캡처는 warm 서버 사용.
+
+Usage:
+    supervisor = AppSupervisor(idle_ttl=600)
+    server = supervisor.acquire(framework, "/path/to/project")
+    if server:
+        ...server.url 캡처...
+        supervisor.release(server)
+    supervisor.stop_all()
+"""
+
+import atexit
+import hashlib
+import os
+import signal
+import subprocess
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .app_logs import LogDrainer
+from .ports import find_free_port, listening_ports
+from .readiness import DEFAULT_PROBE, is_healthy, wait_until_ready
+from .static_build import STATIC_BUILD_FRAMEWORKS, BuildCache, StaticBuildError, StaticSiteServer
+from .strategies import launch_command
+
+
+DEFAULT_IDLE_TTL = 600.0  # 초 — 이 시간 동안 쓰이지 않은 서버는 종료
+REAPER_INTERVAL = 30.0    # 초 — idle 서버 점검 주기 상한
+FAILURE_PRINT_LINES = 8   # 기동 실패 시 콘솔에 보여줄 로그 줄 수 (전체 tail은 failure_log())
+
+# fingerprint에서 제외할 디렉토리 / 문서 확장자
+FINGERPRINT_SKIP_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv", "env",
+    ".mypy_cache", ".pytest_cache", ".next", "dist", "build", ".cache",
+})
+FINGERPRINT_SKIP_SUFFIXES = frozenset({".md", ".rst", ".adoc", ".pyc", ".log"})
+
+
+@dataclass
+class AppServer:
+    """supervisor가 관리하는 실행 중인 앱 서버"""
+    key: str
+    fingerprint: str
+    framework: dict
+    process: Optional[subprocess.Popen]  # 정적 서빙이면 None
+    port: int
+    startup_seconds: float
+    reused: bool = False                 # 이번 acquire가 warm 서버 재사용인지
+    in_use: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    logs: Optional[LogDrainer] = field(default=None, repr=False)  # stdout/stderr drain
+    static: Optional[StaticSiteServer] = field(default=None, repr=False)  # 프로덕션 빌드 서빙
+    build_note: Optional[str] = None     # static_build 사용 시 빌드 결과 또는 건너뛴 이유
+
+    @property
+    def host(self) -> str:
+        return self.static.host if self.static else "localhost"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def alive(self) -> bool:
+        if self.static:
+            return self.static.running
+        return self.process.poll() is None
+
+
+class AppSupervisor:
+    """프로젝트별 warm 앱 서버 레지스트리"""
+
+    def __init__(self, idle_ttl: float = DEFAULT_IDLE_TTL, build_cache: Optional[BuildCache] = None):
+        """
+        Args:
+            idle_ttl: 사용이 끝난 서버를 살려 둘 시간 (초, 0이면 release 즉시 종료)
+            build_cache: 있으면 React/Vite 앱을 프로덕션 빌드 + 정적 서버로 실행
+        """
+        self.idle_ttl = idle_ttl
+        self.build_cache = build_cache
+        self._servers: dict[str, AppServer] = {}
+        self._failure_logs: dict[str, str] = {}  # 프로젝트별 마지막 기동 실패 로그 tail
+        self._launching: dict[str, threading.Event] = {}  # 기동/재사용 확인 중인 프로젝트
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+        # close/stop_all 없이 인터프리터가 끝나도 앱 프로세스가 남지 않도록
+        atexit.register(_stop_all_ref, weakref.ref(self))
+
+    # ─────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────
+    def acquire(self, framework: dict, project_path: str) -> Optional[AppServer]:
+        """
+        프로젝트 앱 서버를 빌려준다 (warm 서버 재사용 또는 새로 기동).
+
+        Returns:
+            AppServer 또는 None (기동 실패)
+        """
+        key = os.path.realpath(project_path)
+        # 포트가 채워지기 전 템플릿 기준 — 포트가 바뀌어도 재기동 사유가 아님
+        fingerprint = source_fingerprint(project_path, framework["launch_template"])
+        health_path = framework.get("readiness", {}).get("health_path", DEFAULT_PROBE["health_path"])
+
+        # 같은 프로젝트를 이미 다른 스레드가 확인/기동 중이면 끝날 때까지 기다렸다가 다시 시도
+        while True:
+            with self._lock:
+                pending = self._launching.get(key)
+                if pending is None:
+                    current = self._servers.get(key)
+                    if current:
+                        current.in_use += 1  # 확인하는 동안 reaper가 종료하지 않도록
+                    self._launching[key] = threading.Event()
+                    break
+            pending.wait()
+
+        server = None
+        try:
+            server = self._reuse_or_start(key, current, fingerprint, health_path, framework, project_path)
+        finally:
+            with self._lock:
+                if server is not None and server is not current:
+                    server.in_use += 1
+                    self._servers[key] = server
+                    self._ensure_reaper()
+                self._launching.pop(key).set()
+        return server
+
+    def release(self, server: AppServer) -> None:
+        """캡처가 끝난 서버 반납 — idle_ttl 동안 살려 둔다"""
+        with self._lock:
+            server.in_use = max(0, server.in_use - 1)
+            server.last_used = time.monotonic()
+            expired = self.idle_ttl <= 0 and server.in_use == 0
+            if expired:
+                self._servers.pop(server.key, None)
+        if expired:
+            self._terminate(server)  # 종료 대기(최대 5초)는 lock 밖에서
+
+    def failure_log(self, project_path: str) -> Optional[str]:
+        """프로젝트 앱이 마지막 acquire에서 기동에 실패했다면 그때의 로그 tail"""
+        return self._failure_logs.get(os.path.realpath(project_path))
+
+    def stop(self, project_path: str) -> None:
+        """프로젝트의 서버 종료"""
+        with self._lock:
+            server = self._servers.pop(os.path.realpath(project_path), None)
+        if server:
+            self._terminate(server)
+
+    def stop_all(self) -> None:
+        """모든 서버 종료 및 reaper 중단"""
+        self._stop_event.set()
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+        for server in servers:
+            self._terminate(server)
+
+    def reap_idle(self) -> None:
+        """idle_ttl을 넘긴 미사용 서버와 이미 죽은 서버 정리"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                s for s in self._servers.values()
+                if not s.alive() or (s.in_use == 0 and now - s.last_used >= self.idle_ttl)
+            ]
+            for server in expired:
+                self._servers.pop(server.key, None)
+        for server in expired:
+            self._terminate(server)
+
+    # ─────────────────────────────────────────────
+    # 기동 / 종료
+    # ─────────────────────────────────────────────
+    def _reuse_or_start(
+        self,
+        key: str,
+        current: Optional[AppServer],
+        fingerprint: str,
+        health_path: str,
+        framework: dict,
+        project_path: str,
+    ) -> Optional[AppServer]:
+        """
+        warm 서버가 그대로 쓸 수 있으면 반환, 아니면 내리고 새로 기동 (lock 밖에서 실행).
+        current는 acquire가 in_use를 미리 올려 둔 상태.
+        """
+        if current and current.fingerprint == fingerprint and current.alive() \
+                and is_healthy(current.host, current.port, health_path):
+            current.reused = True
+            print(f"  ♻️ {framework['framework']} 앱 재사용: {current.url}")
+            return current
+
+        if current:
+            reason = "소스 변경" if current.fingerprint != fingerprint else "응답 없음"
+            print(f"  🔄 {framework['framework']} 앱 재기동 ({reason})")
+            with self._lock:
+                if self._servers.get(key) is current:
+                    self._servers.pop(key)
+            self._terminate(current)
+
+        self._failure_logs.pop(key, None)
+        server = None
+        build_note = None
+        if self.build_cache and framework["framework"] in STATIC_BUILD_FRAMEWORKS:
+            server, build_note = self._serve_static(key, fingerprint, framework, project_path)
+        if server is None:
+            server = self._launch(key, fingerprint, framework, project_path)
+            if server:
+                server.build_note = build_note  # 정적 빌드를 건너뛴 이유 (리포트용)
+        return server
+
+    def _launch(
+        self, key: str, fingerprint: str, framework: dict, project_path: str
+    ) -> Optional[AppServer]:
+        """웹앱을 백그라운드로 실행하고 응답할 때까지 대기"""
+        port = framework.get("port") or find_free_port()
+        print(f"  🚀 {framework['framework']} 앱 실행 중 (포트 {port})...")
+
+        try:
+            process = subprocess.Popen(
+                launch_command(framework, port),
+                shell=True,
+                cwd=project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env={
+                    **os.environ,
+                    # CLI 플래그로 포트를 받지 않는 프레임워크용 (CRA, Dash, Gradio)
+                    "PORT": str(port),
+                    "GRADIO_SERVER_PORT": str(port),
+                    "BROWSER": "none",  # CRA가 브라우저 탭을 여는 것 방지
+                },
+                preexec_fn=os.setsid,  # 프로세스 그룹으로 관리
+            )
+        except Exception as e:
+            print(f"  ⚠️ 앱 실행 실패: {e}")
+            return None
+
+        # 파이프가 차서 앱이 멈추지 않도록 기동 직후부터 출력 drain
+        probe = framework.get("readiness", {})
+        server = AppServer(
+            key=key,
+            fingerprint=fingerprint,
+            framework=framework,
+            process=process,
+            port=port,
+            startup_seconds=0.0,
+            logs=LogDrainer(process, probe.get("ready_patterns", ())),
+        )
+
+        # 앱 응답 대기 (ready 로그 / TCP → HTTP health probe)
+        print(f"  ⏳ 앱 응답 대기 (최대 {probe.get('timeout', DEFAULT_PROBE['timeout']):.0f}초)...")
+        readiness = wait_until_ready(
+            "localhost", server.port, probe, process=process, ready_event=server.logs.ready
+        )
+
+        # 응답한 것이 우리 앱인지 확인 (setsid로 pid == pgid)
+        owned = listening_ports(process.pid) if process.poll() is None else None
+        error = readiness.error
+        if readiness.ready and owned is not None and port not in owned:
+            error = f"포트 {port}에 다른 프로세스가 응답 중"
+        elif not readiness.ready and owned:
+            error = f"{error} (앱은 포트 {', '.join(map(str, sorted(owned)))}에서 대기 중)"
+
+        if error:
+            self._terminate(server)
+            server.logs.join()  # 종료 직전 출력까지 수집
+            tail = server.logs.tail()
+            self._failure_logs[key] = tail
+            print(f"  ⚠️ 앱 실행 실패: {error}")
+            if tail:
+                print("\n".join(f"     │ {line}" for line in tail.splitlines()[-FAILURE_PRINT_LINES:]))
+            return None
+
+        server.startup_seconds = readiness.elapsed
+        signal_note = " — ready 로그 감지" if readiness.log_ready else ""
+        print(f"  ✅ 앱 실행 완료: {server.url} ({readiness.elapsed:.1f}초{signal_note})")
+        return server
+
+    def _serve_static(
+        self, key: str, fingerprint: str, framework: dict, project_path: str
+    ) -> tuple[Optional[AppServer], str]:
+        """
+        프로덕션 빌드(캐시)를 정적 서버로 서빙.
+        Returns: (서버, 빌드 결과 메모) — 실패하면 서버 None + 건너뛴 이유 (개발 서버로 fallback)
+        """
+        print(f"  📦 {framework['framework']} 프로덕션 빌드 준비 중...")
+        try:
+            build = self.build_cache.get_or_build(project_path, fingerprint)
+            site = StaticSiteServer(build.root, port=framework.get("port") or 0)
+        except (StaticBuildError, OSError) as e:
+            print(f"  ⚠️ 정적 빌드 건너뜀 → 개발 서버로 실행: {e}")
+            return None, f"건너뜀 → 개발 서버로 캡처 ({e})"
+
+        build_note = "빌드 캐시 사용" if build.cached else f"빌드 {build.elapsed:.1f}초"
+        print(f"  ✅ 정적 서버 실행 완료: {site.url} ({build_note})")
+        return AppServer(
+            key=key,
+            fingerprint=fingerprint,
+            framework=framework,
+            process=None,
+            port=site.port,
+            startup_seconds=build.elapsed,
+            static=site,
+            build_note=build_note,
+        ), build_note
+
+    @staticmethod
+    def _terminate(server: AppServer) -> None:
+        """앱 프로세스 그룹 종료 (SIGTERM → 5초 후 SIGKILL), 정적 서버는 shutdown"""
+        if server.static:
+            server.static.stop()
+            return
+
+        process = server.process
+        try:
+            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+            process.wait(timeout=5)
+        except (ProcessLookupError, subprocess.TimeoutExpired, OSError):
+            try:
+                os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+            except (ProcessLookupError, OSError):
+                pass
+
+    def _ensure_reaper(self) -> None:
+        """idle 서버를 주기적으로 정리하는 daemon 스레드 (최초 1회 시작)"""
+        if self._reaper and self._reaper.is_alive():
+            return
+        self._stop_event.clear()
+        self._reaper = threading.Thread(
+            target=self._reap_loop, name="app-supervisor-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = min(REAPER_INTERVAL, max(1.0, self.idle_ttl / 2))
+        while not self._stop_event.wait(interval):
+            self.reap_idle()
+
+
+def source_fingerprint(project_path: str, launch_cmd: str = "") -> str:
+    """
+    프로젝트 소스 상태 fingerprint — 파일 경로/크기/mtime과 실행 명령의 해시.
+    의존성/빌드 산출물 디렉토리와 문서 파일은 제외.
+    """
+    digest = hashlib.sha256(launch_cmd.encode())
+
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in FINGERPRINT_SKIP_DIRS)
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in FINGERPRINT_SKIP_SUFFIXES:
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, project_path)
+            digest.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+    return digest.hexdigest()
+
+
+def _stop_all_ref(ref: "weakref.ReferenceType[AppSupervisor]") -> None:
+    supervisor = ref()
+    if supervisor is not None:
+        supervisor.stop_all()
@@ -0,0 +1,260 @@
+"""
+Batch Capture
+=============
+여러 프로젝트의 auto_capture를 프로세스 풀에서 동시에 실행한다.
+
+- 작업 단위: (project_path, project_analysis, page_id)
+- 워커마다 자체 CaptureManager / 앱 프로세스 / 빈 포트(실행마다 자동 할당) (--save-screenshots면 작업 디렉토리도)
+- CLI의 --workspace-root를 주면 작업별 디렉토리를 그 아래에 만들고 종료 후에도 남김
+- Notion 요청 한도(초당 3회)는 토큰 단위 → 워커 수로 나눠 워커별 토큰 버킷에 배분
+- 끝나는 순서대로 프로젝트별 CaptureReport를 스트리밍
+- 마지막에 프로젝트별 소요 시간이 포함된 통합 요약 생성
+
+Usage:
+    jobs = [BatchJob("/path/to/project", {"name": "..."}, "page-id"), ...]
+    for result in iter_batch(notion_token, jobs, max_workers=4):
+        print(result.report.summary())
+
+CLI:
+    python batch.py jobs.json [--workers 4] [--token ntn_xxx] [--save-screenshots]
+                              [--workspace-root ./shots]
+
+    jobs.json: [{"project_path": str, "project_analysis": dict, "page_id": str,
+                 "jd_keywords": [str, ...]}, ...]
+"""
+
+if __name__ == "__main__" and not __package__:
+    # 디렉토리 이름에 하이픈이 있어 -m 실행이 불가 → 스크립트 실행 시 패키지로 등록
+    import importlib
+    import sys
+    from pathlib import Path as _Path
+
+    sys.path.insert(0, str(_Path(__file__).resolve().parent.parent))
+    __package__ = _Path(__file__).resolve().parent.name
+    importlib.import_module(__package__)
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from .capture_manager import CaptureManager, CaptureReport
+from .rate_limit import NOTION_BURST, NOTION_RATE_LIMIT, TokenBucket
+
+
+DEFAULT_BATCH_WORKERS = 4
+
+
+@dataclass
+class BatchJob:
+    """배치 캡처 작업 하나 (프로젝트 1개)"""
+    project_path: str
+    project_analysis: dict
+    page_id: str
+    jd_keywords: Optional[list[str]] = None
+    set_cover: bool = True
+
+    @property
+    def name(self) -> str:
+        return self.project_analysis.get("name") or os.path.basename(self.project_path)
+
+
+@dataclass
+class BatchJobResult:
+    """배치 작업 하나의 실행 결과"""
+    job: BatchJob
+    report: Optional[CaptureReport]
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.report is not None and self.error is None
+
+
+@dataclass
+class BatchSummary:
+    """배치 전체 결과 요약"""
+    results: list[BatchJobResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        captured = sum(r.report.success_count for r in self.results if r.report)
+        total = sum(r.report.total for r in self.results if r.report)
+        failed_jobs = sum(1 for r in self.results if not r.success)
+
+        lines = [
+            f"📦 배치 캡처 완료: 프로젝트 {len(self.results) - failed_jobs}/{len(self.results)}개, "
+            f"캡처 {captured}/{total}장 ({self.elapsed:.1f}초)"
+        ]
+        for r in sorted(self.results, key=lambda r: r.elapsed, reverse=True):
+            if r.success:
+                lines.append(
+                    f"  ✅ {r.job.name}: {r.report.success_count}/{r.report.total}장 ({r.elapsed:.1f}초)"
+                )
+            else:
+                lines.append(f"  ❌ {r.job.name}: ({r.elapsed:.1f}초)")
+                lines.append(f"     └ {r.error}")
+        return "\n".join(lines)
+
+
+def iter_batch(
+    notion_token: str,
+    jobs: list[BatchJob],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    workspace_root: Optional[str] = None,
+    use_tmpfs: bool = False,
+    save_screenshots: bool = False,
+    static_build: bool = False,
+    keep_screenshots: bool = False,
+) -> Iterator[BatchJobResult]:
+    """
+    작업들을 프로세스 풀에서 실행하고 끝나는 순서대로 결과를 yield.
+
+    Args:
+        notion_token: Notion Integration 토큰
+        jobs: 배치 작업 리스트
+        max_workers: 동시에 실행할 프로젝트 수
+        workspace_root: 작업별 스크린샷 작업 디렉토리를 만들 상위 경로
+        use_tmpfs: workspace_root 미지정 시 /dev/shm(tmpfs) 사용
+        save_screenshots: 스크린샷을 파일로도 저장 (기본은 메모리에서 바로 업로드)
+        static_build: React/Vite 앱을 캐시된 프로덕션 빌드로 캡처
+        keep_screenshots: 작업 종료 후에도 스크린샷 파일 유지 (save_screenshots 포함)
+    """
+    # 동시에 도는 워커 수만큼 한도를 나눠, 전체 요청 속도가 토큰 한도를 넘지 않게 함
+    workers = max(1, min(max_workers, len(jobs)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _run_job,
+                notion_token,
+                job,
+                workers,
+                workspace_root,
+                use_tmpfs,
+                save_screenshots,
+                static_build,
+                keep_screenshots,
+            ): job
+            for job in jobs
+        }
+
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # 워커 프로세스 자체가 죽은 경우 (BrokenProcessPool 등)
+                yield BatchJobResult(job=futures[future], report=None, elapsed=0.0, error=str(e))
+
+
+def run_batch(
+    notion_token: str,
+    jobs: list[BatchJob],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    workspace_root: Optional[str] = None,
+    use_tmpfs: bool = False,
+    save_screenshots: bool = False,
+    static_build: bool = False,
+    keep_screenshots: bool = False,
+) -> BatchSummary:
+    """iter_batch를 끝까지 실행하며 프로젝트별 결과를 출력하고 통합 요약 반환"""
+    start = time.monotonic()
+    summary = BatchSummary()
+
+    for result in iter_batch(
+        notion_token,
+        jobs,
+        max_workers,
+        workspace_root,
+        use_tmpfs,
+        save_screenshots,
+        static_build,
+        keep_screenshots,
+    ):
+        summary.results.append(result)
+        icon = "✅" if result.success else "❌"
+        print(f"{icon} [{len(summary.results)}/{len(jobs)}] {result.job.name} ({result.elapsed:.1f}초)")
+
+    summary.elapsed = time.monotonic() - start
+    print()
+    print(summary.summary())
+    return summary
+
+
+def _run_job(
+    notion_token: str,
+    job: BatchJob,
+    workers: int,
+    workspace_root: Optional[str],
+    use_tmpfs: bool,
+    save_screenshots: bool,
+    static_build: bool,
+    keep_screenshots: bool,
+) -> BatchJobResult:
+    """워커 프로세스에서 실행되는 단일 프로젝트 캡처 (Notion 요청 한도의 1/workers 사용)"""
+    start = time.monotonic()
+    try:
+        with CaptureManager(
+            notion_token,
+            rate_limiter=TokenBucket(
+                rate=NOTION_RATE_LIMIT / workers,
+                capacity=max(1, NOTION_BURST // workers),
+            ),
+            workspace_root=workspace_root,
+            use_tmpfs=use_tmpfs,
+            save_screenshots=save_screenshots,
+            keep_screenshots=keep_screenshots,
+            static_build=static_build,
+        ) as manager:
+            report = manager.auto_capture(
+                project_path=job.project_path,
+                project_analysis=job.project_analysis,
+                page_id=job.page_id,
+                jd_keywords=job.jd_keywords,
+                set_cover=job.set_cover,
+            )
+        return BatchJobResult(job=job, report=report, elapsed=time.monotonic() - start)
+    except Exception as e:
+        return BatchJobResult(job=job, report=None, elapsed=time.monotonic() - start, error=str(e))
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="여러 프로젝트 스크린샷 일괄 캡처 & Notion 업로드")
+    parser.add_argument("jobs_file", help="작업 목록 JSON 파일")
+    parser.add_argument("--workers", type=int, default=DEFAULT_BATCH_WORKERS, help="동시 실행 프로젝트 수")
+    parser.add_argument("--token", default=os.environ.get("NOTION_TOKEN"), help="Notion 토큰 (기본: $NOTION_TOKEN)")
+    parser.add_argument(
+        "--workspace-root",
+        help="작업별 스크린샷 디렉토리를 만들 상위 경로 — 지정하면 스크린샷을 저장하고 종료 후에도 유지",
+    )
+    parser.add_argument("--tmpfs", action="store_true", help="스크린샷 저장 시 /dev/shm 사용")
+    parser.add_argument("--save-screenshots", action="store_true", help="스크린샷을 파일로도 저장 (디버그용)")
+    parser.add_argument("--static-build", action="store_true", help="React/Vite 앱을 프로덕션 빌드로 캡처")
+    args = parser.parse_args()
+
+    if not args.token:
+        print("❌ Notion 토큰이 필요합니다 (--token 또는 NOTION_TOKEN)")
+        sys.exit(1)
+
+    with open(args.jobs_file, encoding="utf-8") as f:
+        batch_jobs = [BatchJob(**spec) for spec in json.load(f)]
+
+    result = run_batch(
+        args.token,
+        batch_jobs,
+        max_workers=args.workers,
+        workspace_root=args.workspace_root,
+        use_tmpfs=args.tmpfs,
+        save_screenshots=args.save_screenshots,
+        static_build=args.static_build,
+        keep_screenshots=args.workspace_root is not None,
+    )
+    sys.exit(0 if all(r.success for r in result.results) else 1)
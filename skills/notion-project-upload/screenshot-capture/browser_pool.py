@@ -0,0 +1,160 @@
+"""
+Browser Pool
+============
+한 번의 캡처 실행 동안 Chromium을 한 번만 띄우고,
+CaptureItem마다 격리된 BrowserContext/Page를 빌려주는 풀.
+
+- 브라우저는 첫 acquire() 시점에 지연 실행
+- 컨텍스트는 viewport별로 재사용 (idle timeout / max uses 초과 시 폐기)
+- close()로 컨텍스트 → 브라우저 → Playwright 순서로 정리
+- Playwright async API 기반 — 여러 캡처가 동시에 Page를 빌릴 수 있음
+
+Usage:
+    pool = BrowserPool()
+    async with pool.page(viewport=(1280, 720)) as page:
+        await page.goto("http://localhost:8501")
+        await page.screenshot(path="main.png")
+    await pool.close()
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+DEFAULT_IDLE_TIMEOUT = 60.0  # 초 — 이 시간 이상 놀고 있던 컨텍스트는 폐기
+DEFAULT_MAX_USES = 10        # 컨텍스트 하나로 처리할 최대 캡처 수
+
+
+@dataclass
+class _PooledContext:
+    """풀에 보관된 BrowserContext와 사용 이력"""
+    context: Any
+    viewport: tuple
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class BrowserPool:
+    """CaptureManager가 소유하는 Chromium 브라우저 풀"""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_uses: int = DEFAULT_MAX_USES,
+    ):
+        self.headless = headless
+        self.idle_timeout = idle_timeout
+        self.max_uses = max_uses
+
+        self._playwright = None
+        self._browser = None
+        self._idle: list[_PooledContext] = []
+        self._launch_lock: Optional[asyncio.Lock] = None
+
+    # ─────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────
+    @asynccontextmanager
+    async def page(self, viewport: tuple = (1280, 720)):
+        """
+        viewport에 맞는 컨텍스트에서 새 Page를 열어 빌려준다.
+        블록을 벗어나면 Page는 닫히고 컨텍스트는 풀로 반환된다.
+        """
+        pooled = await self._acquire_context(viewport)
+        try:
+            page = await pooled.context.new_page()
+        except Exception:
+            await self._close_context(pooled)
+            raise
+
+        try:
+            yield page
+        finally:
+            try:
+                await page.close()
+            except Exception:
+                pass
+            await self._release_context(pooled)
+
+    async def close(self) -> None:
+        """모든 컨텍스트와 브라우저, Playwright 드라이버 종료"""
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_context(pooled)
+
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None
+
+    # ─────────────────────────────────────────────
+    # 컨텍스트 관리
+    # ─────────────────────────────────────────────
+    async def _ensure_browser(self):
+        """Chromium을 최초 1회만 실행 (동시 acquire 시에도 1회)"""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+
+        async with self._launch_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self._browser
+
+    async def _acquire_context(self, viewport: tuple) -> _PooledContext:
+        await self._evict_expired()
+
+        for pooled in self._idle:
+            if pooled.viewport == tuple(viewport):
+                self._idle.remove(pooled)
+                return pooled
+
+        browser = await self._ensure_browser()
+        context = await browser.new_context(viewport={
+            "width": viewport[0],
+            "height": viewport[1],
+        })
+        return _PooledContext(context=context, viewport=tuple(viewport))
+
+    async def _release_context(self, pooled: _PooledContext) -> None:
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+
+        if pooled.uses >= self.max_uses:
+            await self._close_context(pooled)
+        else:
+            self._idle.append(pooled)
+
+    async def _evict_expired(self) -> None:
+        """idle timeout을 넘긴 컨텍스트 정리"""
+        now = time.monotonic()
+        expired = [p for p in self._idle if now - p.last_used > self.idle_timeout]
+        for pooled in expired:
+            self._idle.remove(pooled)
+            await self._close_context(pooled)
+
+    @staticmethod
+    async def _close_context(pooled: _PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
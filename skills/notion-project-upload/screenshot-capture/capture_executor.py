@@ -0,0 +1,340 @@
+"""
+Capture Executor
+================
+웹 캡처(VIEWPORT / FULL_PAGE / ELEMENT)를 Playwright async API로
+동시에 실행하는 asyncio 기반 실행기.
+
+- 같은 (URL, viewport) 항목은 한 Page에서 한 번만 로딩 후 연속 촬영 (capture_planner)
+- 서로 다른 그룹은 별도 Page로 병렬 캡처, asyncio.Semaphore로 동시 실행 수 제한
+- 로딩/촬영 단계별 타임아웃 (초과 시 실패 CaptureResult)
+- 항목별 촬영 시간(elapsed)과 그룹 공유 로딩 시간(load_seconds) 기록
+- ELEMENT 셀렉터 후보는 한 번의 page.evaluate_handle로 "첫 번째 보이는 요소"를 찾고
+  ElementHandle.screenshot (내부 스크롤 컨테이너 안 요소도 스크롤해 촬영),
+  프레임워크별로 매칭된 셀렉터를 SelectorCache에 기억
+- NetworkFilter가 주어지면 analytics / 외부 리소스 요청을 막아 networkidle 대기 단축
+- 고정 대기 대신 화면 안정화(DOM 변경·애니메이션·busy 표시)까지만 대기,
+  대기 상한은 wait_seconds(기본 3초) 또는 프레임워크 stability.timeout
+- 결과는 입력 순서(= 전략 순서) 그대로 반환
+- 스크린샷은 page.screenshot() 바이트로 CaptureResult.data에 담아 전달,
+  workspace가 주어질 때만 파일로도 저장 (디버그용)
+
+Usage:
+    pool = BrowserPool()
+    executor = AsyncCaptureExecutor(pool, max_concurrency=3, item_timeout=60)
+    results = await executor.run(web_items)              # 메모리로만
+    with CaptureWorkspace(keep=True) as workspace:
+        results = await executor.run(web_items, workspace)  # 파일로도 저장
+    await pool.close()
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from .browser_pool import BrowserPool
+from .capture_planner import CaptureGroup, plan_captures
+from .network_profile import NetworkFilter
+from .selector_cache import SelectorCache
+from .stability import StabilityProfile, install_stability_probe, wait_for_stable
+from .strategies import CaptureItem, CaptureMethod
+from .workspace import CaptureWorkspace
+
+
+WEB_CAPTURE_METHODS = (CaptureMethod.VIEWPORT, CaptureMethod.FULL_PAGE, CaptureMethod.ELEMENT)
+
+DEFAULT_MAX_CONCURRENCY = 3
+DEFAULT_ITEM_TIMEOUT = 60.0  # 초 — 그룹 페이지 로딩(+대기), 항목별 촬영에 각각 적용
+
+# 후보 셀렉터 중 처음으로 "보이는" 요소를 한 번의 evaluate_handle로 찾는다 ({selector, element},
+# 없으면 빈 객체). 좌표 대신 요소 자체를 돌려줘야 Streamlit의 스크롤되는 main section 같은
+# 내부 스크롤 컨테이너 안 요소도 정확히 촬영된다.
+# 잘못된 셀렉터는 querySelectorAll 예외를 페이지 안에서 삼키고 다음 후보로 넘어간다.
+RESOLVE_SELECTOR_JS = """
+(selectors) => {
+  for (const selector of selectors) {
+    let elements;
+    try {
+      elements = document.querySelectorAll(selector);
+    } catch (e) {
+      continue;
+    }
+    for (const el of elements) {
+      const style = window.getComputedStyle(el);
+      if (style.visibility === "hidden" || style.display === "none") continue;
+      const rect = el.getBoundingClientRect();
+      if (rect.width > 0 && rect.height > 0) {
+        return { selector, element: el };
+      }
+    }
+  }
+  return {};
+}
+"""
+
+# 스크롤을 첫 화면으로 되돌린다. 요소 촬영은 요소를 감싼 내부 스크롤 컨테이너까지 스크롤하므로,
+# 그 요소(el)의 조상 중 스크롤된 것과 문서 스크롤을 모두 0으로 (el이 null이면 문서만).
+RESET_SCROLL_JS = """
+(el) => {
+  for (let node = el ? el.parentElement : null; node; node = node.parentElement) {
+    if (node.scrollTop || node.scrollLeft) node.scrollTo(0, 0);
+  }
+  (document.scrollingElement || document.documentElement).scrollTo(0, 0);
+  window.scrollTo(0, 0);
+}
+"""
+
+
+@dataclass
+class CaptureResult:
+    """개별 캡처 결과"""
+    name: str
+    path: str
+    caption: str
+    capture_type: str
+    success: bool
+    file_upload_id: Optional[str] = None
+    error: Optional[str] = None
+    data: Optional[bytes] = field(default=None, repr=False)  # 메모리 이미지 (PNG / WebP)
+    elapsed: Optional[float] = None       # 이 항목의 촬영(렌더링) 시간 (초)
+    load_seconds: Optional[float] = None  # 그룹이 공유한 페이지 로딩 + 대기 시간 (초)
+    log_tail: Optional[str] = field(default=None, repr=False)  # 실패 시 앱 서버 로그 tail
+
+    @property
+    def has_image(self) -> bool:
+        """업로드할 이미지(메모리 또는 파일)가 있는지"""
+        return bool(self.data) or (bool(self.path) and os.path.exists(self.path))
+
+
+def failed_result(item: CaptureItem, error: str) -> CaptureResult:
+    """실패한 캡처 항목의 CaptureResult 생성"""
+    return CaptureResult(
+        name=item.name, path="", caption=item.caption_template,
+        capture_type=item.capture_type.value, success=False,
+        error=error,
+    )
+
+
+class AsyncCaptureExecutor:
+    """웹 캡처 항목을 동시 실행하는 asyncio 실행기"""
+
+    def __init__(
+        self,
+        browser_pool: BrowserPool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        item_timeout: float = DEFAULT_ITEM_TIMEOUT,
+        selector_cache: Optional[SelectorCache] = None,
+    ):
+        """
+        Args:
+            browser_pool: 페이지를 빌려줄 브라우저 풀
+            max_concurrency: 동시에 처리할 그룹(페이지) 수
+            item_timeout: 페이지 로딩 / 항목별 촬영 타임아웃 (초)
+            selector_cache: ELEMENT 캡처의 프레임워크별 매칭 셀렉터 캐시 (None이면 미사용)
+        """
+        self.browser_pool = browser_pool
+        self.max_concurrency = max(1, max_concurrency)
+        self.item_timeout = item_timeout
+        self.selector_cache = selector_cache
+
+    async def run(
+        self,
+        items: list[CaptureItem],
+        workspace: Optional[CaptureWorkspace] = None,
+        on_result: Optional[Callable[[int, CaptureResult], None]] = None,
+        framework: Optional[str] = None,
+        network: Optional[NetworkFilter] = None,
+        stability: Optional[StabilityProfile] = None,
+    ) -> list[CaptureResult]:
+        """
+        웹 캡처 항목들을 (URL, viewport) 그룹 단위로 동시에 실행.
+        그룹마다 페이지를 한 번만 로딩하고 그 페이지에서 모든 스크린샷을 찍는다.
+
+        Args:
+            items: 웹 캡처 항목 (VIEWPORT / FULL_PAGE / ELEMENT)
+            workspace: 스크린샷을 파일로도 저장할 작업 디렉토리 (None이면 메모리로만)
+            on_result: 항목 하나가 끝날 때마다 (items 내 index, 결과)로 호출 — 워커 스레드에서
+                실행되므로 블록돼도(업로드 큐 backpressure) 이벤트 루프는 멈추지 않는다
+            framework: 캡처 대상 앱의 프레임워크 이름 (셀렉터 캐시 키)
+            network: 페이지마다 적용할 요청 차단 필터 (None이면 모든 요청 허용)
+            stability: 화면 안정화 판단 설정 (None이면 프레임워크 무관 기본값)
+
+        Returns:
+            items와 같은 순서의 CaptureResult 리스트
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: list[Optional[CaptureResult]] = [None] * len(items)
+
+        async def finish(index: int, result: CaptureResult) -> None:
+            results[index] = result
+            if on_result:
+                # 이 그룹만 기다리고 다른 페이지의 대기/촬영은 계속 진행
+                await asyncio.to_thread(on_result, index, result)
+
+        async def bounded(group: CaptureGroup) -> None:
+            async with semaphore:
+                await self._run_group(group, workspace, finish, framework, network, stability)
+
+        await asyncio.gather(*(bounded(group) for group in plan_captures(items)))
+        return results
+
+    async def capture(
+        self,
+        item: CaptureItem,
+        output_path: Optional[str] = None,
+        framework: Optional[str] = None,
+        network: Optional[NetworkFilter] = None,
+        stability: Optional[StabilityProfile] = None,
+    ) -> CaptureResult:
+        """단일 웹 캡처 항목 실행 (output_path가 있으면 파일로도 저장)"""
+        if item.method not in WEB_CAPTURE_METHODS:
+            return failed_result(item, f"미지원 캡처 방식: {item.method}")
+        if not item.url:
+            return failed_result(item, "웹앱 URL이 설정되지 않음")
+
+        async with self.browser_pool.page(item.viewport) as page:
+            if network:
+                await network.attach(page, item.url)
+            await self._load(page, item.url, item.wait_seconds, stability)
+            return await self._shoot(page, item, output_path, framework)
+
+    # ─────────────────────────────────────────────
+    # 그룹 실행: 한 번 로딩 → 여러 장 촬영
+    # ─────────────────────────────────────────────
+    async def _run_group(
+        self,
+        group: CaptureGroup,
+        workspace: Optional[CaptureWorkspace],
+        finish: Callable[[int, CaptureResult], Awaitable[None]],
+        framework: Optional[str] = None,
+        network: Optional[NetworkFilter] = None,
+        stability: Optional[StabilityProfile] = None,
+    ) -> None:
+        """그룹의 URL로 한 번 이동/대기한 뒤 항목별 스크린샷 (항목별 타임아웃)"""
+        pending = dict(group.items)
+        print(f"  📷 캡처 중: {', '.join(item.description for item in pending.values())}...")
+
+        async def fail_pending(error: str) -> None:
+            for index, item in list(pending.items()):
+                await finish(index, failed_result(item, error))
+            pending.clear()
+
+        if not group.url:
+            await fail_pending("웹앱 URL이 설정되지 않음")
+            return
+
+        try:
+            async with self.browser_pool.page(group.viewport) as page:
+                if network:
+                    await network.attach(page, group.url)
+                start = time.monotonic()
+                try:
+                    await asyncio.wait_for(
+                        self._load(page, group.url, group.wait_seconds, stability),
+                        timeout=self.item_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    await fail_pending(f"페이지 로딩 타임아웃 ({self.item_timeout:.0f}초 초과)")
+                    return
+                load_seconds = time.monotonic() - start
+
+                for index, item in group.items:
+                    output_path = workspace.path_for(item.name) if workspace else None
+                    shot_start = time.monotonic()
+                    try:
+                        result = await asyncio.wait_for(
+                            self._shoot(page, item, output_path, framework),
+                            timeout=self.item_timeout,
+                        )
+                    except asyncio.TimeoutError:
+                        result = failed_result(item, f"캡처 타임아웃 ({self.item_timeout:.0f}초 초과)")
+                    except Exception as e:
+                        result = failed_result(item, f"웹 캡처 실패: {e}")
+
+                    result.elapsed = time.monotonic() - shot_start
+                    result.load_seconds = load_seconds
+                    del pending[index]
+                    await finish(index, result)
+
+        except Exception as e:
+            # 브라우저/페이지 준비 또는 로딩 실패 → 남은 항목 모두 실패
+            await fail_pending(f"웹 캡처 실패: {e}")
+
+    async def _load(
+        self,
+        page,
+        url: str,
+        wait_seconds: float,
+        stability: Optional[StabilityProfile] = None,
+    ) -> None:
+        """페이지 이동 + 동적 렌더링이 안정될 때까지 대기 (wait_seconds는 상한)"""
+        await install_stability_probe(page)
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+        await wait_for_stable(page, wait_seconds, stability)
+
+    async def _shoot(
+        self,
+        page,
+        item: CaptureItem,
+        output_path: Optional[str],
+        framework: Optional[str] = None,
+    ) -> CaptureResult:
+        """이미 로드된 페이지에서 항목 하나 촬영"""
+        if item.method == CaptureMethod.ELEMENT:
+            data = await self._shoot_element(page, item, output_path, framework)
+        elif item.method in (CaptureMethod.VIEWPORT, CaptureMethod.FULL_PAGE):
+            full_page = item.method == CaptureMethod.FULL_PAGE
+            if not full_page:
+                # 앞선 촬영으로 스크롤됐을 수 있으므로 첫 화면으로 복귀
+                await page.evaluate(RESET_SCROLL_JS, None)
+            data = await page.screenshot(path=output_path, full_page=full_page)
+        else:
+            return failed_result(item, f"미지원 캡처 방식: {item.method}")
+
+        return CaptureResult(
+            name=item.name,
+            path=output_path or "",
+            caption=item.caption_template,
+            capture_type=item.capture_type.value,
+            success=True,
+            data=data,
+        )
+
+    # ─────────────────────────────────────────────
+    # 캡처 방식별 구현
+    # ─────────────────────────────────────────────
+    async def _shoot_element(
+        self,
+        page,
+        item: CaptureItem,
+        output_path: Optional[str],
+        framework: Optional[str] = None,
+    ) -> bytes:
+        """특정 DOM 요소 캡처 (찾지 못하면 viewport 캡처로 폴백)"""
+        selectors = [s.strip() for s in (item.selector or "").split(",") if s.strip()]
+        if self.selector_cache:
+            # 이 프레임워크에서 지난번에 매칭된 셀렉터부터 시도
+            selectors = self.selector_cache.order(framework, selectors)
+
+        if selectors:
+            match = await page.evaluate_handle(RESOLVE_SELECTOR_JS, selectors)
+            try:
+                element = (await match.get_property("element")).as_element()
+                if element:
+                    if self.selector_cache:
+                        selector = await (await match.get_property("selector")).json_value()
+                        # 디스크 읽기/쓰기는 이벤트 루프 밖에서 (다른 항목 캡처를 막지 않도록)
+                        await asyncio.to_thread(self.selector_cache.record, framework, selector)
+                    # 요소를 (내부 스크롤 컨테이너 포함) 화면 안으로 스크롤한 뒤 요소 영역만 촬영,
+                    # 끝나면 스크롤된 컨테이너를 되돌려 같은 페이지의 다음 촬영이 첫 화면에서 시작
+                    try:
+                        return await element.screenshot(path=output_path)
+                    finally:
+                        await element.evaluate(RESET_SCROLL_JS)
+            finally:
+                await match.dispose()
+
+        # 요소를 찾지 못하면 viewport 캡처로 폴백
+        await page.evaluate(RESET_SCROLL_JS, None)
+        return await page.screenshot(path=output_path, full_page=False)
@@ -25,13 +25,12 @@ Usage:
     )
 """
 
-import os
-import signal
-import subprocess
+import asyncio
+import contextlib
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from .strategies import (
     CaptureItem,
@@ -42,23 +41,30 @@ from .strategies import (
     determine_capture_strategy,
     format_capture_plan_preview,
 )
+from .app_supervisor import DEFAULT_IDLE_TTL, AppServer, AppSupervisor
+from .browser_pool import BrowserPool
+from .capture_executor import (
+    DEFAULT_ITEM_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    WEB_CAPTURE_METHODS,
+    AsyncCaptureExecutor,
+    CaptureResult,
+)
+from .network_profile import NetworkFilter, NetworkProfile, NetworkStats
+from .render_cache import DEFAULT_RENDER_CACHE_DIR, RenderCache, RenderCacheStats
+from .selector_cache import DEFAULT_SELECTOR_CACHE_PATH, SelectorCache
+from .static_build import DEFAULT_BUILD_CACHE_DIR, BuildCache
+from .stability import StabilityProfile
+from .image_encoding import ImageEncoder
 from .terminal_renderer import TerminalRenderer
+from .upload_pipeline import DEFAULT_QUEUE_SIZE, UploadPipeline, upload_capture
+from .workspace import CaptureWorkspace
 from .notion_file_upload import NotionFileUploader, NotionUploadError, FileValidationError
+from .rate_limit import TokenBucket
+from .upload_cache import DEFAULT_CACHE_PATH, open_upload_cache
 
 
-SCREENSHOT_DIR = "/tmp/screenshots"
-
-
-@dataclass
-class CaptureResult:
-    """개별 캡처 결과"""
-    name: str
-    path: str
-    caption: str
-    capture_type: str
-    success: bool
-    file_upload_id: Optional[str] = None
-    error: Optional[str] = None
+SUMMARY_LOG_LINES = 10  # 리포트에 보여줄 앱 로그 tail 줄 수
 
 
 @dataclass
@@ -69,6 +75,11 @@ class CaptureReport:
     total: int = 0
     success_count: int = 0
     failed_count: int = 0
+    app_startup_seconds: Optional[float] = None  # 웹앱 기동 측정 시간
+    app_reused: bool = False                     # warm 앱 서버 재사용 여부
+    network: Optional[NetworkStats] = None       # 캡처 브라우저 요청 허용/차단 집계
+    render_cache: Optional[RenderCacheStats] = None  # 이번 실행의 터미널 렌더 캐시 집계
+    static_build: Optional[str] = None           # 정적 빌드 결과 또는 건너뛴 이유 (static_build 사용 시)
 
     def __post_init__(self):
         self.total = len(self.results)
@@ -77,21 +88,129 @@ class CaptureReport:
 
     def summary(self) -> str:
         lines = [f"📸 캡처 완료: {self.success_count}/{self.total}장"]
+        if self.app_reused:
+            lines.append("  🚀 앱 기동: warm 서버 재사용")
+        elif self.app_startup_seconds is not None:
+            lines.append(f"  🚀 앱 기동: {self.app_startup_seconds:.1f}초")
+        if self.static_build:
+            lines.append(f"  📦 정적 빌드: {self.static_build}")
+        if self.network is not None:
+            lines.append(f"  🛡 네트워크: {self.network.summary()}")
+        if self.render_cache is not None and self.render_cache.hits + self.render_cache.misses:
+            lines.append(f"  🖼 터미널 렌더 캐시: {self.render_cache.summary()}")
         for r in self.results:
             icon = "✅" if r.success else "❌"
-            lines.append(f"  {icon} {r.caption}")
+            lines.append(f"  {icon} {r.caption}{self._format_timing(r)}")
             if r.error:
                 lines.append(f"     └ {r.error}")
+
+        # 실패한 웹 캡처들은 같은 앱 로그를 공유 → 한 번만 표시
+        log_tail = next((r.log_tail for r in self.results if r.log_tail), None)
+        if log_tail:
+            lines.append("  📜 앱 로그 (최근):")
+            lines.extend(f"     │ {line}" for line in log_tail.splitlines()[-SUMMARY_LOG_LINES:])
         return "\n".join(lines)
 
+    @staticmethod
+    def _format_timing(result: CaptureResult) -> str:
+        """항목별 소요 시간 — 웹 캡처는 그룹이 공유한 페이지 로딩 시간 함께 표시"""
+        if result.elapsed is None:
+            return ""
+        if result.load_seconds is None:
+            return f" ({result.elapsed:.1f}초)"
+        return f" (촬영 {result.elapsed:.1f}초 / 공유 로딩 {result.load_seconds:.1f}초)"
+
 
 class CaptureManager:
     """스마트 스크린샷 캡처 오케스트레이터"""
 
-    def __init__(self, notion_token: str):
-        self.uploader = NotionFileUploader(notion_token)
-        self.renderer = TerminalRenderer()
-        self._app_process = None
+    def __init__(
+        self,
+        notion_token: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        item_timeout: float = DEFAULT_ITEM_TIMEOUT,
+        upload_queue_size: int = DEFAULT_QUEUE_SIZE,
+        app_port: Optional[int] = None,
+        workspace_root: Optional[str] = None,
+        use_tmpfs: bool = False,
+        keep_screenshots: bool = False,
+        save_screenshots: bool = False,
+        upload_cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+        selector_cache_path: Optional[str] = DEFAULT_SELECTOR_CACHE_PATH,
+        block_requests: bool = True,
+        network_profile: Optional[NetworkProfile] = None,
+        app_idle_ttl: float = DEFAULT_IDLE_TTL,
+        app_supervisor: Optional[AppSupervisor] = None,
+        static_build: bool = False,
+        build_cache_dir: str = DEFAULT_BUILD_CACHE_DIR,
+        terminal_encoder: Optional[ImageEncoder] = None,
+        render_cache_dir: Optional[str] = DEFAULT_RENDER_CACHE_DIR,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        """
+        Args:
+            notion_token: Notion Integration 토큰
+            max_concurrency: 동시에 실행할 웹 캡처 수 (1이면 순차 실행)
+            item_timeout: 웹 캡처 항목별 타임아웃 (초)
+            upload_queue_size: 캡처 → 업로드 파이프라인 큐 크기
+            app_port: 웹앱 고정 포트 (None이면 실행마다 빈 포트 할당)
+            workspace_root: 실행별 스크린샷 디렉토리를 만들 상위 경로
+            use_tmpfs: workspace_root 미지정 시 /dev/shm(tmpfs)에 스크린샷 저장
+            keep_screenshots: 실행 종료 후에도 스크린샷 파일 유지 (save_screenshots 포함)
+            save_screenshots: 스크린샷을 파일로도 저장 (디버그용 — 기본은 메모리에서
+                바로 업로드해 파일시스템을 쓰지 않음)
+            upload_cache_path: 업로드 캐시(SQLite) 경로 (None이면 캐시 미사용,
+                열 수 없으면 경고 후 캐시 없이 진행)
+            selector_cache_path: 프레임워크별 매칭 셀렉터 캐시(JSON) 경로 (None이면 미사용)
+            block_requests: 캡처 브라우저에서 analytics / 외부 리소스 요청 차단
+            network_profile: 요청 차단 설정 (None이면 감지된 프레임워크 기본값)
+            app_idle_ttl: 캡처 후 앱 서버를 살려 둘 시간 (초, 0이면 매번 종료)
+            app_supervisor: 여러 CaptureManager가 공유할 앱 서버 레지스트리
+                (None이면 전용 supervisor를 만들고 close() 시 서버 종료)
+            static_build: React/Vite 앱을 개발 서버 대신 프로덕션 빌드로 캡처
+                (빌드 결과는 lockfile + 소스 해시로 캐시, 정적 서버로 서빙)
+            build_cache_dir: 프로덕션 빌드 캐시 디렉토리
+            terminal_encoder: 터미널 캡처 이미지 인코더 (None이면 팔레트 PNG —
+                lossless WebP / compress_level 지정 가능)
+            render_cache_dir: 터미널 이미지 렌더 캐시 디렉토리 (None이면 캐시 미사용)
+            rate_limiter: Notion 요청 속도 제한 토큰 버킷 (None이면 초당 3회 — 여러 프로세스가
+                같은 토큰을 쓰면 한도를 나눈 버킷을 전달)
+        """
+        self.upload_queue_size = upload_queue_size
+        self.app_port = app_port
+        self.workspace_root = workspace_root
+        self.use_tmpfs = use_tmpfs
+        self.keep_screenshots = keep_screenshots
+        self.save_screenshots = save_screenshots or keep_screenshots
+        self.block_requests = block_requests
+        self.network_profile = network_profile
+        self.workspace: Optional[CaptureWorkspace] = None
+        self.uploader = NotionFileUploader(
+            notion_token,
+            cache=open_upload_cache(upload_cache_path) if upload_cache_path else None,
+            rate_limiter=rate_limiter,
+        )
+        self.renderer = TerminalRenderer(
+            encoder=terminal_encoder,
+            cache=RenderCache(render_cache_dir) if render_cache_dir else None,
+        )
+        self.browser_pool = BrowserPool()
+        self.executor = AsyncCaptureExecutor(
+            self.browser_pool,
+            max_concurrency=max_concurrency,
+            item_timeout=item_timeout,
+            selector_cache=SelectorCache(selector_cache_path) if selector_cache_path else None,
+        )
+        self._owns_supervisor = app_supervisor is None
+        self.supervisor = app_supervisor or AppSupervisor(
+            idle_ttl=app_idle_ttl,
+            build_cache=BuildCache(build_cache_dir) if static_build else None,
+        )
+        self._app: Optional[AppServer] = None
+        self._app_reused = False
+        self._app_startup_seconds: Optional[float] = None
+        self._app_build_note: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     # ─────────────────────────────────────────────
     # 메인 API: 자동 캡처
@@ -103,6 +222,7 @@ class CaptureManager:
         page_id: str,
         jd_keywords: list[str] = None,
         set_cover: bool = True,
+        section_title: Optional[str] = None,
     ) -> CaptureReport:
         """
         프로젝트를 분석하여 자동으로 스크린샷을 캡처하고 Notion에 업로드.
@@ -114,58 +234,86 @@ class CaptureManager:
             page_id: Notion 페이지 ID (이미 생성된 페이지)
             jd_keywords: JD 키워드 (있으면 우선순위 조정)
             set_cover: 메인 스크린샷을 페이지 커버로 설정할지
+            section_title: 있으면 스크린샷 앞에 섹션 헤딩과 구분선 추가
 
         Returns:
             CaptureReport: 캡처 결과 리포트
         """
-        # 스크린샷 디렉토리 초기화
-        self._prepare_screenshot_dir()
-
-        # 1. 캡처 전략 결정
-        strategy = determine_capture_strategy(
-            project_name=project_analysis.get("name", "Project"),
-            project_description=project_analysis.get("problem", "")
-                + " " + project_analysis.get("solution", ""),
-            tech_stack=project_analysis.get("tech_stack", []),
-            impact=project_analysis.get("impact", ""),
-            project_type=project_analysis.get("type", ""),
-            jd_keywords=jd_keywords,
-        )
+        # save_screenshots면 이번 실행 전용 스크린샷 디렉토리 (종료 시 자동 정리)
+        with self._prepare_workspace():
+            # 1. 캡처 전략 결정
+            strategy = determine_capture_strategy(
+                project_name=project_analysis.get("name", "Project"),
+                project_description=project_analysis.get("problem", "")
+                    + " " + project_analysis.get("solution", ""),
+                tech_stack=project_analysis.get("tech_stack", []),
+                impact=project_analysis.get("impact", ""),
+                project_type=project_analysis.get("type", ""),
+                jd_keywords=jd_keywords,
+            )
+
+            # 2. 프리뷰 출력
+            print(format_capture_plan_preview(strategy))
+            print()
+
+            # 3. 프레임워크 감지 & 앱 실행
+            framework = detect_framework(project_path, port=self.app_port)
+            app_url = None
+            self._app_startup_seconds = None
+            self._app_reused = False
+            self._app_build_note = None
+            if framework:
+                app_url = self._launch_app(framework, project_path)
+                if app_url:
+                    # 웹앱 캡처 항목에 URL 설정
+                    for item in strategy.items:
+                        if item.method in WEB_CAPTURE_METHODS:
+                            item.url = app_url
+
+            # 4. 캡처 실행 (성공한 캡처는 즉시 업로드 파이프라인으로)
+            network = None
+            if self.block_requests:
+                network = NetworkFilter(self.network_profile or NetworkProfile.from_framework(framework))
+            render_cache_start = replace(self.renderer.cache.stats) if self.renderer.cache else None
+            pipeline = UploadPipeline(self.uploader, queue_size=self.upload_queue_size).start()
+            try:
+                results = self._execute_captures(
+                    strategy,
+                    project_path,
+                    project_analysis,
+                    on_result=pipeline.submit,
+                    framework=framework["framework"] if framework else None,
+                    network=network,
+                    stability=StabilityProfile.from_framework(framework),
+                )
+            finally:
+                # 앱 서버 반납(warm 유지) & 브라우저 정리
+                self._release_app()
+                self._run_async(self.browser_pool.close())
+                uploads = pipeline.join()
+
+            # 5. Notion 첨부 (업로드는 캡처와 겹쳐서 이미 진행됨, 첨부는 전략 순서대로)
+            uploaded_results = self._upload_to_notion(results, page_id, uploads, section_title)
+
+            # 6. 페이지 커버 설정
+            if set_cover:
+                self._set_cover_image(uploaded_results, strategy, page_id)
+
+            report = CaptureReport(
+                strategy=strategy,
+                results=uploaded_results,
+                app_startup_seconds=self._app_startup_seconds,
+                app_reused=self._app_reused,
+                static_build=self._app_build_note,
+                network=network.stats if network else None,
+                render_cache=(
+                    self.renderer.cache.stats.since(render_cache_start) if render_cache_start else None
+                ),
+            )
+            print()
+            print(report.summary())
 
-        # 2. 프리뷰 출력
-        print(format_capture_plan_preview(strategy))
-        print()
-
-        # 3. 프레임워크 감지 & 앱 실행
-        framework = detect_framework(project_path)
-        app_url = None
-        if framework:
-            app_url = self._launch_app(framework, project_path)
-            if app_url:
-                # 웹앱 캡처 항목에 URL 설정
-                for item in strategy.items:
-                    if item.method in (CaptureMethod.FULL_PAGE, CaptureMethod.VIEWPORT, CaptureMethod.ELEMENT):
-                        item.url = app_url
-
-        # 4. 캡처 실행
-        try:
-            results = self._execute_captures(strategy, project_path, project_analysis)
-        finally:
-            # 앱 프로세스 정리
-            self._stop_app()
-
-        # 5. Notion 업로드
-        uploaded_results = self._upload_to_notion(results, page_id)
-
-        # 6. 페이지 커버 설정
-        if set_cover:
-            self._set_cover_image(uploaded_results, strategy, page_id)
-
-        report = CaptureReport(strategy=strategy, results=uploaded_results)
-        print()
-        print(report.summary())
-
-        return report
+            return report
 
     # ─────────────────────────────────────────────
     # 수동 이미지 업로드
@@ -191,27 +339,25 @@ class CaptureManager:
         """
         captions = captions or [Path(p).stem for p in image_paths]
 
-        results = []
-        for path, caption in zip(image_paths, captions):
-            try:
-                result = self.uploader.upload_and_attach(path, page_id, caption)
-                results.append(CaptureResult(
-                    name=Path(path).stem,
-                    path=path,
-                    caption=caption,
-                    capture_type="manual",
-                    success=True,
-                    file_upload_id=result["file_upload_id"],
-                ))
-            except (NotionUploadError, FileValidationError) as e:
-                results.append(CaptureResult(
-                    name=Path(path).stem,
-                    path=path,
-                    caption=caption,
-                    capture_type="manual",
-                    success=False,
-                    error=str(e),
-                ))
+        # 전체 업로드 후 섹션(헤딩 + 구분선 + 이미지)을 한 번에 첨부
+        batch = self.uploader.upload_batch(
+            [{"path": path, "caption": caption} for path, caption in zip(image_paths, captions)],
+            page_id,
+            section_title=section_title,
+        )
+
+        results = [
+            CaptureResult(
+                name=Path(item["path"]).stem,
+                path=item["path"],
+                caption=caption,
+                capture_type="manual",
+                success=item["success"],
+                file_upload_id=item["file_upload_id"],
+                error=item["error"],
+            )
+            for item, caption in zip(batch, captions)
+        ]
 
         return CaptureReport(
             strategy=CaptureStrategy(project_type="manual"),
@@ -226,20 +372,84 @@ class CaptureManager:
         strategy: CaptureStrategy,
         project_path: str,
         project_analysis: dict,
+        on_result: Optional[Callable[[int, CaptureResult], None]] = None,
+        framework: Optional[str] = None,
+        network: Optional[NetworkFilter] = None,
+        stability: Optional[StabilityProfile] = None,
+    ) -> list[CaptureResult]:
+        """
+        전략에 따라 캡처 실행.
+        웹 캡처는 AsyncCaptureExecutor로 동시 실행하고,
+        그 동안 터미널 캡처는 별도 스레드에서 순차 실행한다.
+        결과는 strategy.items 순서를 유지한다.
+
+        on_result가 있으면 항목이 끝날 때마다 (strategy index, 결과)로 호출된다.
+        framework는 ELEMENT 캡처의 셀렉터 캐시 키로 쓰인다.
+        network가 있으면 웹 캡처 페이지마다 요청 차단 필터를 적용한다.
+        stability는 페이지 로딩 후 화면 안정화 판단(busy 셀렉터 등)에 쓰인다.
+        실패한 웹 캡처 결과에는 앱 서버 로그 tail(log_tail)을 붙인다.
+        """
+        items = strategy.items
+        web_indices = [i for i, item in enumerate(items) if item.method in WEB_CAPTURE_METHODS]
+        local_indices = [i for i in range(len(items)) if i not in web_indices]
+
+        def remap(indices: list[int]):
+            if on_result is None:
+                return None
+            return lambda j, result: on_result(indices[j], result)
+
+        async def run_all():
+            return await asyncio.gather(
+                self.executor.run(
+                    [items[i] for i in web_indices],
+                    self.workspace,
+                    on_result=remap(web_indices),
+                    framework=framework,
+                    network=network,
+                    stability=stability,
+                ),
+                asyncio.to_thread(
+                    self._execute_local_captures,
+                    [items[i] for i in local_indices],
+                    project_path,
+                    project_analysis,
+                    remap(local_indices),
+                ),
+            )
+
+        web_results, local_results = self._run_async(run_all())
+
+        results: list[Optional[CaptureResult]] = [None] * len(items)
+        for i, result in zip(web_indices, web_results):
+            results[i] = result
+        for i, result in zip(local_indices, local_results):
+            results[i] = result
+
+        log_tail = self._app_log_tail(project_path) if framework else None
+        if log_tail:
+            for i in web_indices:
+                if not results[i].success:
+                    results[i].log_tail = log_tail
+
+        return results
+
+    def _execute_local_captures(
+        self,
+        items: list[CaptureItem],
+        project_path: str,
+        project_analysis: dict,
+        on_result: Optional[Callable[[int, CaptureResult], None]] = None,
     ) -> list[CaptureResult]:
-        """전략에 따라 캡처 실행"""
+        """브라우저가 필요 없는 캡처 항목(터미널 등)을 순차 실행"""
         results = []
 
-        for item in strategy.items:
+        for index, item in enumerate(items):
             print(f"  📷 캡처 중: {item.description}...")
+            start = time.monotonic()
 
             try:
                 if item.method == CaptureMethod.TERMINAL:
                     result = self._capture_terminal(item, project_path, project_analysis)
-                elif item.method in (CaptureMethod.VIEWPORT, CaptureMethod.FULL_PAGE):
-                    result = self._capture_webpage(item)
-                elif item.method == CaptureMethod.ELEMENT:
-                    result = self._capture_element(item)
                 else:
                     result = CaptureResult(
                         name=item.name,
@@ -262,113 +472,11 @@ class CaptureManager:
                     error=str(e),
                 ))
 
-        return results
-
-    def _capture_webpage(self, item: CaptureItem) -> CaptureResult:
-        """웹페이지 캡처 (viewport 또는 full_page)"""
-        if not item.url:
-            return CaptureResult(
-                name=item.name, path="", caption=item.caption_template,
-                capture_type=item.capture_type.value, success=False,
-                error="웹앱 URL이 설정되지 않음",
-            )
-
-        output_path = os.path.join(SCREENSHOT_DIR, f"{item.name}.png")
-        full_page = item.method == CaptureMethod.FULL_PAGE
-
-        try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page(viewport_size={
-                    "width": item.viewport[0],
-                    "height": item.viewport[1],
-                })
-                page.goto(item.url, wait_until="networkidle", timeout=30000)
-
-                # 추가 대기 (동적 렌더링)
-                if item.wait_seconds > 0:
-                    page.wait_for_timeout(item.wait_seconds * 1000)
-
-                page.screenshot(path=output_path, full_page=full_page)
-                browser.close()
-
-            return CaptureResult(
-                name=item.name,
-                path=output_path,
-                caption=item.caption_template,
-                capture_type=item.capture_type.value,
-                success=True,
-            )
-
-        except Exception as e:
-            return CaptureResult(
-                name=item.name, path="", caption=item.caption_template,
-                capture_type=item.capture_type.value, success=False,
-                error=f"웹 캡처 실패: {e}",
-            )
+            results[-1].elapsed = time.monotonic() - start
+            if on_result:
+                on_result(index, results[-1])
 
-    def _capture_element(self, item: CaptureItem) -> CaptureResult:
-        """특정 DOM 요소 캡처"""
-        if not item.url:
-            return CaptureResult(
-                name=item.name, path="", caption=item.caption_template,
-                capture_type=item.capture_type.value, success=False,
-                error="웹앱 URL이 설정되지 않음",
-            )
-
-        output_path = os.path.join(SCREENSHOT_DIR, f"{item.name}.png")
-
-        try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page(viewport_size={
-                    "width": item.viewport[0],
-                    "height": item.viewport[1],
-                })
-                page.goto(item.url, wait_until="networkidle", timeout=30000)
-
-                if item.wait_seconds > 0:
-                    page.wait_for_timeout(item.wait_seconds * 1000)
-
-                # 셀렉터 후보들 순서대로 시도
-                selectors = [s.strip() for s in (item.selector or "").split(",") if s.strip()]
-                element = None
-
-                for selector in selectors:
-                    try:
-                        el = page.query_selector(selector)
-                        if el and el.is_visible():
-                            element = el
-                            break
-                    except Exception:
-                        continue
-
-                if element:
-                    element.screenshot(path=output_path)
-                else:
-                    # 요소를 찾지 못하면 viewport 캡처로 폴백
-                    page.screenshot(path=output_path, full_page=False)
-
-                browser.close()
-
-            return CaptureResult(
-                name=item.name,
-                path=output_path,
-                caption=item.caption_template,
-                capture_type=item.capture_type.value,
-                success=True,
-            )
-
-        except Exception as e:
-            return CaptureResult(
-                name=item.name, path="", caption=item.caption_template,
-                capture_type=item.capture_type.value, success=False,
-                error=f"요소 캡처 실패: {e}",
-            )
+        return results
 
     def _capture_terminal(
         self,
@@ -376,40 +484,37 @@ class CaptureManager:
         project_path: str,
         project_analysis: dict,
     ) -> CaptureResult:
-        """터미널 출력 캡처"""
-        output_path = os.path.join(SCREENSHOT_DIR, f"{item.name}.png")
+        """터미널 출력 캡처 (이미지는 메모리로, workspace가 있으면 파일로도 저장)"""
+        output_path = (
+            self.workspace.path_for(item.name, suffix=self.renderer.encoder.suffix)
+            if self.workspace else None
+        )
 
-        if item.command:
-            # 명시적 명령이 있으면 실행
-            result = self.renderer.render_command(
-                command=item.command,
+        # 명시적 명령이 없으면 프로젝트 분석 기반 추론
+        command = item.command or self._infer_terminal_command(project_path, project_analysis, item)
+        if command:
+            data = self.renderer.render_command(
+                command=command,
                 output_path=output_path,
                 title=item.description,
                 cwd=project_path,
-            )
+                in_memory=output_path is None,
+            )["data"]
         else:
-            # 명령이 없으면 프로젝트 분석 기반 추론
-            command = self._infer_terminal_command(project_path, project_analysis, item)
-            if command:
-                result = self.renderer.render_command(
-                    command=command,
-                    output_path=output_path,
-                    title=item.description,
-                    cwd=project_path,
-                )
-            else:
-                # 명령을 추론할 수 없으면 프로젝트 설명 기반 텍스트 렌더링
-                text = self._generate_demo_text(project_analysis, item)
-                self.renderer.render(text, output_path, title=item.description)
-                result = {"path": output_path}
+            # 명령을 추론할 수 없으면 프로젝트 설명 기반 텍스트 렌더링
+            text = self._generate_demo_text(project_analysis, item)
+            data = self.renderer.render_bytes(text, title=item.description)
+            if output_path:
+                Path(output_path).write_bytes(data)
 
         return CaptureResult(
             name=item.name,
-            path=output_path,
+            path=output_path or "",
             caption=item.caption_template,
             capture_type=item.capture_type.value,
-            success=os.path.exists(output_path),
-            error=None if os.path.exists(output_path) else "캡처 파일 생성 실패",
+            success=bool(data),
+            error=None if data else "캡처 이미지 생성 실패",
+            data=data,
         )
 
     def _infer_terminal_command(
@@ -462,83 +567,98 @@ Stack: {tech}
 ✅ Done"""
 
     # ─────────────────────────────────────────────
-    # 앱 실행/종료
+    # 앱 실행/반납 (AppSupervisor)
     # ─────────────────────────────────────────────
     def _launch_app(self, framework: dict, project_path: str) -> Optional[str]:
-        """웹앱을 백그라운드로 실행하고 URL 반환"""
-        print(f"  🚀 {framework['framework']} 앱 실행 중...")
-
-        try:
-            self._app_process = subprocess.Popen(
-                framework["launch_cmd"],
-                shell=True,
-                cwd=project_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=os.setsid,  # 프로세스 그룹으로 관리
-            )
-
-            # 앱 로딩 대기
-            wait_time = framework.get("wait_seconds", 5)
-            print(f"  ⏳ 앱 로딩 대기 ({wait_time}초)...")
-            time.sleep(wait_time)
-
-            # 프로세스 살아있는지 확인
-            if self._app_process.poll() is not None:
-                stderr = self._app_process.stderr.read().decode() if self._app_process.stderr else ""
-                print(f"  ⚠️ 앱 실행 실패: {stderr[:200]}")
-                return None
+        """warm 앱 서버를 재사용하거나 새로 실행하고 URL 반환"""
+        self._app = self.supervisor.acquire(framework, project_path)
+        if not self._app:
+            return None
 
-            port = framework["port"]
-            url = f"http://localhost:{port}"
-            print(f"  ✅ 앱 실행 완료: {url}")
-            return url
+        self._app_reused = self._app.reused
+        self._app_startup_seconds = None if self._app.reused else self._app.startup_seconds
+        self._app_build_note = self._app.build_note
+        return self._app.url
 
-        except Exception as e:
-            print(f"  ⚠️ 앱 실행 실패: {e}")
-            return None
+    def _app_log_tail(self, project_path: str) -> Optional[str]:
+        """실행 중인 앱의 최근 로그, 기동에 실패했다면 그때의 로그"""
+        if self._app:
+            # 정적 서빙(프로덕션 빌드)은 앱 프로세스 로그가 없음
+            return (self._app.logs.tail() or None) if self._app.logs else None
+        return self.supervisor.failure_log(project_path)
 
-    def _stop_app(self):
-        """실행 중인 앱 프로세스 종료"""
-        if self._app_process:
-            try:
-                os.killpg(os.getpgid(self._app_process.pid), signal.SIGTERM)
-                self._app_process.wait(timeout=5)
-            except (ProcessLookupError, subprocess.TimeoutExpired, OSError):
-                try:
-                    os.killpg(os.getpgid(self._app_process.pid), signal.SIGKILL)
-                except (ProcessLookupError, OSError):
-                    pass
-            self._app_process = None
+    def _release_app(self) -> None:
+        """앱 서버를 supervisor에 반납 (종료 여부는 supervisor의 idle TTL이 결정)"""
+        if self._app:
+            self.supervisor.release(self._app)
+            self._app = None
 
     # ─────────────────────────────────────────────
     # Notion 업로드
     # ─────────────────────────────────────────────
     def _upload_to_notion(
-        self, results: list[CaptureResult], page_id: str
+        self,
+        results: list[CaptureResult],
+        page_id: str,
+        uploads: Optional[dict[int, Union[str, Exception]]] = None,
+        section_title: Optional[str] = None,
     ) -> list[CaptureResult]:
-        """성공한 캡처 결과를 Notion에 업로드"""
-        uploaded = []
+        """
+        성공한 캡처 결과를 Notion에 업로드하고 결과 순서대로 페이지에 첨부.
+        첨부는 모든 업로드가 끝난 뒤 블록 전체를 묶어 최소한의 요청으로 보낸다.
+
+        uploads: UploadPipeline.join() 결과 — 이미 업로드된 항목은 첨부만 한다.
+        section_title: 있으면 이미지 앞에 섹션 헤딩과 구분선 추가
+        """
+        uploads = uploads or {}
+        ready: list[CaptureResult] = []
+        ready_ids: list[str] = []
 
-        for result in results:
-            if not result.success or not result.path or not os.path.exists(result.path):
-                uploaded.append(result)
+        for index, result in enumerate(results):
+            if not result.success or not result.has_image:
                 continue
 
             try:
-                print(f"  📤 업로드 중: {result.caption}...")
-                upload_result = self.uploader.upload_and_attach(
-                    result.path, page_id, result.caption
-                )
-                result.file_upload_id = upload_result["file_upload_id"]
-                uploaded.append(result)
+                if index in uploads:
+                    outcome = uploads[index]
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    file_upload_id = outcome
+                else:
+                    print(f"  📤 업로드 중: {result.caption}...")
+                    file_upload_id = upload_capture(self.uploader, result)
+
+                ready.append(result)
+                ready_ids.append(file_upload_id)
 
             except (NotionUploadError, FileValidationError) as e:
                 result.success = False
                 result.error = f"업로드 실패: {e}"
-                uploaded.append(result)
 
-        return uploaded
+        shots = [
+            {"file_upload_id": file_upload_id, "caption": result.caption}
+            for result, file_upload_id in zip(ready, ready_ids)
+        ]
+
+        # 캐시에서 꺼낸 ID가 첨부 시 거부되면 같은 캡처를 새로 업로드 (캐시는 이미 무효화됨).
+        # 같은 ID를 받은 캡처는 내용이 같으므로 한 번만 올리고, 새 ID를 그 ID의 모든 블록이 공유
+        by_id = dict(zip(ready_ids, ready))
+        replaced: dict[str, str] = {}
+
+        def reupload(file_upload_id: str) -> str:
+            replaced[file_upload_id] = upload_capture(self.uploader, by_id[file_upload_id])
+            return replaced[file_upload_id]
+
+        errors = self.uploader.attach_images(page_id, shots, section_title, reupload)
+
+        for result, file_upload_id, error in zip(ready, ready_ids, errors):
+            if error:
+                result.success = False
+                result.error = f"업로드 실패: {error}"
+            else:
+                result.file_upload_id = replaced.get(file_upload_id, file_upload_id)
+
+        return results
 
     def _set_cover_image(
         self, results: list[CaptureResult], strategy: CaptureStrategy, page_id: str
@@ -569,9 +689,42 @@ Stack: {tech}
     # ─────────────────────────────────────────────
     # 유틸리티
     # ─────────────────────────────────────────────
-    def _prepare_screenshot_dir(self):
-        """스크린샷 임시 디렉토리 초기화"""
-        Path(SCREENSHOT_DIR).mkdir(parents=True, exist_ok=True)
-        # 이전 캡처 정리
-        for f in Path(SCREENSHOT_DIR).glob("*.png"):
-            f.unlink()
+    def close(self) -> None:
+        """업로더 커넥션 풀, 이벤트 루프, (전용 supervisor면) warm 앱 서버 정리"""
+        if self._owns_supervisor:
+            self.supervisor.stop_all()
+        self.uploader.close()
+        if self.uploader.cache:
+            self.uploader.cache.close()
+        if self._loop and not self._loop.is_closed():
+            self._loop.close()
+
+    def __enter__(self) -> "CaptureManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run_async(self, coro):
+        """CaptureManager 전용 이벤트 루프에서 코루틴 실행 (브라우저 풀이 루프에 묶임)"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _prepare_workspace(self) -> contextlib.AbstractContextManager:
+        """
+        save_screenshots면 이번 실행 전용 스크린샷 작업 디렉토리 생성.
+        아니면 workspace 없이 메모리로만 캡처/업로드 (빈 컨텍스트 반환).
+        """
+        if not self.save_screenshots:
+            self.workspace = None
+            self.renderer.workspace = None
+            return contextlib.nullcontext()
+
+        self.workspace = CaptureWorkspace(
+            root=self.workspace_root,
+            prefer_tmpfs=self.use_tmpfs,
+            keep=self.keep_screenshots,
+        )
+        self.renderer.workspace = self.workspace
+        return self.workspace
@@ -0,0 +1,71 @@
+"""
+Capture Planner
+===============
+웹 캡처 항목들을 (URL, viewport) 단위로 묶어 페이지 로딩 횟수를 줄인다.
+
+대시보드 전략의 main_dashboard / key_chart / impact_metrics는 모두 같은 app_url을
+받는다. 항목마다 goto(networkidle) + 안정화 대기를 반복하는 대신, 그룹마다
+한 번만 이동/대기하고 이미 로드된 페이지에서 모든 스크린샷을 찍는다.
+
+그룹 안의 촬영 순서:
+- VIEWPORT  → 스크롤 전 첫 화면
+- FULL_PAGE → 스크롤 위치와 무관
+- ELEMENT   → ElementHandle 촬영이 요소를 (내부 스크롤 컨테이너 포함) 화면 안으로 스크롤하므로
+              마지막 (촬영 후 스크롤을 되돌리고, 못 찾으면 첫 화면 viewport로 폴백)
+
+Usage:
+    for group in plan_captures(web_items):
+        # group.url, group.viewport, group.wait_seconds
+        for index, item in group.items:
+            ...
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .strategies import CaptureItem, CaptureMethod
+
+
+# 그룹 안에서의 촬영 순서 (값이 작을수록 먼저)
+SHOT_ORDER = {
+    CaptureMethod.VIEWPORT: 0,
+    CaptureMethod.FULL_PAGE: 1,
+    CaptureMethod.ELEMENT: 2,
+}
+
+
+@dataclass
+class CaptureGroup:
+    """한 번의 페이지 로딩으로 촬영할 캡처 항목 묶음"""
+    url: Optional[str]
+    viewport: tuple
+    items: list[tuple[int, CaptureItem]] = field(default_factory=list)  # (입력 index, 항목)
+
+    @property
+    def wait_seconds(self) -> float:
+        """그룹 공통 안정화 대기 상한 — 항목 중 가장 긴 값"""
+        return max((item.wait_seconds for _, item in self.items), default=0)
+
+
+def plan_captures(items: list[CaptureItem]) -> list[CaptureGroup]:
+    """
+    캡처 항목을 (url, viewport)별로 묶은 실행 계획 생성.
+
+    Args:
+        items: 웹 캡처 항목 리스트
+
+    Returns:
+        첫 등장 순서의 CaptureGroup 리스트 (그룹 안은 SHOT_ORDER → 입력 순서)
+    """
+    groups: dict[tuple, CaptureGroup] = {}
+
+    for index, item in enumerate(items):
+        key = (item.url, tuple(item.viewport))
+        if key not in groups:
+            groups[key] = CaptureGroup(url=item.url, viewport=tuple(item.viewport))
+        groups[key].items.append((index, item))
+
+    for group in groups.values():
+        group.items.sort(key=lambda entry: (SHOT_ORDER.get(entry[1].method, len(SHOT_ORDER)), entry[0]))
+
+    return list(groups.values())
@@ -0,0 +1,173 @@
+"""
+Streaming Command Output
+========================
+터미널 캡처용 명령을 실행하면서 출력을 조금씩 읽어, 이미지에 들어갈 줄만 메모리에 남긴다.
+
+- 앞쪽 head_lines줄은 그대로, 뒤쪽은 tail_lines줄 ring buffer, 그 사이는 개수만 셈
+  → 수백 MB를 출력하는 명령도 메모리 사용량이 일정
+- stdout / stderr는 리더 스레드 두 개가 읽어 도착 순서대로 한 버퍼에 합침
+- 한 줄이 MAX_LINE_BYTES를 넘으면 앞부분만 보관하고 나머지는 버림
+- 타임아웃 시 프로세스 그룹을 종료하고 그때까지 읽은 출력은 유지
+
+Usage:
+    result = run_command("python etl.py", cwd="/path/to/project", timeout=60,
+                         head_lines=24, tail_lines=25)
+    for stream, line in result.lines:
+        ...
+    print(result.omitted, result.timed_out)
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, Optional
+
+
+MAX_LINE_BYTES = 64 * 1024  # 한 줄 보관 상한 (바이트)
+READER_JOIN_TIMEOUT = 2.0   # 종료 후 리더 스레드가 남은 출력을 비울 시간 (초)
+
+
+class BoundedOutput:
+    """head 버퍼 + tail ring buffer + 생략 줄 수 (스레드 안전)"""
+
+    def __init__(self, head_lines: int, tail_lines: int):
+        self.head_lines = max(0, head_lines)
+        self._head: list[tuple[str, str]] = []
+        self._tail: deque = deque(maxlen=max(0, tail_lines))
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def append(self, stream: str, line: str) -> None:
+        with self._lock:
+            self.total += 1
+            if len(self._head) < self.head_lines:
+                self._head.append((stream, line))
+            else:
+                self._tail.append((stream, line))
+
+    @property
+    def omitted(self) -> int:
+        """head / tail 어디에도 남지 않은 줄 수"""
+        with self._lock:
+            return self.total - len(self._head) - len(self._tail)
+
+    def snapshot(self) -> tuple[list, list, int]:
+        """(head, tail, 생략 줄 수) — 각 줄은 (stream, text)"""
+        with self._lock:
+            return list(self._head), list(self._tail), self.total - len(self._head) - len(self._tail)
+
+
+@dataclass
+class CommandOutput:
+    """스트리밍 실행 결과 (보관된 줄만)"""
+    head: list = field(default_factory=list)   # [(stream, text)] — 처음부터
+    tail: list = field(default_factory=list)   # [(stream, text)] — 마지막까지
+    omitted: int = 0                           # head와 tail 사이에서 버린 줄 수
+    returncode: int = 0                        # 타임아웃이면 -1
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def lines(self) -> list:
+        """보관된 모든 줄 (head + tail, 도착 순서)"""
+        return self.head + self.tail
+
+    def text(self, stream: Optional[str] = None) -> str:
+        """보관된 줄을 합친 문자열 (stream 지정 시 해당 스트림만)"""
+        return "\n".join(line for s, line in self.lines if stream is None or s == stream)
+
+
+def run_command(
+    command: str,
+    cwd: Optional[str] = None,
+    timeout: float = 60,
+    head_lines: int = 25,
+    tail_lines: int = 25,
+) -> CommandOutput:
+    """
+    셸 명령을 실행하며 출력을 head / tail 버퍼로 스트리밍 수집.
+
+    Args:
+        command: 실행할 셸 명령
+        cwd: 작업 디렉토리
+        timeout: 실행 제한 시간 (초) — 초과 시 프로세스 그룹 종료, 부분 출력 유지
+        head_lines: 처음부터 보관할 줄 수
+        tail_lines: 마지막부터 보관할 줄 수
+
+    Returns:
+        CommandOutput
+    """
+    buffer = BoundedOutput(head_lines, tail_lines)
+    start = time.monotonic()
+
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,  # 타임아웃 시 자식 프로세스까지 한 번에 종료
+    )
+    readers = [
+        threading.Thread(target=_read_lines, args=(name, stream, buffer), name=f"command-{name}", daemon=True)
+        for name, stream in (("stdout", process.stdout), ("stderr", process.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+
+    timed_out = False
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        _kill_group(process)
+        returncode = -1
+
+    for reader in readers:
+        reader.join(READER_JOIN_TIMEOUT)
+
+    head, tail, omitted = buffer.snapshot()
+    return CommandOutput(
+        head=head,
+        tail=tail,
+        omitted=omitted,
+        returncode=returncode,
+        timed_out=timed_out,
+        elapsed=time.monotonic() - start,
+    )
+
+
+def _read_lines(name: str, stream: IO[bytes], buffer: BoundedOutput) -> None:
+    """파이프를 줄 단위로 읽어 버퍼에 추가 (긴 줄은 앞부분만)"""
+    partial = None  # MAX_LINE_BYTES를 넘은 줄의 보관 부분
+    try:
+        for chunk in iter(lambda: stream.readline(MAX_LINE_BYTES), b""):
+            if partial is None:
+                partial = chunk
+            if chunk.endswith(b"\n"):
+                buffer.append(name, partial.decode(errors="replace").rstrip("\r\n"))
+                partial = None
+        if partial is not None:
+            buffer.append(name, partial.decode(errors="replace").rstrip("\r\n"))
+    except (OSError, ValueError):
+        pass  # 종료 중 파이프가 닫힘
+    finally:
+        stream.close()
+
+
+def _kill_group(process: subprocess.Popen) -> None:
+    """명령 프로세스 그룹 종료 (SIGTERM → 2초 후 SIGKILL)"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=2)
+    except (ProcessLookupError, subprocess.TimeoutExpired, OSError):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, OSError):
+            pass
+        process.wait()
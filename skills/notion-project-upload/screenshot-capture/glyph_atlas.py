@@ -0,0 +1,296 @@
+"""
+Glyph Atlas Rasterizer
+======================
+고정폭(monospace) 폰트의 터미널 텍스트를 글자 단위 draw.text 대신
+미리 래스터화한 글리프 마스크를 NumPy 배열로 한 번에 붙여 그린다.
+
+- (글자, 굵기)마다 마스크를 한 번만 래스터화해 atlas에 보관 (색은 합성 단계에서 적용)
+- 글자 폭이 정수로 고정 → 텍스트는 셀 격자, 짝수/홀수 열을 각각 겹침 없는 층으로 조립
+- 이웃 글리프가 겹치는 픽셀만 Pillow와 같은 순서(왼쪽 → 오른쪽)와 정수 연산으로 합성,
+  색 입히기는 draw.text와 같은 Pillow fill(paste(color, mask))을 같은 색 줄 묶음마다 한 번
+  → draw.text 경로와 픽셀 단위로 동일
+- 셀 밖으로 잉크가 나가는 글리프(또는 폭이 다른 글자)가 있는 줄은 draw.text로 처리
+
+NumPy가 없거나 폰트가 조건(정수 고정폭, 자체 검증 통과)을 만족하지 않으면
+GlyphAtlas.build()가 None → TerminalRenderer는 기존 Pillow 경로 사용.
+
+Usage:
+    atlas = GlyphAtlas.build(font, font_bold, line_height=24)
+    leftover = atlas.draw(img, lines, bold_flags, colors, x=52, y=92)
+    # leftover: atlas로 그리지 못한 줄 번호 → draw.text로 그릴 것
+
+    # 벤치마크 (draw.text 경로와 비교 + 픽셀 동일성 확인)
+    python glyph_atlas.py --lines 400 --repeat 5
+"""
+
+if __name__ == "__main__" and not __package__:
+    # 디렉토리 이름에 하이픈이 있어 -m 실행이 불가 → 스크립트 실행 시 패키지로 등록
+    import importlib
+    import sys
+    from pathlib import Path as _Path
+
+    sys.path.insert(0, str(_Path(__file__).resolve().parent.parent))
+    __package__ = _Path(__file__).resolve().parent.name
+    importlib.import_module(__package__)
+
+import threading
+from typing import Optional
+
+
+ATLAS_PROBE_TEXT = "WM@#%&|{}[]()_-=+~gjpqy ─═│ AaBbCc 0123456789 .,:;!?/\\"
+
+
+def _div255(value):
+    """Pillow의 DIV255 — (value / 255)를 정수 반올림 (value는 int32 배열)"""
+    value = value + 128
+    return (value + (value >> 8)) >> 8
+
+
+class GlyphAtlas:
+    """(글자, 굵기)별 글리프 마스크 atlas + 셀 격자 합성기"""
+
+    def __init__(self, fonts: dict, advance: int, line_height: int):
+        """
+        build()로 생성할 것.
+
+        Args:
+            fonts: {False: 본문 폰트, True: 볼드 폰트}
+            advance: 글자 폭 (px, 정수)
+            line_height: 줄 간격 (px) — 셀 높이
+        """
+        import numpy as np
+
+        self.fonts = fonts
+        self.advance = advance
+        self.line_height = line_height
+        self.half = advance // 2
+        # 글리프 j의 셀: 펜 위치 기준 [-half, 2*advance - half) × [0, line_height)
+        # → 짝수(홀수) 열끼리는 셀이 정확히 이어 붙고 겹치지 않음
+        self.cell_width = advance * 2
+        self._lock = threading.Lock()
+        self._index: dict[tuple[str, bool], int] = {}   # (글자, 굵기) → atlas 번호 (-1은 사용 불가)
+        self._cells = np.zeros((64, line_height, self.cell_width), dtype=np.uint8)
+        self._count = 1  # 0번은 빈 셀 (공백, 줄 끝 패딩)
+
+    @classmethod
+    def build(cls, font, font_bold, line_height: int) -> Optional["GlyphAtlas"]:
+        """
+        atlas 생성. NumPy가 없거나 폰트가 정수 고정폭이 아니거나,
+        자체 검증(probe 문장을 draw.text와 비교)에 실패하면 None.
+        """
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return None
+
+        try:
+            advance = font.getlength("M")
+            if advance != int(advance) or font_bold.getlength("M") != advance:
+                return None
+        except AttributeError:
+            return None  # 비트맵 기본 폰트 등
+        atlas = cls({False: font, True: font_bold}, int(advance), line_height)
+        return atlas if atlas._self_check() else None
+
+    # ─────────────────────────────────────────────
+    # 합성
+    # ─────────────────────────────────────────────
+    def draw(self, img, lines: list[str], bold: list[bool], colors: list[tuple], x: int, y: int) -> list[int]:
+        """
+        줄들을 (x, y)부터 line_height 간격으로 img(RGB)에 그린다.
+
+        Returns:
+            atlas로 그리지 못한 줄 번호 (호출자가 draw.text로 그릴 것)
+        """
+        import numpy as np
+        from PIL import Image
+
+        n = len(lines)
+        if n == 0:
+            return []
+
+        leftover = []
+        pairs = (max((len(line) for line in lines), default=0) + 1) // 2 or 1
+        ids = np.zeros((n, pairs * 2), dtype=np.intp)
+        for i, line in enumerate(lines):
+            row = self._glyph_ids(line, bold[i])
+            if row is None:
+                leftover.append(i)
+            elif row:
+                ids[i, :len(row)] = row
+
+        mask = self._compose(ids)  # (n * line_height, 폭)
+        mask_image = Image.fromarray(mask, "L")
+        left = x - self.half
+        h, width = self.line_height, mask.shape[1]
+
+        # 같은 색이 이어지는 줄 묶음마다 draw.text와 같은 fill 블렌딩 한 번
+        # (atlas로 못 그린 줄은 마스크가 0이라 그대로 유지됨)
+        start = 0
+        for i in range(1, n + 1):
+            if i < n and colors[i] == colors[start]:
+                continue
+            top, bottom = y + start * h, y + i * h
+            img.paste(colors[start], (left, top, left + width, bottom),
+                      mask_image.crop((0, start * h, width, i * h)))
+            start = i
+        return leftover
+
+    def _compose(self, ids):
+        """글리프 번호 격자 (n, 열) → 텍스트 마스크 (n * line_height, 폭)"""
+        import numpy as np
+
+        cells = self._cells
+        n, cols = ids.shape
+        pairs = cols // 2
+        adv, h, cw = self.advance, self.line_height, self.cell_width
+        span = pairs * cw
+        width = (cols + 1) * adv
+
+        # 짝수 열 / 홀수 열 층 — 각 층 안에서는 셀이 겹치지 않아 reshape만으로 조립
+        even = cells[ids[:, 0::2]].transpose(0, 2, 1, 3).reshape(n, h, span)
+        odd = cells[ids[:, 1::2]].transpose(0, 2, 1, 3).reshape(n, h, span)
+
+        mask = np.zeros((n, h, width), dtype=np.uint8)
+        mask[:, :, :span] = even
+        under = mask[:, :, adv : adv + span]  # 홀수 층이 놓일 자리 (짝수 층 값)
+
+        # 두 층이 모두 잉크인 픽셀만 순서 있는 합성, 나머지는 한쪽 값 그대로
+        both = np.nonzero(np.logical_and(under, odd))
+        a = under[both].astype(np.int32)
+        b = odd[both].astype(np.int32)
+        np.maximum(under, odd, out=under)
+        if a.size:
+            # 경계 x // adv가 홀수면 왼쪽 글리프가 짝수 열
+            left_is_even = ((both[2] + adv) // adv) % 2 == 1
+            left, right = np.where(left_is_even, a, b), np.where(left_is_even, b, a)
+            # Pillow 글리프 합성 (왼쪽 → 오른쪽): dst = src + DIV255(dst * (255 - src))
+            under[both] = right + _div255(left * (255 - right))
+
+        return mask.reshape(n * h, width)
+
+    # ─────────────────────────────────────────────
+    # atlas 관리
+    # ─────────────────────────────────────────────
+    def _glyph_ids(self, line: str, bold: bool) -> Optional[list[int]]:
+        """줄의 글리프 번호 목록 — 셀에 담을 수 없는 글자가 있으면 None"""
+        index = self._index
+        ids = []
+        for ch in line:
+            glyph = index.get((ch, bold))
+            if glyph is None:
+                glyph = self._add_glyph(ch, bold)
+            if glyph < 0:
+                return None
+            ids.append(glyph)
+        return ids
+
+    def _add_glyph(self, ch: str, bold: bool) -> int:
+        """글리프 하나를 래스터화해 atlas에 추가 (셀 밖으로 잉크가 나가면 -1)"""
+        import numpy as np
+        from PIL import Image, ImageDraw
+
+        with self._lock:
+            key = (ch, bold)
+            if key in self._index:
+                return self._index[key]
+
+            font = self.fonts[bold]
+            if font.getlength(ch) != self.advance:
+                self._index[key] = -1  # 폭이 다른 글자 (결합 문자 등)
+                return -1
+
+            # 셀 주위에 여백을 두고 그려 셀 밖 잉크 여부 확인
+            margin = self.advance * 2
+            canvas = Image.new("L", (self.cell_width + margin * 2, self.line_height + margin * 2))
+            ImageDraw.Draw(canvas).text((margin + self.half, margin), ch, fill=255, font=font)
+            pixels = np.asarray(canvas)
+            cell = pixels[margin : margin + self.line_height, margin : margin + self.cell_width]
+            if int(pixels.sum(dtype=np.int64)) != int(cell.sum(dtype=np.int64)):
+                self._index[key] = -1
+                return -1
+
+            if not cell.any():
+                self._index[key] = 0  # 공백류
+                return 0
+
+            if self._count == len(self._cells):
+                self._cells = np.concatenate([self._cells, np.zeros_like(self._cells)])
+            self._cells[self._count] = cell
+            self._index[key] = self._count
+            self._count += 1
+            return self._count - 1
+
+    def _self_check(self) -> bool:
+        """probe 문장을 draw.text와 atlas로 각각 그려 픽셀 비교 (커닝 / 레이아웃 엔진 차이 감지)"""
+        import numpy as np
+        from PIL import Image, ImageDraw
+
+        size = ((len(ATLAS_PROBE_TEXT) + 4) * self.advance, self.line_height * 4)
+        colors = [(205, 214, 244), (166, 227, 161)]
+        lines = [ATLAS_PROBE_TEXT, ATLAS_PROBE_TEXT]
+        bold = [False, True]
+
+        expected = Image.new("RGB", size, (30, 30, 46))
+        draw = ImageDraw.Draw(expected)
+        for i, line in enumerate(lines):
+            draw.text((self.advance, self.line_height + i * self.line_height), line,
+                      fill=colors[i], font=self.fonts[bold[i]])
+
+        actual = Image.new("RGB", size, (30, 30, 46))
+        leftover = self.draw(actual, lines, bold, colors, self.advance, self.line_height)
+        draw = ImageDraw.Draw(actual)
+        for i in leftover:
+            draw.text((self.advance, self.line_height + i * self.line_height), lines[i],
+                      fill=colors[i], font=self.fonts[bold[i]])
+
+        return np.array_equal(np.asarray(expected), np.asarray(actual))
+
+
+# ─────────────────────────────────────────────
+# 벤치마크 CLI
+# ─────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    import numpy as np
+
+    from .terminal_renderer import TerminalRenderer
+
+    parser = argparse.ArgumentParser(description="터미널 렌더링 엔진 벤치마크 (draw.text vs glyph atlas)")
+    parser.add_argument("--lines", type=int, default=400, help="렌더링할 줄 수")
+    parser.add_argument("--repeat", type=int, default=5, help="엔진별 반복 횟수")
+    parser.add_argument("--width", type=int, default=820)
+    args = parser.parse_args()
+
+    random.seed(0)
+    templates = [
+        "2024-05-01 12:{m:02d}:{s:02d} INFO  etl.load: loaded {n:,} rows into staging.orders",
+        "2024-05-01 12:{m:02d}:{s:02d} WARNING etl.validate: {n} rows with null customer_id",
+        "✅ batch {n} complete — /data/out/part-{m:05d}.parquet",
+        "───────────────────────────────────",
+        "$ python etl.py --date 2024-05-01 --workers {m}",
+        "error: connection reset by peer (retry {s}/5)",
+        "   {n:>8} | {m:>4} | {s:>4}% | WWW@@@|||",
+    ]
+    text = "\n".join(
+        random.choice(templates).format(m=random.randrange(60), s=random.randrange(60), n=random.randrange(10**6))
+        for _ in range(args.lines)
+    )
+
+    results = {}
+    for engine in ("pillow", "atlas"):
+        renderer = TerminalRenderer(engine=engine)
+        image = renderer._render_with_pillow(text, "benchmark", args.width)  # 캐시 워밍업
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            image = renderer._render_with_pillow(text, "benchmark", args.width)
+        results[engine] = ((time.perf_counter() - start) / args.repeat, image)
+        print(f"  {engine:<7} {results[engine][0] * 1000:8.1f} ms / {args.lines}줄")
+
+    if TerminalRenderer(engine="atlas")._atlas() is None:
+        print("⚠️ glyph atlas 사용 불가 (NumPy 없음 또는 폰트 조건 불만족) — 두 결과 모두 Pillow 경로")
+    same = np.array_equal(np.asarray(results["pillow"][1]), np.asarray(results["atlas"][1]))
+    print(f"  픽셀 동일: {'✅' if same else '❌'}  /  속도 {results['pillow'][0] / results['atlas'][0]:.1f}x")
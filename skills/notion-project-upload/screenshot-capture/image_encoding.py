@@ -0,0 +1,162 @@
+"""
+Image Encoding
+==============
+렌더링된 터미널 이미지를 업로드용 바이트로 인코딩한다.
+
+- 터미널 이미지는 테마 색 + 안티에일리어싱 중간색만 쓰므로, 테마에서 만든 256색 팔레트로
+  indexed(P 모드) 변환 → RGB PNG보다 작고 zlib 압축도 빠름
+- 팔레트 매핑은 가장 가까운 색으로 정확히 계산 (테마 색 픽셀은 값이 바뀌지 않음, NumPy 필요)
+  NumPy가 없으면 RGB 그대로 인코딩
+- PNG(compress_level 0~9) 또는 lossless WebP 선택
+- 결과에 인코딩 시간 / 바이트 크기를 함께 기록
+
+Usage:
+    encoder = ImageEncoder(format="webp", compress_level=6)
+    encoded = encoder.encode(img, palette=[(30, 30, 46), ...])
+    print(encoded.size, encoded.elapsed, encoded.suffix)
+"""
+
+import io
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+
+ENCODE_FORMATS = ("png", "webp")
+DEFAULT_COMPRESS_LEVEL = 6  # zlib 기본값 — optimize(9 + 필터 탐색)보다 훨씬 빠르고 크기 차이는 작음
+PALETTE_SIZE = 256
+
+CONTENT_TYPES = {"png": "image/png", "webp": "image/webp"}
+
+
+@dataclass
+class EncodedImage:
+    """인코딩 결과"""
+    data: bytes = field(repr=False)
+    format: str        # "png" | "webp"
+    indexed: bool      # 팔레트(P 모드)로 저장됐는지
+    elapsed: float     # 팔레트 변환 + 인코딩 시간 (초)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def suffix(self) -> str:
+        return f".{self.format}"
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+
+class ImageEncoder:
+    """PIL 이미지 → PNG / lossless WebP 바이트"""
+
+    def __init__(
+        self,
+        format: str = "png",
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        palette: bool = True,
+    ):
+        """
+        Args:
+            format: "png" | "webp" (WebP는 항상 lossless)
+            compress_level: 0(빠름/큼) ~ 9(느림/작음) — WebP는 압축 노력(method / quality)으로 변환
+            palette: encode()에 팔레트가 주어지면 indexed 이미지로 변환
+        """
+        if format not in ENCODE_FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 포맷: {format} ({', '.join(ENCODE_FORMATS)})")
+        if not 0 <= compress_level <= 9:
+            raise ValueError(f"compress_level은 0~9: {compress_level}")
+        if format == "webp":
+            from PIL import features
+
+            if not features.check("webp"):
+                raise ValueError("Pillow가 WebP 지원 없이 빌드됨")
+        self.format = format
+        self.compress_level = compress_level
+        self.palette = palette
+
+    @property
+    def suffix(self) -> str:
+        return f".{self.format}"
+
+    def encode(self, img, palette: Optional[Sequence[tuple[int, int, int]]] = None) -> EncodedImage:
+        """
+        이미지를 인코딩.
+
+        Args:
+            img: RGB PIL 이미지
+            palette: indexed 변환에 쓸 색 목록 (최대 256, None이면 RGB 그대로)
+        """
+        start = time.perf_counter()
+        indexed = None
+        if self.palette and palette:
+            indexed = quantize_exact(img, palette)
+        out = indexed if indexed is not None else img
+
+        buffer = io.BytesIO()
+        if self.format == "webp":
+            out.save(
+                buffer,
+                "WEBP",
+                lossless=True,
+                quality=self.compress_level * 100 // 9,
+                method=round(self.compress_level * 6 / 9),
+            )
+        else:
+            out.save(buffer, "PNG", compress_level=self.compress_level)
+
+        return EncodedImage(
+            data=buffer.getvalue(),
+            format=self.format,
+            indexed=indexed is not None,
+            elapsed=time.perf_counter() - start,
+        )
+
+
+def quantize_exact(img, palette: Sequence[tuple[int, int, int]]):
+    """
+    RGB 이미지를 palette의 가장 가까운 색으로 매핑한 P 모드 이미지.
+    Image.quantize(palette=...)는 색을 5~6비트 bin으로 캐시해 정확한 팔레트 색도
+    옆 색으로 바뀔 수 있어, 이미지의 고유 색마다 직접 최근접 색을 계산한다.
+
+    Returns:
+        P 모드 이미지, NumPy가 없거나 고유 색이 너무 많으면 None
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    from PIL import Image
+
+    if len(palette) > PALETTE_SIZE:
+        raise ValueError(f"팔레트는 최대 {PALETTE_SIZE}색: {len(palette)}")
+
+    counts = img.getcolors(1 << 16)
+    if counts is None:
+        return None  # 사진 등 — 팔레트로 표현할 이미지가 아님
+
+    # 고유 색 → 최근접 팔레트 index
+    colors = np.array([rgb[:3] for _, rgb in counts], dtype=np.int32)
+    pal = np.asarray(palette, dtype=np.int32)
+    nearest = ((colors[:, None, :] - pal[None]) ** 2).sum(-1).argmin(1).astype(np.uint8)
+
+    # 픽셀 → 고유 색 위치 (RGBX 4바이트를 uint32 키로 보고 정렬된 키에서 이진 탐색)
+    pixels = np.asarray(img.convert("RGBX")).view("<u4")[..., 0] & 0xFFFFFF
+    keys = (colors[:, 2].astype(np.uint32) << 16) | (colors[:, 1].astype(np.uint32) << 8) | colors[:, 0].astype(np.uint32)
+    order = np.argsort(keys)
+    indices = nearest[order][np.searchsorted(keys[order], pixels)]
+
+    out = Image.fromarray(indices)  # L 모드 — putpalette로 P 모드가 됨
+    flat = [v for rgb in palette for v in rgb]
+    out.putpalette(flat + flat[:3] * (PALETTE_SIZE - len(palette)))
+    return out
+
+
+def image_suffix(data: bytes) -> str:
+    """이미지 바이트의 확장자 (PNG / WebP 시그니처, 모르면 .png)"""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return ".png"
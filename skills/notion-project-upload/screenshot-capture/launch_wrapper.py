@@ -0,0 +1,72 @@
+"""
+Launch Wrapper
+==============
+포트를 CLI 플래그로 받지 않는 Python 웹앱(Flask / Gradio / Dash)을
+지정한 포트로 강제 실행하는 래퍼 스크립트.
+
+앱 코드가 app.run(port=5000), demo.launch(server_port=7860)처럼 포트를
+하드코딩해도, 실행 메서드를 감싸 port 인자를 덮어쓴 뒤 엔트리 파일을
+__main__으로 실행한다. (패키지 밖에서 단독 실행되므로 상대 import 없음)
+
+Usage:
+    python launch_wrapper.py flask 53117 /path/to/app.py
+"""
+
+import functools
+import inspect
+import os
+import runpy
+import sys
+
+
+# 프레임워크별 패치 대상: (모듈, 클래스, 메서드, 포트 인자 이름)
+RUN_METHODS = {
+    "flask": [("flask", "Flask", "run", "port")],
+    "gradio": [("gradio", "Blocks", "launch", "server_port")],
+    "dash": [("dash", "Dash", "run", "port"), ("dash", "Dash", "run_server", "port")],
+}
+
+
+def force_port(framework: str, port: int) -> None:
+    """프레임워크 실행 메서드가 항상 port로 서버를 열도록 패치"""
+    for module_name, class_name, method_name, port_arg in RUN_METHODS.get(framework, []):
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+        cls = getattr(module, class_name, None)
+        original = getattr(cls, method_name, None) if cls else None
+        if original is None:
+            continue
+        setattr(cls, method_name, _with_port(original, port_arg, port))
+
+
+def _with_port(original, port_arg: str, port: int):
+    signature = inspect.signature(original)
+
+    @functools.wraps(original)
+    def run(*args, **kwargs):
+        bound = signature.bind_partial(*args, **kwargs)
+        bound.arguments[port_arg] = port
+        return original(*bound.args, **bound.kwargs)
+
+    return run
+
+
+def main(argv: list[str]) -> None:
+    if len(argv) != 3:
+        print("Usage: python launch_wrapper.py <flask|gradio|dash> <port> <entry_file>")
+        sys.exit(2)
+
+    framework, port, entry_file = argv[0], int(argv[1]), os.path.abspath(argv[2])
+
+    # 엔트리 파일을 직접 실행한 것과 같은 환경 (sys.path[0], argv) — 래퍼 디렉토리의
+    # ports / batch / stability 등 모듈이 앱이나 설치된 패키지를 가리지 않도록 교체
+    sys.path[0] = os.path.dirname(entry_file)
+    sys.argv = [entry_file]
+    force_port(framework, port)
+    runpy.run_path(entry_file, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
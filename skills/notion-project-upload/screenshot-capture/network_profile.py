@@ -0,0 +1,149 @@
+"""
+Network Profile
+===============
+캡처용 페이지의 요청을 가로채(page.route) 스크린샷에 필요 없는 트래픽을 막는다.
+analytics beacon, 외부 이미지/지도 타일, (선택) 원격 폰트·미디어가 networkidle을
+늦추거나 30초 타임아웃까지 끌고 가는 것을 방지.
+
+분류 순서:
+1. analytics / block_hosts 호스트  → 빈 204 응답으로 stub (앱 코드의 에러 핸들러 회피)
+2. block_fonts / block_media        → 폰트 / 미디어 요청 abort (출처 무관)
+3. block_third_party                → 앱 호스트 밖의 이미지·미디어·기타 요청 abort
+   (스크립트·스타일시트·XHR/fetch·폰트는 렌더링에 필요할 수 있어 허용)
+4. 나머지                            → 통과
+
+프레임워크별 기본값은 strategies.FRAMEWORK_SIGNATURES의 "network" 항목.
+
+Usage:
+    network = NetworkFilter(NetworkProfile.from_framework(framework))
+    await network.attach(page, "http://localhost:8501")
+    await page.goto(...)
+    print(network.stats.summary())
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Optional
+from urllib.parse import urlparse
+
+
+# 알려진 analytics / telemetry 호스트 (하위 도메인 포함)
+ANALYTICS_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "hotjar.com",
+    "fullstory.com",
+    "heapanalytics.com",
+    "plausible.io",
+    "clarity.ms",
+    "intercom.io",
+    "sentry.io",
+    "facebook.net",
+)
+
+# block_third_party일 때 외부 호스트에서 막을 resource type
+THIRD_PARTY_BLOCKED_TYPES = frozenset({
+    "image", "media", "texttrack", "eventsource", "manifest", "ping", "other",
+})
+
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "0.0.0.0"})
+
+ALLOWED = "allowed"
+
+
+@dataclass
+class NetworkProfile:
+    """캡처 브라우저의 요청 차단 설정"""
+    block_analytics: bool = True
+    block_third_party: bool = True
+    block_fonts: bool = False
+    block_media: bool = False
+    allow_hosts: tuple = ()   # 항상 허용할 외부 호스트 (예: 앱이 쓰는 CDN)
+    block_hosts: tuple = ()   # analytics처럼 stub할 추가 호스트
+
+    @classmethod
+    def from_framework(cls, framework: Optional[dict]) -> "NetworkProfile":
+        """detect_framework() 결과의 "network" 기본값으로 프로필 생성"""
+        overrides = dict((framework or {}).get("network", {}))
+        known = {f.name for f in fields(cls)}
+        for key in ("allow_hosts", "block_hosts"):
+            if key in overrides:
+                overrides[key] = tuple(overrides[key])
+        return cls(**{k: v for k, v in overrides.items() if k in known})
+
+    def classify(self, url: str, resource_type: str, app_host: Optional[str]) -> str:
+        """요청 하나의 처리 결정 — ALLOWED 또는 차단 사유"""
+        host = (urlparse(url).hostname or "").lower()
+        if not host or _host_matches(host, self.allow_hosts):
+            return ALLOWED
+
+        if self.block_analytics and _host_matches(host, ANALYTICS_HOSTS):
+            return "analytics"
+        if _host_matches(host, self.block_hosts):
+            return "analytics"
+        if self.block_fonts and resource_type == "font":
+            return "font"
+        if self.block_media and resource_type == "media":
+            return "media"
+
+        first_party = host == app_host or host in LOCAL_HOSTS
+        if self.block_third_party and not first_party and resource_type in THIRD_PARTY_BLOCKED_TYPES:
+            return "third_party"
+
+        return ALLOWED
+
+
+@dataclass
+class NetworkStats:
+    """요청 허용/차단 집계"""
+    allowed: int = 0
+    blocked: dict[str, int] = field(default_factory=dict)  # 사유별 차단 수
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+    def record(self, decision: str) -> None:
+        if decision == ALLOWED:
+            self.allowed += 1
+        else:
+            self.blocked[decision] = self.blocked.get(decision, 0) + 1
+
+    def summary(self) -> str:
+        detail = ", ".join(f"{reason} {count}" for reason, count in sorted(self.blocked.items()))
+        line = f"허용 {self.allowed}건 / 차단 {self.blocked_total}건"
+        return f"{line} ({detail})" if detail else line
+
+
+class NetworkFilter:
+    """NetworkProfile을 페이지에 적용하고 결과를 집계"""
+
+    def __init__(self, profile: Optional[NetworkProfile] = None):
+        self.profile = profile or NetworkProfile()
+        self.stats = NetworkStats()
+
+    async def attach(self, page, app_url: Optional[str] = None) -> None:
+        """페이지의 모든 요청에 라우팅 핸들러 등록 (goto 전에 호출)"""
+        app_host = (urlparse(app_url).hostname or "").lower() if app_url else None
+
+        async def handle(route, request) -> None:
+            decision = self.profile.classify(request.url, request.resource_type, app_host)
+            self.stats.record(decision)
+
+            if decision == ALLOWED:
+                await route.continue_()
+            elif decision == "analytics":
+                await route.fulfill(status=204, body="")
+            else:
+                await route.abort("blockedbyclient")
+
+        await page.route("**/*", handle)
+
+
+def _host_matches(host: str, patterns) -> bool:
+    """host가 패턴과 같거나 그 하위 도메인인지"""
+    return any(host == p or host.endswith("." + p) for p in patterns)
@@ -9,18 +9,54 @@ Notion API의 File Upload 기능을 사용하여
 2. 파일 바이너리 전송
 3. 이미지 블록으로 페이지에 첨부
 
+20MB를 넘는 파일(긴 full-page 캡처, GIF 녹화)은 multi-part 모드로 올린다:
+고정 크기 파트로 나눠(mmap, 파트 단위로만 메모리 사용) 제한된 수의 스레드로
+동시에 전송하고, 모든 파트가 끝나면 /complete로 마무리한다.
+
+내용이 같은 파일은 UploadCache((토큰 scope, SHA-256) → file_upload_id)로 재업로드를 생략한다.
+캐시에서 꺼낸 ID가 첨부 시 거부되면(삭제/만료된 업로드) 캐시를 지우고, 호출자가 준
+reupload 콜백으로 새로 올려 그 자리에서 한 번 다시 첨부한다.
+
+모든 요청은 keep-alive 커넥션 풀을 가진 requests.Session 하나로 보낸다.
+요청은 공유 토큰 버킷으로 Notion 평균 한도(초당 3회) 아래로 유지하고,
+429/5xx는 Retry-After 또는 jitter exponential backoff 후 재시도한다.
+
 Usage:
-    uploader = NotionFileUploader(notion_token="ntn_xxx")
-    file_upload_id = uploader.upload_image("screenshot.png")
-    uploader.attach_image_to_page(page_id, file_upload_id, caption="메인 화면")
+    with NotionFileUploader(notion_token="ntn_xxx", cache=UploadCache()) as uploader:
+        file_upload_id = uploader.upload_image("screenshot.png")
+        uploader.attach_image_to_page(page_id, file_upload_id, caption="메인 화면")
+
+        # 디스크를 거치지 않는 경로 (예: Playwright 스크린샷 바이트)
+        file_upload_id = uploader.upload_bytes(png_bytes, "main.png")
 """
 
+if __name__ == "__main__" and not __package__:
+    # 디렉토리 이름에 하이픈이 있어 -m 실행이 불가 → 스크립트 실행 시 패키지로 등록
+    import importlib
+    import sys
+    from pathlib import Path as _Path
+
+    sys.path.insert(0, str(_Path(__file__).resolve().parent.parent))
+    __package__ = _Path(__file__).resolve().parent.name
+    importlib.import_module(__package__)
+
+import io
 import json
+import math
 import mimetypes
+import mmap
 import os
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Optional, Union
+
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import TokenBucket, backoff_delay, parse_retry_after
+from .upload_cache import UploadCache, bytes_sha256, file_sha256, scoped_key, token_scope
 
 
 NOTION_API_BASE = "https://api.notion.com/v1"
@@ -36,29 +72,144 @@ SUPPORTED_IMAGE_TYPES = {
     ".svg": "image/svg+xml",
 }
 
-MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
+MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB — single-part 업로드 최대 크기
+
+# Multi-part 업로드 (MAX_FILE_SIZE 초과 파일)
+MIN_PART_SIZE = 5 * 1024 * 1024              # Notion 파트 최소 크기 (마지막 파트 제외)
+DEFAULT_PART_SIZE = 10 * 1024 * 1024         # 10MB
+DEFAULT_PART_WORKERS = 3                     # 파일 하나당 동시 전송 파트 수
+MAX_MULTI_PART_SIZE = 5 * 1024 * 1024 * 1024  # 5GB
+
+# HTTP 커넥션 풀 / 타임아웃
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0   # 초
+DEFAULT_READ_TIMEOUT = 60.0     # 초 — 업로드 응답 대기 포함
+
+# 재시도 / 동시 업로드
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BATCH_WORKERS = 3
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+MAX_BLOCKS_PER_APPEND = 100  # PATCH /blocks/{id}/children 1회당 최대 블록 수
 
 
 class NotionFileUploader:
     """Notion File Upload API를 통한 이미지 업로드 관리"""
 
-    def __init__(self, notion_token: str):
+    def __init__(
+        self,
+        notion_token: str,
+        cache: Optional[UploadCache] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        batch_workers: int = DEFAULT_BATCH_WORKERS,
+        part_size: int = DEFAULT_PART_SIZE,
+        part_workers: int = DEFAULT_PART_WORKERS,
+    ):
+        """
+        Args:
+            notion_token: Notion Integration 토큰
+            cache: 업로드 캐시 (None이면 항상 새로 업로드)
+            pool_size: api.notion.com keep-alive 커넥션 풀 크기
+            connect_timeout: TCP/TLS 연결 타임아웃 (초)
+            read_timeout: 응답 대기 타임아웃 (초)
+            rate_limiter: 요청 속도 제한 토큰 버킷 (기본: 초당 3회)
+            max_retries: 429/5xx/네트워크 오류 시 최대 재시도 횟수
+            batch_workers: upload_batch 동시 업로드 스레드 수
+            part_size: multi-part 업로드 파트 크기 (5MB~20MB로 보정)
+            part_workers: multi-part 업로드 시 파일 하나당 동시 전송 파트 수
+        """
         self.token = notion_token
         self.headers = {
             "Authorization": f"Bearer {notion_token}",
             "Notion-Version": NOTION_VERSION,
         }
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.max_retries = max_retries
+        self.batch_workers = max(1, batch_workers)
+        self.part_size = min(max(part_size, MIN_PART_SIZE), MAX_FILE_SIZE)
+        self.part_workers = max(1, part_workers)
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_scope = token_scope(notion_token)
+        self._cached_ids: set[str] = set()  # 이번 세션에 캐시에서 꺼낸 ID (첨부 거부 시 재업로드 대상)
+        self._stats_lock = threading.Lock()
+
+        # 기본 헤더는 세션에 한 번만 설정, 커넥션은 풀에서 재사용
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """커넥션 풀 정리"""
+        self.session.close()
+
+    def __enter__(self) -> "NotionFileUploader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _request(
+        self, method: str, path: str, idempotent: bool = True, **kwargs
+    ) -> requests.Response:
+        """
+        세션으로 Notion API 호출.
+        토큰 버킷으로 속도를 제한하고 429/5xx/네트워크 오류는 재시도한다.
+
+        Args:
+            idempotent: False면 서버가 처리했을 수 있는 5xx/네트워크 오류는 재시도하지 않음
+                        (429는 처리 전 거부이므로 항상 재시도)
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            _rewind_files(kwargs.get("files"))
+
+            try:
+                response = self.session.request(
+                    method, f"{NOTION_API_BASE}{path}", timeout=self.timeout, **kwargs
+                )
+            except requests.RequestException as e:
+                if not idempotent or attempt >= self.max_retries:
+                    raise NotionUploadError(f"Notion API 요청 실패 ({method} {path}): {e}") from e
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            status = response.status_code
+            retryable = status == 429 or (idempotent and status in RETRYABLE_STATUS)
+            if not retryable or attempt >= self.max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else backoff_delay(attempt)
+            if status == 429:
+                # 다른 스레드도 함께 멈추도록 버킷 전체를 일시 중지
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
 
     # ─────────────────────────────────────────────
     # Step 1: File Upload 객체 생성
     # ─────────────────────────────────────────────
-    def _create_file_upload(self, filename: str, content_type: str) -> dict:
-        """File Upload 객체를 생성하고 id와 upload_url을 반환"""
-        response = requests.post(
-            f"{NOTION_API_BASE}/file_uploads",
-            headers={**self.headers, "Content-Type": "application/json"},
-            json={"filename": filename, "content_type": content_type},
-        )
+    def _create_file_upload(
+        self, filename: str, content_type: str, number_of_parts: Optional[int] = None
+    ) -> dict:
+        """File Upload 객체를 생성하고 id와 upload_url을 반환 (number_of_parts면 multi-part)"""
+        payload = {"filename": filename, "content_type": content_type}
+        if number_of_parts:
+            payload.update({"mode": "multi_part", "number_of_parts": number_of_parts})
+
+        response = self._request("POST", "/file_uploads", json=payload)
 
         if response.status_code != 200:
             raise NotionUploadError(
@@ -75,24 +226,46 @@ class NotionFileUploader:
     # ─────────────────────────────────────────────
     # Step 2: 파일 바이너리 전송
     # ─────────────────────────────────────────────
-    def _send_file_content(self, file_upload_id: str, filepath: str, content_type: str) -> dict:
-        """파일 내용을 Notion에 전송 (multipart/form-data)"""
-        filename = os.path.basename(filepath)
+    def _send_file_content(
+        self,
+        file_upload_id: str,
+        filename: str,
+        fileobj: Union[BinaryIO, bytes],
+        content_type: str,
+        part_number: Optional[int] = None,
+    ) -> dict:
+        """
+        파일 내용을 Notion에 전송 (multipart/form-data) — 디스크 파일/메모리 버퍼 공통.
+        part_number가 있으면 multi-part 업로드의 파트 하나 (같은 번호 재전송은 덮어쓰기라
+        실패한 파트만 _request가 재시도한다).
+        """
+        files = {"file": (filename, fileobj, content_type)}
+        response = self._request(
+            "POST",
+            f"/file_uploads/{file_upload_id}/send",
+            files=files,
+            data={"part_number": str(part_number)} if part_number else None,
+        )
 
-        with open(filepath, "rb") as f:
-            files = {"file": (filename, f, content_type)}
-            response = requests.post(
-                f"{NOTION_API_BASE}/file_uploads/{file_upload_id}/send",
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Notion-Version": NOTION_VERSION,
-                },
-                files=files,
+        if response.status_code != 200:
+            part = f" (파트 {part_number})" if part_number else ""
+            raise NotionUploadError(
+                f"파일 전송 실패{part} (HTTP {response.status_code}): {response.text}"
             )
 
+        data = response.json()
+        if part_number is None and data.get("status") != "uploaded":
+            raise NotionUploadError(f"파일 상태 이상: {data.get('status')}")
+
+        return data
+
+    def _complete_file_upload(self, file_upload_id: str) -> dict:
+        """multi-part 업로드 마무리 — 모든 파트 전송 후 호출"""
+        response = self._request("POST", f"/file_uploads/{file_upload_id}/complete")
+
         if response.status_code != 200:
             raise NotionUploadError(
-                f"파일 전송 실패 (HTTP {response.status_code}): {response.text}"
+                f"Multi-part 업로드 완료 실패 (HTTP {response.status_code}): {response.text}"
             )
 
         data = response.json()
@@ -101,6 +274,33 @@ class NotionFileUploader:
 
         return data
 
+    def _send_parts(
+        self, file_upload_id: str, filename: str, buffer, size: int, content_type: str
+    ) -> None:
+        """
+        buffer(mmap 또는 memoryview)를 part_size 단위로 잘라 part_workers개 스레드로 동시 전송.
+        파트는 전송 직전에 잘라내므로 메모리는 (part_size × part_workers) 수준으로 유지된다.
+        한 파트가 최종 실패하면 아직 시작하지 않은 파트는 취소하고 예외를 올린다.
+        """
+        part_count = math.ceil(size / self.part_size)
+
+        def send(part_number: int) -> None:
+            start = (part_number - 1) * self.part_size
+            chunk = bytes(buffer[start:start + self.part_size])
+            self._send_file_content(
+                file_upload_id, filename, chunk, content_type, part_number=part_number
+            )
+
+        with ThreadPoolExecutor(max_workers=min(self.part_workers, part_count)) as pool:
+            futures = [pool.submit(send, n) for n in range(1, part_count + 1)]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
     # ─────────────────────────────────────────────
     # Step 3: 이미지 블록으로 페이지에 첨부
     # ─────────────────────────────────────────────
@@ -111,36 +311,143 @@ class NotionFileUploader:
         caption: str = "",
     ) -> dict:
         """이미지 블록을 페이지에 추가"""
-        caption_rich_text = []
-        if caption:
-            caption_rich_text = [{"type": "text", "text": {"content": caption}}]
-
-        payload = {
-            "children": [
-                {
-                    "type": "image",
-                    "image": {
-                        "type": "file_upload",
-                        "file_upload": {"id": file_upload_id},
-                        "caption": caption_rich_text,
-                    },
-                }
-            ]
-        }
-
-        response = requests.patch(
-            f"{NOTION_API_BASE}/blocks/{page_id}/children",
-            headers={**self.headers, "Content-Type": "application/json"},
-            json=payload,
-        )
+        response = self._append_children(page_id, [self._image_block(file_upload_id, caption)])
 
         if response.status_code != 200:
+            if self.cache and _rejects_file_upload(response, file_upload_id):
+                self.cache.invalidate_id(file_upload_id)
             raise NotionUploadError(
                 f"이미지 블록 첨부 실패 (HTTP {response.status_code}): {response.text}"
             )
 
+        if self.cache:
+            self.cache.mark_attached(file_upload_id)
         return response.json()
 
+    def _append_children(self, page_id: str, blocks: list[dict]) -> requests.Response:
+        """블록 리스트를 한 번의 PATCH로 페이지 끝에 추가"""
+        return self._request(
+            "PATCH",
+            f"/blocks/{page_id}/children",
+            idempotent=False,  # 재전송 시 블록이 중복 추가될 수 있음
+            json={"children": blocks},
+        )
+
+    def append_blocks(
+        self,
+        page_id: str,
+        blocks: list[dict],
+        reupload: Optional[Callable[[str], str]] = None,
+    ) -> list[Optional[str]]:
+        """
+        블록들을 최소한의 PATCH 호출로 페이지에 추가.
+        MAX_BLOCKS_PER_APPEND개씩 묶어 보내고, 묶음이 검증 오류(400)로 거부되면 그 묶음만
+        블록 단위로 재시도한다. 5xx / 429는 이미 반영됐을 수 있어, 401 / 403 / 404는 페이지
+        자체의 문제라 재시도하지 않고 묶음 전체를 실패 처리한다.
+
+        Args:
+            page_id: Notion 페이지 ID
+            blocks: Notion 블록 리스트
+            reupload: 캐시에서 꺼낸 file_upload_id가 거부됐을 때 같은 이미지를 새로 업로드해
+                새 ID를 반환하는 콜백 (거부된 ID를 받음, None이면 재업로드 없이 실패 처리)
+
+        Returns:
+            블록별 에러 메시지 리스트 (None이면 성공, blocks와 같은 순서)
+        """
+        errors: list[Optional[str]] = [None] * len(blocks)
+        fresh_ids: dict[str, str] = {}  # 거부된 캐시 ID → 재업로드한 ID (같은 ID를 쓰는 블록끼리 공유)
+
+        for start in range(0, len(blocks), MAX_BLOCKS_PER_APPEND):
+            chunk = blocks[start:start + MAX_BLOCKS_PER_APPEND]
+            try:
+                response = self._append_children(page_id, chunk)
+            except NotionUploadError as e:
+                # 네트워크 오류는 반영 여부를 알 수 없으므로 개별 재시도 없이 실패 처리
+                for j in range(len(chunk)):
+                    errors[start + j] = str(e)
+                continue
+
+            if response.status_code == 200:
+                self._mark_blocks_attached(chunk)
+                continue
+
+            if response.status_code != 400:
+                # 5xx / 재시도 소진된 429: 반영 여부를 알 수 없음 → 재전송하면 중복 추가될 수 있음
+                # 401 / 403 / 404 등: 페이지 단위 오류라 블록마다 보내도 같은 결과 → 캐시도 유지
+                message = f"블록 첨부 실패 (HTTP {response.status_code}): {response.text}"
+                for j in range(len(chunk)):
+                    errors[start + j] = message
+                continue
+
+            # 묶음 검증 실패(400) → 블록 하나씩 다시 추가해 실패한 블록만 골라냄
+            for j, block in enumerate(chunk):
+                try:
+                    single = self._append_children(page_id, [block])
+                except NotionUploadError as e:
+                    errors[start + j] = str(e)
+                    continue
+
+                if single.status_code == 200:
+                    self._mark_blocks_attached([block])
+                    continue
+
+                errors[start + j] = f"블록 첨부 실패 (HTTP {single.status_code}): {single.text}"
+                file_upload_id = _file_upload_id_of(block)
+                if self.cache and file_upload_id and _rejects_file_upload(single, file_upload_id):
+                    self.cache.invalidate_id(file_upload_id)
+                    if reupload and (file_upload_id in fresh_ids or self._take_cached_id(file_upload_id)):
+                        # 캐시된 ID가 거부됨 → 새로 업로드해 같은 위치에서 한 번 재시도
+                        # (같은 내용의 다른 블록은 재업로드 없이 그 ID를 재사용)
+                        errors[start + j] = self._reattach_fresh(
+                            page_id, block, file_upload_id, reupload, fresh_ids
+                        )
+
+        return errors
+
+    def _take_cached_id(self, file_upload_id: str) -> bool:
+        """캐시에서 꺼낸 ID였는지 (확인과 동시에 목록에서 제거 → 재업로드는 한 번만)"""
+        with self._stats_lock:
+            if file_upload_id in self._cached_ids:
+                self._cached_ids.discard(file_upload_id)
+                return True
+            return False
+
+    def _reattach_fresh(
+        self,
+        page_id: str,
+        block: dict,
+        file_upload_id: str,
+        reupload: Callable[[str], str],
+        fresh_ids: dict[str, str],
+    ) -> Optional[str]:
+        """거부된 캐시 ID 대신 새로 업로드한 ID로 블록 재첨부 (에러 메시지, 성공이면 None)"""
+        try:
+            if file_upload_id not in fresh_ids:
+                fresh_ids[file_upload_id] = reupload(file_upload_id)
+            fresh = self._image_block_with_id(block, fresh_ids[file_upload_id])
+            response = self._append_children(page_id, [fresh])
+        except (NotionUploadError, FileValidationError) as e:
+            return f"캐시된 업로드가 거부되어 재업로드했으나 실패: {e}"
+
+        if response.status_code != 200:
+            return f"블록 첨부 실패 (HTTP {response.status_code}): {response.text}"
+        self._mark_blocks_attached([fresh])
+        return None
+
+    @staticmethod
+    def _image_block_with_id(block: dict, file_upload_id: str) -> dict:
+        """이미지 블록의 file_upload id만 바꾼 사본"""
+        image = {**block["image"], "file_upload": {"id": file_upload_id}}
+        return {**block, "image": image}
+
+    def _mark_blocks_attached(self, blocks: list[dict]) -> None:
+        if not self.cache:
+            return
+        for block in blocks:
+            file_upload_id = _file_upload_id_of(block)
+            if file_upload_id:
+                self.cache.mark_attached(file_upload_id)
+
     # ─────────────────────────────────────────────
     # Public API: 이미지 업로드 (3-Step 통합)
     # ─────────────────────────────────────────────
@@ -148,6 +455,7 @@ class NotionFileUploader:
         """
         로컬 이미지 파일을 Notion에 업로드하고 file_upload_id를 반환.
         이 ID를 사용하여 나중에 페이지에 첨부할 수 있다.
+        캐시에 같은 내용의 유효한 ID가 있으면 업로드 없이 그 ID를 반환한다.
 
         Args:
             filepath: 이미지 파일 경로
@@ -162,15 +470,115 @@ class NotionFileUploader:
         # 파일 검증
         self._validate_file(filepath)
 
+        digest = self._cache_key(file_sha256(filepath)) if self.cache else None
+        cached_id = self._lookup_cache(digest)
+        if cached_id:
+            return cached_id
+
         filename = os.path.basename(filepath)
-        ext = Path(filepath).suffix.lower()
-        content_type = SUPPORTED_IMAGE_TYPES.get(ext, "application/octet-stream")
+        content_type = SUPPORTED_IMAGE_TYPES[Path(filepath).suffix.lower()]
+        size = os.path.getsize(filepath)
+
+        with open(filepath, "rb") as f:
+            if size > MAX_FILE_SIZE:
+                # 파일 전체를 읽지 않고 mmap에서 파트 단위로 잘라 전송
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._upload_multi_part(mm, size, filename, content_type, digest)
+            return self._upload_content(f, filename, content_type, digest)
+
+    def upload_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview, BinaryIO],
+        filename: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        메모리의 이미지(바이트 또는 file-like)를 디스크를 거치지 않고 업로드.
+        page.screenshot() / TerminalRenderer.render_bytes() 결과를 그대로 넘길 수 있다.
+
+        Args:
+            data: 이미지 바이트 또는 read()를 지원하는 바이너리 스트림
+            filename: Notion에 표시될 파일명 (확장자로 포맷 판별)
+            content_type: MIME 타입 (None이면 filename 확장자로 결정)
+
+        Returns:
+            file_upload_id (str)
+
+        Raises:
+            NotionUploadError: 업로드 실패 시
+            FileValidationError: 데이터 검증 실패 시
+        """
+        if hasattr(data, "read"):
+            data = data.read()
+        content_type = self._validate_bytes(data, filename, content_type)
+
+        digest = self._cache_key(bytes_sha256(data)) if self.cache else None
+        cached_id = self._lookup_cache(digest)
+        if cached_id:
+            return cached_id
 
+        size = memoryview(data).nbytes
+        if size > MAX_FILE_SIZE:
+            return self._upload_multi_part(memoryview(data), size, filename, content_type, digest)
+        return self._upload_content(io.BytesIO(data), filename, content_type, digest)
+
+    def _lookup_cache(self, digest: Optional[str]) -> Optional[str]:
+        """캐시에 유효한 file_upload_id가 있으면 반환 (적중/미스 집계)"""
+        if not self.cache or digest is None:
+            return None
+
+        cached_id = self.cache.lookup(digest)
+        with self._stats_lock:
+            if cached_id:
+                self.cache_hits += 1
+                self._cached_ids.add(cached_id)
+            else:
+                self.cache_misses += 1
+        return cached_id
+
+    def _cache_key(self, sha256: str) -> str:
+        """이 통합(토큰)에 한정된 캐시 키"""
+        return scoped_key(self._cache_scope, sha256)
+
+    def _upload_content(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        content_type: str,
+        digest: Optional[str],
+    ) -> str:
+        """File Upload 생성 + 내용 전송 후 캐시에 기록"""
         # Step 1: File Upload 객체 생성
         upload_obj = self._create_file_upload(filename, content_type)
 
         # Step 2: 파일 전송
-        self._send_file_content(upload_obj["id"], filepath, content_type)
+        self._send_file_content(upload_obj["id"], filename, fileobj, content_type)
+
+        if self.cache and digest:
+            self.cache.store(digest, upload_obj["id"], upload_obj["expiry_time"])
+
+        return upload_obj["id"]
+
+    def _upload_multi_part(
+        self,
+        buffer,
+        size: int,
+        filename: str,
+        content_type: str,
+        digest: Optional[str],
+    ) -> str:
+        """MAX_FILE_SIZE 초과 파일: multi-part 생성 → 파트 동시 전송 → complete"""
+        part_count = math.ceil(size / self.part_size)
+
+        # Step 1: multi-part File Upload 객체 생성
+        upload_obj = self._create_file_upload(filename, content_type, number_of_parts=part_count)
+
+        # Step 2: 파트 전송 & 마무리
+        self._send_parts(upload_obj["id"], filename, buffer, size, content_type)
+        self._complete_file_upload(upload_obj["id"])
+
+        if self.cache and digest:
+            self.cache.store(digest, upload_obj["id"], upload_obj["expiry_time"])
 
         return upload_obj["id"]
 
@@ -223,9 +631,9 @@ class NotionFileUploader:
             }
         }
 
-        response = requests.patch(
-            f"{NOTION_API_BASE}/pages/{page_id}",
-            headers={**self.headers, "Content-Type": "application/json"},
+        response = self._request(
+            "PATCH",
+            f"/pages/{page_id}",
             json=payload,
         )
 
@@ -234,8 +642,15 @@ class NotionFileUploader:
                 f"커버 설정 실패 (HTTP {response.status_code}): {response.text}"
             )
 
+        if self.cache:
+            self.cache.mark_attached(file_upload_id)
         return response.json()
 
+    @property
+    def cache_stats(self) -> dict:
+        """업로드 캐시 적중/미스 횟수"""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
     # ─────────────────────────────────────────────
     # Batch: 여러 이미지를 한 페이지에 첨부
     # ─────────────────────────────────────────────
@@ -243,39 +658,92 @@ class NotionFileUploader:
         self,
         images: list[dict],
         page_id: str,
+        section_title: Optional[str] = None,
     ) -> list[dict]:
         """
-        여러 이미지를 순차 업로드하고 페이지에 첨부.
+        여러 이미지를 모두 업로드한 뒤 한꺼번에 페이지에 첨부.
+        업로드는 batch_workers개 스레드가 공유 토큰 버킷 아래에서 병렬 실행하고,
+        첨부는 (헤딩 + 구분선 +) 이미지 블록 전체를 최소한의 PATCH 호출로 보낸다.
 
         Args:
             images: [{"path": str, "caption": str, "type": "main"|"detail"|"terminal"}, ...]
             page_id: Notion 페이지 ID
+            section_title: 있으면 이미지 앞에 섹션 헤딩과 구분선 추가
 
         Returns:
             [{"path": str, "file_upload_id": str, "success": bool, "error": str|None}, ...]
+            (images와 같은 순서)
         """
-        results = []
-
-        for img in images:
+        def upload(img: dict):
             try:
-                file_upload_id = self.upload_image(img["path"])
-                self.attach_image_to_page(page_id, file_upload_id, img.get("caption", ""))
-                results.append({
-                    "path": img["path"],
-                    "file_upload_id": file_upload_id,
-                    "success": True,
-                    "error": None,
-                })
+                return self.upload_image(img["path"]), None
             except (NotionUploadError, FileValidationError) as e:
-                results.append({
-                    "path": img["path"],
-                    "file_upload_id": None,
-                    "success": False,
-                    "error": str(e),
-                })
+                return None, str(e)
+
+        with ThreadPoolExecutor(max_workers=self.batch_workers) as pool:
+            uploads = list(pool.map(upload, images))
+
+        shots = [
+            {"file_upload_id": file_upload_id, "caption": img.get("caption", "")}
+            for img, (file_upload_id, _) in zip(images, uploads)
+            if file_upload_id
+        ]
+
+        # 거부된 캐시 ID → 같은 파일을 새로 업로드 (캐시는 이미 무효화됨)
+        paths = {file_upload_id: img["path"] for img, (file_upload_id, _) in zip(images, uploads) if file_upload_id}
+        replaced: dict[str, str] = {}
+
+        def reupload(file_upload_id: str) -> str:
+            replaced[file_upload_id] = self.upload_image(paths[file_upload_id])
+            return replaced[file_upload_id]
+
+        attach_errors = iter(self.attach_images(page_id, shots, section_title, reupload))
+
+        results = []
+        for img, (file_upload_id, error) in zip(images, uploads):
+            if file_upload_id:
+                error = next(attach_errors)
+                file_upload_id = None if error else replaced.get(file_upload_id, file_upload_id)
+
+            results.append({
+                "path": img["path"],
+                "file_upload_id": file_upload_id,
+                "success": error is None,
+                "error": error,
+            })
 
         return results
 
+    def attach_images(
+        self,
+        page_id: str,
+        shots: list[dict],
+        section_title: Optional[str] = None,
+        reupload: Optional[Callable[[str], str]] = None,
+    ) -> list[Optional[str]]:
+        """
+        업로드된 이미지들을 순서대로 한꺼번에 페이지에 첨부.
+
+        Args:
+            page_id: Notion 페이지 ID
+            shots: [{"file_upload_id": str, "caption": str}, ...]
+            section_title: 있으면 이미지 앞에 섹션 헤딩과 구분선 추가
+            reupload: 거부된 캐시 ID를 새로 업로드하는 콜백 (append_blocks 참고)
+
+        Returns:
+            이미지별 에러 메시지 리스트 (None이면 성공, shots와 같은 순서)
+        """
+        if not shots:
+            return []
+
+        if section_title:
+            blocks = self.build_screenshot_section(shots, section_title)
+        else:
+            blocks = [self._image_block(s["file_upload_id"], s.get("caption", "")) for s in shots]
+
+        errors = self.append_blocks(page_id, blocks, reupload)
+        return errors[len(blocks) - len(shots):]
+
     # ─────────────────────────────────────────────
     # Notion 블록 빌더 (이미지 섹션)
     # ─────────────────────────────────────────────
@@ -309,24 +777,28 @@ class NotionFileUploader:
         blocks.append({"type": "divider", "divider": {}})
 
         for shot in screenshots:
-            blocks.append({
-                "type": "image",
-                "image": {
-                    "type": "file_upload",
-                    "file_upload": {"id": shot["file_upload_id"]},
-                    "caption": [
-                        {
-                            "type": "text",
-                            "text": {"content": shot.get("caption", "")},
-                        }
-                    ]
-                    if shot.get("caption")
-                    else [],
-                },
-            })
+            blocks.append(
+                NotionFileUploader._image_block(shot["file_upload_id"], shot.get("caption", ""))
+            )
 
         return blocks
 
+    @staticmethod
+    def _image_block(file_upload_id: str, caption: str = "") -> dict:
+        """file_upload 이미지 블록"""
+        caption_rich_text = []
+        if caption:
+            caption_rich_text = [{"type": "text", "text": {"content": caption}}]
+
+        return {
+            "type": "image",
+            "image": {
+                "type": "file_upload",
+                "file_upload": {"id": file_upload_id},
+                "caption": caption_rich_text,
+            },
+        }
+
     # ─────────────────────────────────────────────
     # 유틸리티
     # ─────────────────────────────────────────────
@@ -347,15 +819,75 @@ class NotionFileUploader:
                 f"(지원: {', '.join(SUPPORTED_IMAGE_TYPES.keys())})"
             )
 
-        size = path.stat().st_size
-        if size > MAX_FILE_SIZE:
+        self._validate_size(path.stat().st_size, filepath)
+
+    def _validate_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        filename: str,
+        content_type: Optional[str],
+    ) -> str:
+        """메모리 버퍼 유효성 검증 후 content_type 반환"""
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise FileValidationError(f"바이트 데이터가 아님: {type(data).__name__}")
+
+        if content_type is None:
+            ext = Path(filename).suffix.lower()
+            if ext not in SUPPORTED_IMAGE_TYPES:
+                raise FileValidationError(
+                    f"지원하지 않는 이미지 포맷: {ext or filename} "
+                    f"(지원: {', '.join(SUPPORTED_IMAGE_TYPES.keys())})"
+                )
+            content_type = SUPPORTED_IMAGE_TYPES[ext]
+        elif content_type not in SUPPORTED_IMAGE_TYPES.values():
+            raise FileValidationError(f"지원하지 않는 이미지 타입: {content_type}")
+
+        self._validate_size(memoryview(data).nbytes, filename)
+        return content_type
+
+    @staticmethod
+    def _validate_size(size: int, name: str) -> None:
+        # MAX_FILE_SIZE 초과분은 multi-part로 업로드
+        if size > MAX_MULTI_PART_SIZE:
             size_mb = size / (1024 * 1024)
             raise FileValidationError(
-                f"파일 크기 초과: {size_mb:.1f}MB (최대: 20MB)"
+                f"파일 크기 초과: {size_mb:.1f}MB (최대: 5GB)"
             )
 
         if size == 0:
-            raise FileValidationError(f"빈 파일: {filepath}")
+            raise FileValidationError(f"빈 파일: {name}")
+
+
+def _file_upload_id_of(block: dict) -> Optional[str]:
+    """이미지 블록이면 file_upload id 반환"""
+    if block.get("type") != "image":
+        return None
+    return block["image"].get("file_upload", {}).get("id")
+
+
+def _rejects_file_upload(response: requests.Response, file_upload_id: str) -> bool:
+    """
+    첨부 거부 사유가 file_upload 자체(삭제 / 만료 / 이미 사용됨)인지.
+    429 / 5xx / 페이지 권한 오류 등은 업로드와 무관하므로 캐시를 지우지 않는다.
+    """
+    if response.status_code != 400:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    if not isinstance(body, dict) or body.get("code") != "validation_error":
+        return False
+    message = str(body.get("message", ""))
+    return "file_upload" in message or file_upload_id in message
+
+
+def _rewind_files(files: Optional[dict]) -> None:
+    """재시도 전 multipart 파일 객체를 처음 위치로 되돌림"""
+    for value in (files or {}).values():
+        fileobj = value[1] if isinstance(value, tuple) else value
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
 
 
 class NotionUploadError(Exception):
@@ -383,6 +915,6 @@ if __name__ == "__main__":
     image_path = sys.argv[3]
     caption = sys.argv[4] if len(sys.argv) > 4 else ""
 
-    uploader = NotionFileUploader(token)
-    result = uploader.upload_and_attach(image_path, page_id, caption)
+    with NotionFileUploader(token, cache=UploadCache()) as uploader:
+        result = uploader.upload_and_attach(image_path, page_id, caption)
     print(f"✅ 업로드 완료: {result['file_upload_id']}")
@@ -0,0 +1,81 @@
+"""
+Port Allocation
+===============
+앱 실행마다 비어 있는 ephemeral 포트를 할당하고, 기동 후 실제로 그 포트를
+우리 앱 프로세스 그룹이 점유했는지 확인한다.
+
+- find_free_port(): 커널이 고른 빈 포트 (bind 0)
+- listening_ports(pgid): 프로세스 그룹이 LISTEN 중인 TCP 포트 (/proc 기반, Linux 전용)
+  → 다른 프로그램이 같은 포트를 쓰고 있어 엉뚱한 앱을 캡처하는 상황 방지
+
+Usage:
+    port = find_free_port()
+    ...앱 실행 & readiness...
+    owned = listening_ports(os.getpgid(process.pid))
+    if owned is not None and port not in owned:
+        ...다른 프로세스가 응답 중...
+"""
+
+import os
+import socket
+from typing import Iterator, Optional
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """현재 비어 있는 TCP 포트 번호"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def listening_ports(pgid: int) -> Optional[set[int]]:
+    """
+    프로세스 그룹(셸 + 앱 + 자식)이 LISTEN 중인 TCP 포트 집합.
+    /proc가 없는 플랫폼이면 None (확인 불가).
+    """
+    if not os.path.isdir("/proc/self/fd"):
+        return None
+
+    inodes: set[str] = set()
+    for pid in _group_pids(pgid):
+        try:
+            fds = os.listdir(f"/proc/{pid}/fd")
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                link = os.readlink(f"/proc/{pid}/fd/{fd}")
+            except OSError:
+                continue
+            if link.startswith("socket:["):
+                inodes.add(link[len("socket:["):-1])
+
+    ports: set[int] = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                rows = f.read().splitlines()[1:]
+        except OSError:
+            continue
+        for row in rows:
+            cols = row.split()
+            # cols[1]=local_address(hex ip:port), cols[3]=state(0A=LISTEN), cols[9]=inode
+            if len(cols) > 9 and cols[3] == "0A" and cols[9] in inodes:
+                ports.add(int(cols[1].rsplit(":", 1)[1], 16))
+    return ports
+
+
+def _group_pids(pgid: int) -> Iterator[int]:
+    """프로세스 그룹에 속한 pid들"""
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # "pid (comm) state ppid pgrp ..." — comm에 공백/괄호가 있을 수 있어 마지막 ")" 기준
+        fields = stat.rsplit(")", 1)[-1].split()
+        if len(fields) > 2 and int(fields[2]) == pgid:
+            yield int(entry)
@@ -0,0 +1,91 @@
+"""
+Rate Limit
+==========
+Notion API 평균 요청 한도(초당 3회)를 지키기 위한 토큰 버킷과 재시도 유틸리티.
+
+- TokenBucket: 여러 스레드가 공유, acquire()가 토큰이 찰 때까지 블록
+- 429 응답의 Retry-After 동안 pause()로 버킷 전체를 멈춰 모든 스레드가 함께 대기
+- backoff_delay: full-jitter exponential backoff
+
+Usage:
+    bucket = TokenBucket(rate=3.0, capacity=3)
+    bucket.acquire()
+    response = session.post(...)
+    if response.status_code == 429:
+        bucket.pause(parse_retry_after(response.headers.get("Retry-After")) or 1.0)
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+NOTION_RATE_LIMIT = 3.0   # 초당 평균 요청 수
+NOTION_BURST = 3          # 순간 허용 요청 수
+
+BACKOFF_BASE = 0.5        # 초
+BACKOFF_CAP = 30.0        # 초
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float = NOTION_RATE_LIMIT, capacity: int = NOTION_BURST):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 요청한 시간(Retry-After) 동안 모든 요청 중단, 이후 토큰은 비운 상태로 재개"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """attempt번째(0부터) 재시도 전 대기 시간 — full jitter"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP-date) → 대기 초"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,143 @@
+"""
+App Readiness Probe
+===================
+고정 sleep 대신 앱이 실제로 응답할 때까지 폴링한다.
+
+1. TCP 포트가 열릴 때까지 대기
+2. HTTP health URL이 5xx가 아닌 응답을 줄 때까지 대기
+3. 각 시도 사이 exponential backoff, 전체 deadline 초과 시 실패
+4. (선택) ready_event — 앱 로그에서 ready 줄이 보이면(app_logs.LogDrainer) backoff를
+   끊고 즉시 재확인
+
+프레임워크별 probe 설정은 strategies.FRAMEWORK_SIGNATURES의 "readiness" 항목.
+
+Usage:
+    result = wait_until_ready("localhost", 8501, {"health_path": "/_stcore/health", "timeout": 30})
+    if result.ready:
+        print(f"앱 기동: {result.elapsed:.1f}초")
+"""
+
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Optional
+
+
+DEFAULT_PROBE = {
+    "health_path": "/",
+    "timeout": 30.0,        # 전체 deadline (초)
+    "initial_delay": 0.1,   # 첫 재시도 간격 (초)
+    "max_delay": 2.0,       # 재시도 간격 상한 (초)
+}
+
+HTTP_PROBE_TIMEOUT = 2.0  # 개별 HTTP 요청 타임아웃 (초)
+
+
+@dataclass
+class ReadinessResult:
+    """앱 readiness 대기 결과"""
+    ready: bool
+    elapsed: float              # 대기 시작부터 응답까지 걸린 시간 (초)
+    stage: str                  # "http" | "tcp" | "exited" | "timeout"
+    error: Optional[str] = None
+    log_ready: bool = False     # ready 로그 줄을 감지해 backoff 없이 확인했는지
+
+
+def wait_until_ready(
+    host: str,
+    port: int,
+    probe: Optional[dict] = None,
+    process=None,
+    ready_event: Optional[threading.Event] = None,
+) -> ReadinessResult:
+    """
+    앱이 TCP + HTTP로 응답할 때까지 exponential backoff로 폴링.
+
+    Args:
+        host: 앱 호스트
+        port: 앱 포트
+        probe: readiness 설정 (health_path, timeout, initial_delay, max_delay)
+        process: subprocess.Popen — 대기 중 종료되면 즉시 실패 처리
+        ready_event: 앱이 ready 로그를 출력하면 set되는 이벤트 (LogDrainer.ready)
+
+    Returns:
+        ReadinessResult
+    """
+    probe = {**DEFAULT_PROBE, **(probe or {})}
+    start = time.monotonic()
+    deadline = start + probe["timeout"]
+    delay = probe["initial_delay"]
+    stage = "tcp"
+    last_error = None
+    log_ready = False
+
+    while True:
+        if process is not None and process.poll() is not None:
+            return ReadinessResult(
+                ready=False, elapsed=time.monotonic() - start, stage="exited",
+                error=f"앱 프로세스 종료 (exit code {process.returncode})",
+            )
+
+        if stage == "tcp":
+            if _tcp_open(host, port):
+                stage = "http"
+            else:
+                last_error = f"포트 {port} 응답 없음"
+
+        if stage == "http":
+            ok, last_error = _http_ok(host, port, probe["health_path"])
+            if ok:
+                return ReadinessResult(
+                    ready=True, elapsed=time.monotonic() - start, stage="http",
+                    log_ready=log_ready,
+                )
+
+        now = time.monotonic()
+        if now >= deadline:
+            return ReadinessResult(
+                ready=False, elapsed=now - start, stage="timeout",
+                error=f"{probe['timeout']:.0f}초 내 응답 없음 ({last_error})",
+            )
+
+        wait = min(delay, deadline - now)
+        if ready_event is not None and not log_ready:
+            if ready_event.wait(wait):
+                # ready 로그 → 남은 backoff를 건너뛰고 바로 확인, 이후엔 짧은 간격부터 재시작
+                log_ready = True
+                delay = probe["initial_delay"]
+                continue
+        else:
+            time.sleep(wait)
+        delay = min(delay * 2, probe["max_delay"])
+
+
+def is_healthy(host: str, port: int, health_path: str = DEFAULT_PROBE["health_path"]) -> bool:
+    """이미 떠 있는 앱이 지금 응답하는지 한 번만 확인 (재사용 전 health check)"""
+    return _tcp_open(host, port) and _http_ok(host, port, health_path)[0]
+
+
+def _tcp_open(host: str, port: int) -> bool:
+    """TCP 연결이 가능한지 확인"""
+    try:
+        with socket.create_connection((host, port), timeout=1.0):
+            return True
+    except OSError:
+        return False
+
+
+def _http_ok(host: str, port: int, path: str) -> tuple[bool, Optional[str]]:
+    """health URL이 5xx가 아닌 응답을 주는지 확인"""
+    url = f"http://{host}:{port}{path}"
+    try:
+        with urllib.request.urlopen(url, timeout=HTTP_PROBE_TIMEOUT) as response:
+            return response.status < 500, None
+    except urllib.error.HTTPError as e:
+        # 404 등은 서버가 떠 있다는 뜻이므로 ready로 간주
+        if e.code < 500:
+            return True, None
+        return False, f"HTTP {e.code}"
+    except (urllib.error.URLError, OSError) as e:
+        return False, str(e)
@@ -0,0 +1,193 @@
+"""
+Render Cache
+============
+렌더링된 터미널 이미지를 디스크에 보관해, 같은 내용을 다시 그릴 때 래스터화 + 인코딩을 생략한다.
+
+- 키: 호출자가 만든 해시 (TerminalRenderer는 잘린 텍스트 / 제목 / 너비 / 테마 / 인코더 설정 /
+  렌더러 버전으로 계산)
+- hit 시 캐시 파일을 output_path에 hardlink (다른 파일시스템이면 복사), 메모리 렌더링이면 바이트 반환
+- 전체 크기가 max_bytes를 넘으면 mtime이 오래된 파일부터 삭제 (hit마다 mtime 갱신 → LRU)
+- 쓰기는 임시 파일 + os.replace → 여러 프로세스(batch)가 같은 디렉토리를 공유해도 안전
+- hit / miss / 저장 / 삭제 건수 집계
+- 디렉토리는 첫 저장 때 생성, 디렉토리를 만들거나 쓸 수 없으면 경고 후 캐시 비활성화
+  (렌더링은 캐시 없이 계속)
+
+Usage:
+    cache = RenderCache()
+    if not cache.link(key, "out.png"):
+        data = ...렌더링...
+        cache.put(key, data)
+    print(cache.stats.summary())
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+
+DEFAULT_RENDER_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "notion-project-upload", "renders"
+)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB — 터미널 이미지 수천 장
+
+
+@dataclass
+class RenderCacheStats:
+    """캐시 조회 / 저장 집계"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def since(self, earlier: "RenderCacheStats") -> "RenderCacheStats":
+        """earlier 시점 이후의 증가분 (실행 단위 집계용)"""
+        return RenderCacheStats(
+            hits=self.hits - earlier.hits,
+            misses=self.misses - earlier.misses,
+            stores=self.stores - earlier.stores,
+            evictions=self.evictions - earlier.evictions,
+        )
+
+    def summary(self) -> str:
+        line = f"hit {self.hits}건 / miss {self.misses}건"
+        return f"{line} (삭제 {self.evictions}건)" if self.evictions else line
+
+
+class RenderCache:
+    """키 → 이미지 바이트 디스크 캐시 (크기 제한 LRU)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_RENDER_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = RenderCacheStats()
+        self.disabled = False  # 캐시 디렉토리에 쓸 수 없어 캐시를 끈 상태
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # 첫 저장 때 디렉토리를 훑어 계산
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 이미지 바이트 (없으면 None)"""
+        if self.disabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self._record(hit=False)
+            return None
+        self._touch(path)
+        self._record(hit=True)
+        return data
+
+    def link(self, key: str, output_path: str) -> bool:
+        """
+        캐시된 이미지를 output_path에 hardlink (실패하면 복사). 없으면 False.
+        miss는 집계하지 않는다 — 이어지는 get()/put()이 집계.
+        """
+        path = self._path(key)
+        if self.disabled or not os.path.isfile(path):
+            return False
+
+        staging = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            try:
+                os.link(path, staging)
+            except OSError:
+                shutil.copyfile(path, staging)  # 다른 파일시스템(tmpfs workspace 등)
+            os.replace(staging, output_path)
+        except OSError:
+            # 그 사이 eviction으로 사라졌거나 output 경로에 쓸 수 없음 → 렌더링으로 진행
+            if os.path.exists(staging):
+                os.unlink(staging)
+            return False
+
+        self._touch(path)
+        self._record(hit=True)
+        return True
+
+    def put(self, key: str, data: bytes) -> None:
+        """이미지 저장 후 max_bytes를 넘으면 오래된 항목 삭제"""
+        if self.disabled or len(data) > self.max_bytes:
+            return
+        staging = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, staging = tempfile.mkstemp(prefix=".staging-", dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(staging, self._path(key))
+            with self._lock:
+                if self._size is None:
+                    self._size = sum(size for _, _, size in self._entries())  # 방금 저장한 파일 포함
+                else:
+                    self._size += len(data)
+                self.stats.stores += 1
+                if self._size > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            if staging and os.path.exists(staging):
+                os.unlink(staging)
+            self._disable(e)
+
+    def _disable(self, error: OSError) -> None:
+        """캐시 디렉토리를 쓸 수 없음 → 경고 한 번 출력 후 캐시 없이 진행"""
+        with self._lock:
+            if self.disabled:
+                return
+            self.disabled = True
+        print(f"  ⚠️ 렌더 캐시를 쓸 수 없어 캐시 없이 진행: {self.cache_dir} ({error})")
+
+    def _evict(self) -> None:
+        """실제 디렉토리 크기로 다시 계산 후 오래 안 쓴 것부터 삭제 (lock 안에서 호출)"""
+        entries = sorted(self._entries())  # (mtime, path, size) — 다른 프로세스의 파일 포함
+        size = sum(entry_size for _, _, entry_size in entries)
+        for _, path, entry_size in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+            self.stats.evictions += 1
+        self._size = size
+
+    def _entries(self) -> list[tuple[float, str, int]]:
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.startswith(".staging-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, entry.path, st.st_size))
+        return entries
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """LRU 순서 갱신"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
@@ -0,0 +1,88 @@
+"""
+Selector Cache
+==============
+ELEMENT 캡처에서 실제로 매칭된 셀렉터를 프레임워크별로 기억한다.
+다음 실행에서는 지난번에 이긴 셀렉터(예: Dash의 ".plotly",
+Streamlit의 "[data-testid=stMetric]")를 후보 목록의 맨 앞으로 올려 먼저 시도한다.
+
+- 저장 형식: {"dash": [".plotly", ...], "streamlit": [...]}  (최근 매칭 순)
+- 저장 시 디스크 내용과 병합 후 원자적 교체(os.replace) → 배치 워커 프로세스 간 공유 가능
+- record()는 파일을 읽고 쓰는 blocking 호출 → 이벤트 루프에서는 asyncio.to_thread로 호출
+
+Usage:
+    cache = SelectorCache()
+    candidates = cache.order("dash", [".js-plotly-plot", ".plotly", "#graph"])
+    ...
+    cache.record("dash", ".plotly")
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+
+DEFAULT_SELECTOR_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "notion-project-upload", "selector_winners.json"
+)
+MAX_WINNERS_PER_FRAMEWORK = 20
+
+
+class SelectorCache:
+    """프레임워크별 최근 매칭 셀렉터 캐시 (JSON 파일)"""
+
+    def __init__(self, path: str = DEFAULT_SELECTOR_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._winners: dict[str, list[str]] = self._load()
+
+    def order(self, framework: Optional[str], candidates: list[str]) -> list[str]:
+        """후보 셀렉터를 지난 매칭 순으로 재정렬 (모르는 후보는 원래 순서 유지)"""
+        if not framework:
+            return list(candidates)
+
+        with self._lock:
+            winners = self._winners.get(framework, [])
+        rank = {selector: i for i, selector in enumerate(winners)}
+        return sorted(candidates, key=lambda s: rank.get(s, len(rank)))
+
+    def record(self, framework: Optional[str], selector: str) -> None:
+        """매칭된 셀렉터를 해당 프레임워크의 맨 앞으로 기록하고 저장"""
+        if not framework:
+            return
+
+        with self._lock:
+            winners = self._winners.get(framework, [])
+            if winners[:1] == [selector]:
+                return
+
+            # 다른 프로세스가 기록한 내용과 병합
+            self._winners = {**self._winners, **self._load()}
+            winners = [selector] + [s for s in self._winners.get(framework, []) if s != selector]
+            self._winners[framework] = winners[:MAX_WINNERS_PER_FRAMEWORK]
+            self._save()
+
+    def _load(self) -> dict[str, list[str]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: [s for s in v if isinstance(s, str)] for k, v in data.items() if isinstance(v, list)}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".selector-", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._winners, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # 읽기 전용 환경 등 — 캐시는 최적화일 뿐이므로 이번 실행 메모리에만 유지
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -0,0 +1,155 @@
+"""
+Visual Stability Wait
+=====================
+고정 wait_seconds 대신 페이지가 "시각적으로 멈출 때"까지만 기다린다.
+
+페이지 안에서 판단 (스크린샷 프레임 비교보다 저렴):
+- MutationObserver: 마지막 DOM 변경 시각
+- requestAnimationFrame 래핑: canvas 차트처럼 DOM 변경 없이 그리는 애니메이션 감지
+- document.getAnimations(): 진행 중인 유한 CSS/Web 애니메이션 (무한 스피너는 제외)
+- document.fonts.status: 웹폰트 로딩 완료
+- 프레임워크별 busy 셀렉터 (예: Streamlit 실행 중 표시)가 화면에 없을 것
+
+위 조건이 모두 만족된 상태로 quiet_ms 동안 변화가 없으면 안정 상태로 판단.
+
+대기 상한(stability timeout)은 고정 대기와 다르다: 안정되면 바로 진행하고, 상한을 넘기면
+안정 판단 없이 그대로 캡처한다. 계속 움직이는 페이지(rAF 루프, 무한 애니메이션)는 항상
+상한까지 기다리므로 상한은 CaptureItem.wait_seconds(기본 3초)로 짧게 두고,
+프레임워크 프로필의 timeout은 그보다 더 줄이는 데만 쓴다 (둘 중 작은 값).
+
+프레임워크별 기본값은 strategies.FRAMEWORK_SIGNATURES의 "stability" 항목.
+
+Usage:
+    profile = StabilityProfile.from_framework(framework)
+    await install_stability_probe(page)          # goto 전에
+    await page.goto(url)
+    result = await wait_for_stable(page, max_seconds=3, profile=profile)
+"""
+
+import time
+from dataclasses import dataclass, fields
+from typing import Optional
+
+
+DEFAULT_QUIET_MS = 500   # 이 시간 동안 변화가 없으면 안정
+STABILITY_POLL_MS = 100  # 안정 조건 폴링 간격
+
+# 문서 생성 시점에 설치 — 이후 모든 DOM 변경 / rAF 요청 시각을 기록
+STABILITY_INIT_JS = """
+(() => {
+  if (window.__captureStability) return;
+  const state = { lastMutation: performance.now(), lastFrame: 0 };
+  window.__captureStability = state;
+
+  new MutationObserver(() => { state.lastMutation = performance.now(); })
+    .observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+
+  const raf = window.requestAnimationFrame.bind(window);
+  window.requestAnimationFrame = (callback) => {
+    state.lastFrame = performance.now();
+    return raf(callback);
+  };
+})();
+"""
+
+STABILITY_CHECK_JS = """
+({ quietMs, busySelectors }) => {
+  const state = window.__captureStability;
+  if (!state) return true;  // probe 미설치 → 판단 불가, 대기하지 않음
+  if (document.readyState !== "complete") return false;
+  if (document.fonts && document.fonts.status !== "loaded") return false;
+
+  for (const selector of busySelectors) {
+    let elements;
+    try {
+      elements = document.querySelectorAll(selector);
+    } catch (e) {
+      continue;
+    }
+    for (const el of elements) {
+      const rect = el.getBoundingClientRect();
+      if (rect.width > 0 && rect.height > 0) return false;
+    }
+  }
+
+  const now = performance.now();
+  const animating = document.getAnimations && document.getAnimations().some(
+    (a) => a.playState === "running" && a.effect &&
+           a.effect.getComputedTiming().iterations !== Infinity
+  );
+  if (animating) {
+    state.lastMutation = now;
+    return false;
+  }
+  return now - Math.max(state.lastMutation, state.lastFrame) >= quietMs;
+}
+"""
+
+
+@dataclass
+class StabilityProfile:
+    """안정화 판단 설정"""
+    busy_selectors: tuple = ()          # 화면에 보이는 동안은 로딩 중으로 간주
+    quiet_ms: int = DEFAULT_QUIET_MS
+    timeout: Optional[float] = None     # 프레임워크별 대기 상한 (초, max_seconds보다 짧을 때만 적용)
+
+    @classmethod
+    def from_framework(cls, framework: Optional[dict]) -> "StabilityProfile":
+        """detect_framework() 결과의 "stability" 기본값으로 프로필 생성"""
+        overrides = dict((framework or {}).get("stability", {}))
+        if "busy_selectors" in overrides:
+            overrides["busy_selectors"] = tuple(overrides["busy_selectors"])
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in overrides.items() if k in known})
+
+
+@dataclass
+class StabilityResult:
+    """안정화 대기 결과"""
+    stable: bool      # False면 상한(max_seconds)까지 기다린 뒤 진행
+    elapsed: float
+
+
+async def install_stability_probe(page) -> None:
+    """페이지 이동 전에 호출 — 이후 로드되는 문서마다 변경 추적 스크립트 설치"""
+    await page.add_init_script(STABILITY_INIT_JS)
+
+
+async def wait_for_stable(
+    page,
+    max_seconds: float,
+    profile: Optional[StabilityProfile] = None,
+) -> StabilityResult:
+    """
+    페이지가 안정될 때까지 대기 (최대 max_seconds).
+
+    Args:
+        page: Playwright Page (install_stability_probe 후 로드된 페이지)
+        max_seconds: 대기 상한 (초) — CaptureItem.wait_seconds
+        profile: busy 셀렉터 / quiet 시간 / 프레임워크별 상한 (max_seconds보다 짧을 때만 적용)
+
+    Returns:
+        StabilityResult
+    """
+    from playwright.async_api import Error as PlaywrightError
+
+    profile = profile or StabilityProfile()
+    if profile.timeout is not None:
+        max_seconds = min(max_seconds, profile.timeout)
+    start = time.monotonic()
+    if max_seconds <= 0:
+        return StabilityResult(stable=False, elapsed=0.0)
+
+    try:
+        await page.wait_for_function(
+            STABILITY_CHECK_JS,
+            arg={"quietMs": profile.quiet_ms, "busySelectors": list(profile.busy_selectors)},
+            polling=STABILITY_POLL_MS,
+            timeout=max_seconds * 1000,
+        )
+        stable = True
+    except PlaywrightError:
+        # 상한 초과(TimeoutError) 또는 대기 중 재이동 → 안정 판단 없이 그대로 캡처
+        stable = False
+
+    return StabilityResult(stable=stable, elapsed=time.monotonic() - start)
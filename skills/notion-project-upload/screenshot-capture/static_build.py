@@ -0,0 +1,224 @@
+"""
+Static Build Serving
+====================
+React/Vite 프로젝트를 개발 서버(npm start, HMR) 대신 프로덕션 빌드로 캡처한다.
+
+- npm run build를 한 번 실행하고 결과(dist/ build/ out/)를 캐시 디렉토리에 보관
+- 캐시 키: lockfile 내용 + 소스 fingerprint → 바뀌지 않은 프로젝트는 빌드 생략
+- 의존성 설치는 package-lock.json이 있을 때 npm ci만 사용 — lockfile 없이 node_modules도 없으면
+  npm install이 사용자 프로젝트의 lockfile / node_modules를 바꾸므로 정적 빌드를 건너뜀
+- 빌드 결과는 프로세스 내 ThreadingHTTPServer로 빈 포트에서 서빙 (127.0.0.1)
+  (확장자 없는 경로는 index.html로 fallback → client-side routing 지원)
+- 프로젝트별로 최신 빌드 하나만 남기고 이전 빌드는 삭제
+
+Usage:
+    cache = BuildCache()
+    build = cache.get_or_build("/path/to/project", source_hash)
+    site = StaticSiteServer(build.root)
+    print(site.url)
+    site.stop()
+"""
+
+import functools
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+
+DEFAULT_BUILD_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "notion-project-upload", "builds"
+)
+DEFAULT_BUILD_TIMEOUT = 600.0  # 초 — 의존성 설치 / 빌드 각각의 제한 시간
+
+STATIC_BUILD_FRAMEWORKS = ("react",)  # 정적 빌드로 서빙할 수 있는 프레임워크
+LOCKFILES = ("package-lock.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb")
+BUILD_OUTPUT_DIRS = ("dist", "build", "out")  # Vite / CRA / Next export
+BUILD_LOG_LINES = 15  # 빌드 실패 시 에러 메시지에 붙일 출력 줄 수
+
+
+class StaticBuildError(Exception):
+    """빌드 스크립트가 없거나 실패, 또는 결과물(index.html)을 찾지 못함"""
+    pass
+
+
+@dataclass
+class BuildResult:
+    """정적 빌드 결과"""
+    root: str        # index.html이 있는 캐시된 빌드 디렉토리
+    cached: bool     # 이전 빌드를 재사용했는지
+    elapsed: float   # 빌드(또는 캐시 조회)에 걸린 시간 (초)
+
+
+class BuildCache:
+    """프로젝트별 프로덕션 빌드 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_BUILD_CACHE_DIR,
+        build_timeout: float = DEFAULT_BUILD_TIMEOUT,
+    ):
+        self.cache_dir = cache_dir
+        self.build_timeout = build_timeout
+
+    def get_or_build(self, project_path: str, source_hash: str) -> BuildResult:
+        """
+        캐시된 빌드를 반환하거나, 없으면 빌드 후 캐시에 저장.
+
+        Args:
+            project_path: package.json이 있는 프로젝트 루트
+            source_hash: 소스 fingerprint (app_supervisor.source_fingerprint)
+
+        Raises:
+            StaticBuildError
+        """
+        start = time.monotonic()
+        project_dir = os.path.join(
+            self.cache_dir, hashlib.sha256(os.path.realpath(project_path).encode()).hexdigest()[:16]
+        )
+        target = os.path.join(project_dir, build_key(project_path, source_hash))
+
+        if os.path.isfile(os.path.join(target, "index.html")):
+            return BuildResult(root=target, cached=True, elapsed=time.monotonic() - start)
+
+        output = self._build(project_path)
+
+        # 임시 디렉토리에 복사 후 이름 교체 → 다른 프로세스가 반쯤 복사된 빌드를 보지 않음
+        os.makedirs(project_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=project_dir)
+        try:
+            shutil.copytree(output, staging, dirs_exist_ok=True)
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isfile(os.path.join(target, "index.html")):
+                raise
+
+        self._prune(project_dir, keep=os.path.basename(target))
+        return BuildResult(root=target, cached=False, elapsed=time.monotonic() - start)
+
+    def _build(self, project_path: str) -> str:
+        """의존성 설치(필요 시) + npm run build, 빌드 결과 디렉토리 반환"""
+        try:
+            with open(os.path.join(project_path, "package.json"), encoding="utf-8") as f:
+                scripts = json.load(f).get("scripts", {})
+        except (OSError, ValueError) as e:
+            raise StaticBuildError(f"package.json 읽기 실패: {e}")
+        if "build" not in scripts:
+            raise StaticBuildError("package.json에 build 스크립트 없음")
+
+        if not os.path.isdir(os.path.join(project_path, "node_modules")):
+            # npm ci는 lockfile을 고치지 않아 다음 캐시 키가 유지됨. lockfile이 없으면 npm install이
+            # 사용자 작업 트리에 package-lock.json / node_modules를 만들므로 설치하지 않고 포기
+            if not os.path.exists(os.path.join(project_path, "package-lock.json")):
+                raise StaticBuildError("node_modules와 package-lock.json이 없음 — npm install은 프로젝트를 변경하므로 생략")
+            self._run("npm ci", project_path)
+
+        started = time.time()
+        self._run("npm run build", project_path)
+
+        # 이번 빌드에서 갱신된 결과 디렉토리 (여러 개면 가장 최근 것)
+        candidates = [
+            os.path.join(project_path, name) for name in BUILD_OUTPUT_DIRS
+            if os.path.isfile(os.path.join(project_path, name, "index.html"))
+        ]
+        fresh = [p for p in candidates if os.path.getmtime(os.path.join(p, "index.html")) >= started - 1]
+        if not candidates:
+            raise StaticBuildError(f"빌드 결과(index.html) 없음: {', '.join(BUILD_OUTPUT_DIRS)}")
+        return max(fresh or candidates, key=lambda p: os.path.getmtime(os.path.join(p, "index.html")))
+
+    def _run(self, command: str, project_path: str) -> None:
+        try:
+            completed = subprocess.run(
+                command,
+                shell=True,
+                cwd=project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, "BROWSER": "none"},
+                timeout=self.build_timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise StaticBuildError(f"'{command}' {self.build_timeout:.0f}초 초과")
+        if completed.returncode != 0:
+            output = completed.stdout.decode(errors="replace").strip().splitlines()
+            tail = "\n".join(output[-BUILD_LOG_LINES:])
+            raise StaticBuildError(f"'{command}' 실패 (exit code {completed.returncode})\n{tail}")
+
+    @staticmethod
+    def _prune(project_dir: str, keep: str) -> None:
+        """프로젝트의 이전 빌드 삭제 (최신 빌드만 유지)"""
+        for name in os.listdir(project_dir):
+            if name != keep and not name.startswith(".staging-"):
+                shutil.rmtree(os.path.join(project_dir, name), ignore_errors=True)
+
+
+def build_key(project_path: str, source_hash: str) -> str:
+    """빌드 캐시 키 — 소스 fingerprint + lockfile 내용 해시"""
+    digest = hashlib.sha256(source_hash.encode())
+    for name in LOCKFILES:
+        path = os.path.join(project_path, name)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                digest.update(name.encode() + b"\0" + hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:32]
+
+
+# ─────────────────────────────────────────────
+# 정적 서버
+# ─────────────────────────────────────────────
+class _SpaRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """없는 경로 중 확장자가 없는 것(/dashboard 등)은 index.html로 응답"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.exists(path) and not os.path.splitext(urlparse(self.path).path)[1]:
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args) -> None:
+        pass  # 요청마다 stderr에 찍지 않음
+
+
+class StaticSiteServer:
+    """빌드 디렉토리를 서빙하는 프로세스 내 HTTP 서버 (daemon 스레드)"""
+
+    def __init__(self, root: str, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            root: 서빙할 디렉토리 (index.html 포함)
+            host: bind 주소
+            port: 0이면 커널이 빈 포트 할당
+        """
+        self.root = root
+        self.host = host
+        handler = functools.partial(_SpaRequestHandler, directory=root)
+        self._httpd = http.server.ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self.port: int = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name=f"static-site-{self.port}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        # bind한 주소 그대로 — localhost가 ::1로 먼저 풀리는 호스트에서도 같은 소켓으로 연결
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """서버 종료 (진행 중 요청은 daemon 스레드에서 마무리)"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join(timeout=5)
@@ -7,8 +7,10 @@ Capture Strategies
 핵심 원칙: "면접관이 10초 안에 파악하고 싶은 것"
 """
 
+import json
 import os
 import re
+import shlex
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -43,7 +45,14 @@ class Priority(Enum):
 
 @dataclass
 class CaptureItem:
-    """개별 캡처 항목"""
+    """
+    개별 캡처 항목
+
+    wait_seconds는 고정 대기 시간이 아니라 화면 안정화 대기(stability.wait_for_stable)의 상한.
+    보통은 안정되는 즉시 촬영하지만, rAF 루프 / 계속 도는 애니메이션이 있는 페이지는
+    안정 상태에 도달하지 못해 항상 상한까지 기다리므로 짧게 유지한다.
+    FRAMEWORK_SIGNATURES의 stability.timeout은 이 값을 더 줄일 수만 있다 (늘리려면 wait_seconds).
+    """
     name: str                     # 캡처 식별자 (예: "main_dashboard")
     description: str              # 설명 (예: "대시보드 메인 화면")
     method: CaptureMethod
@@ -54,7 +63,7 @@ class CaptureItem:
     url: Optional[str] = None     # 웹앱 URL
     selector: Optional[str] = None  # CSS 셀렉터 (element 캡처 시)
     command: Optional[str] = None   # 터미널 명령 (terminal 캡처 시)
-    wait_seconds: int = 3         # 캡처 전 대기 시간
+    wait_seconds: int = 3         # 안정화 대기 상한 (초) — 고정 대기가 아님, 아래 참고
     viewport: tuple = (1280, 720)
 
 
@@ -71,61 +80,105 @@ class CaptureStrategy:
 # 프레임워크 감지
 # ─────────────────────────────────────────────
 
+# 포트를 인자로 받지 않는 Python 앱(app.run(port=5000) 등)을 지정 포트로 띄우는 래퍼
+LAUNCH_WRAPPER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launch_wrapper.py")
+
+# launch_cmd: {file}=엔트리 파일, {port}=실행마다 할당되는 빈 포트, {wrapper}=LAUNCH_WRAPPER
+#   포트 주입 방식 — CLI 플래그(streamlit, Vite), PORT 환경변수(CRA / Next), 래퍼(flask/gradio/dash)
+#   react는 package.json scripts를 보고 _js_launch_cmd()가 실제 명령을 고른다
+# readiness: 앱 기동 확인 probe (readiness.wait_until_ready 참고)
+#   health_path — TCP 포트가 열린 뒤 폴링할 HTTP 경로
+#   timeout     — 기동 대기 deadline (초)
+#   ready_patterns — 기동 완료를 알리는 앱 로그 정규식 (app_logs.LogDrainer)
+# network: 캡처 브라우저 요청 차단 기본값 (network_profile.NetworkProfile 필드)
+# stability: 화면 안정화 판단 기본값 (stability.StabilityProfile 필드)
+#   busy_selectors — 보이는 동안은 아직 로딩/실행 중으로 보는 요소
+#   timeout        — 프레임워크별 대기 상한 (초, CaptureItem.wait_seconds보다 짧을 때만 적용)
 FRAMEWORK_SIGNATURES = {
     "streamlit": {
         "file_patterns": ["app.py", "main.py", "dashboard.py", "streamlit_app.py"],
         "code_patterns": [r"import\s+streamlit", r"st\.", r"streamlit"],
         "requirements_patterns": ["streamlit"],
-        "port": 8501,
         "launch_cmd": "streamlit run {file} --server.headless true --server.port {port}",
-        "wait_seconds": 5,
+        "readiness": {
+            "health_path": "/_stcore/health",
+            "timeout": 30,
+            "ready_patterns": [r"You can now view"],
+        },
+        "network": {"block_hosts": ["data.streamlit.io", "webhooks.fivetran.com"]},
+        "stability": {
+            "busy_selectors": [
+                '[data-testid="stStatusWidget"]',
+                '[data-testid="stSpinner"]',
+                '[data-testid="stSkeleton"]',
+            ],
+        },
     },
     "react": {
         "file_patterns": ["package.json"],
         "code_patterns": [r'"react"', r'"next"', r'"vite"'],
         "requirements_patterns": [],
-        "port": 3000,
-        "launch_cmd": "npm start",
-        "wait_seconds": 10,
+        "launch_cmd": "npm start",  # scripts에 start가 없거나 package.json을 못 읽을 때 기본값
+        "readiness": {
+            "health_path": "/",
+            "timeout": 60,
+            # Vite / CRA / Next.js 개발 서버
+            "ready_patterns": [r"Local:\s+https?://", r"Compiled successfully", r"Ready in"],
+        },
+        "network": {},
+        "stability": {},
     },
     "flask": {
         "file_patterns": ["app.py", "main.py", "server.py"],
         "code_patterns": [r"from\s+flask", r"import\s+flask", r"Flask\("],
         "requirements_patterns": ["flask"],
-        "port": 5000,
-        "launch_cmd": "python {file}",
-        "wait_seconds": 3,
+        "launch_cmd": "python {wrapper} flask {port} {file}",
+        "readiness": {"health_path": "/", "timeout": 20, "ready_patterns": [r"Running on https?://"]},
+        "network": {},
+        "stability": {},
     },
     "gradio": {
         "file_patterns": ["app.py", "main.py", "demo.py"],
         "code_patterns": [r"import\s+gradio", r"gr\."],
         "requirements_patterns": ["gradio"],
-        "port": 7860,
-        "launch_cmd": "python {file}",
-        "wait_seconds": 5,
+        "launch_cmd": "python {wrapper} gradio {port} {file}",
+        "readiness": {"health_path": "/", "timeout": 60, "ready_patterns": [r"Running on local URL"]},
+        "network": {"block_hosts": ["api.gradio.app"]},
+        "stability": {"busy_selectors": [".pending", ".generating", ".eta-bar"]},
     },
     "dash": {
         "file_patterns": ["app.py", "main.py", "dashboard.py"],
         "code_patterns": [r"import\s+dash", r"from\s+dash"],
         "requirements_patterns": ["dash"],
-        "port": 8050,
-        "launch_cmd": "python {file}",
-        "wait_seconds": 5,
+        "launch_cmd": "python {wrapper} dash {port} {file}",
+        "readiness": {
+            "health_path": "/_dash-layout",
+            "timeout": 30,
+            "ready_patterns": [r"Dash is running on", r"Running on https?://"],
+        },
+        "network": {"block_media": True},
+        "stability": {"busy_selectors": ['[data-dash-is-loading="true"]', "._dash-loading"]},
     },
 }
 
 
-def detect_framework(project_path: str) -> Optional[dict]:
+def detect_framework(project_path: str, port: Optional[int] = None) -> Optional[dict]:
     """
     프로젝트 디렉토리를 스캔하여 웹 프레임워크를 감지.
 
+    Args:
+        project_path: 프로젝트 루트 디렉토리
+        port: 고정 포트 (None이면 실행할 때마다 빈 포트를 할당 — 병렬 실행 가능)
+
     Returns:
         {
             "framework": "streamlit",
             "entry_file": "/path/to/app.py",
-            "port": 8501,
-            "launch_cmd": "streamlit run app.py ...",
-            "wait_seconds": 5,
+            "port": None,  # 고정 포트를 지정한 경우에만 값
+            "launch_template": "streamlit run app.py ... --server.port {port}",
+            "readiness": {"health_path": "/_stcore/health", "timeout": 30, "ready_patterns": [...]},
+            "network": {"block_hosts": [...]},
+            "stability": {"busy_selectors": [...]},
         }
         또는 None (감지 실패)
     """
@@ -151,12 +204,12 @@ def detect_framework(project_path: str) -> Optional[dict]:
             if any(pat in req_content.lower() for pat in fw_config["requirements_patterns"]):
                 entry_file = _find_entry_file(project, fw_config, fw_name)
                 if entry_file:
-                    return _build_framework_result(fw_name, fw_config, entry_file)
+                    return _build_framework_result(fw_name, fw_config, entry_file, port)
 
         # package.json에서 확인 (JS 프레임워크)
         if fw_name == "react" and pkg_content:
             if any(re.search(pat, pkg_content) for pat in fw_config["code_patterns"]):
-                return _build_framework_result(fw_name, fw_config, str(pkg_path))
+                return _build_framework_result(fw_name, fw_config, str(pkg_path), port)
 
         # 소스 파일에서 직접 확인
         for filename in fw_config["file_patterns"]:
@@ -164,7 +217,7 @@ def detect_framework(project_path: str) -> Optional[dict]:
             if filepath.exists():
                 content = filepath.read_text(errors="ignore")
                 if any(re.search(pat, content) for pat in fw_config["code_patterns"]):
-                    return _build_framework_result(fw_name, fw_config, str(filepath))
+                    return _build_framework_result(fw_name, fw_config, str(filepath), port)
 
     return None
 
@@ -180,18 +233,53 @@ def _find_entry_file(project: Path, fw_config: dict, fw_name: str) -> Optional[s
     return None
 
 
-def _build_framework_result(fw_name: str, fw_config: dict, entry_file: str) -> dict:
+def _build_framework_result(
+    fw_name: str, fw_config: dict, entry_file: str, port: Optional[int] = None
+) -> dict:
+    launch_cmd = fw_config["launch_cmd"]
+    if fw_name == "react":
+        launch_cmd = _js_launch_cmd(entry_file, launch_cmd)
     return {
         "framework": fw_name,
         "entry_file": entry_file,
-        "port": fw_config["port"],
-        "launch_cmd": fw_config["launch_cmd"].format(
-            file=entry_file, port=fw_config["port"]
+        "port": port,
+        # {port}만 남겨 둔 실행 명령 — launch_command()로 실제 포트를 채운다
+        "launch_template": launch_cmd.format(
+            file=shlex.quote(entry_file), wrapper=shlex.quote(LAUNCH_WRAPPER), port="{port}"
         ),
-        "wait_seconds": fw_config["wait_seconds"],
+        "readiness": dict(fw_config["readiness"]),
+        "network": dict(fw_config.get("network", {})),
+        "stability": dict(fw_config.get("stability", {})),
     }
 
 
+def _js_launch_cmd(package_json: str, default: str) -> str:
+    """
+    package.json scripts에서 개발 서버 명령 선택 (start → dev 순).
+    Vite는 PORT 환경변수를 무시하고 5173에 뜨므로 --port / --strictPort를 인자로 넘긴다
+    (CRA / Next.js는 PORT 환경변수를 따름).
+    """
+    try:
+        scripts = json.loads(Path(package_json).read_text(errors="ignore")).get("scripts") or {}
+    except (OSError, ValueError, AttributeError):
+        return default
+
+    for name in ("start", "dev"):
+        script = scripts.get(name)
+        if not isinstance(script, str):
+            continue
+        cmd = "npm start" if name == "start" else f"npm run {name}"
+        if re.search(r"\bvite\b", script):
+            return f"{cmd} -- --port {{port}} --strictPort"
+        return cmd
+    return default
+
+
+def launch_command(framework: dict, port: int) -> str:
+    """detect_framework() 결과의 실행 명령에 포트를 채운다"""
+    return framework["launch_template"].replace("{port}", str(port))
+
+
 # ─────────────────────────────────────────────
 # 유형별 캡처 전략 템플릿
 # ─────────────────────────────────────────────
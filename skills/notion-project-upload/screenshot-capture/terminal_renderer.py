@@ -7,15 +7,58 @@ Catppuccin Mocha 테마 기반 HTML 생성 → Playwright로 캡처.
 Usage:
     renderer = TerminalRenderer()
     renderer.render("$ python main.py\n✅ Complete!", "output.png", title="실행 결과")
+
+    # output_path 생략 시 workspace 안에 저장
+    renderer = TerminalRenderer(workspace=CaptureWorkspace())
+    path = renderer.render("$ make run", title="실행 결과")
+
+    # 파일 없이 이미지 바이트만 (Notion upload_bytes로 바로 전달)
+    png = renderer.render_bytes("$ make run", title="실행 결과")
+
+    # lossless WebP + 인코딩 시간/크기 확인
+    renderer = TerminalRenderer(encoder=ImageEncoder(format="webp"))
+    data = renderer.render_bytes("$ make run")
+    print(renderer.last_encoding.size, renderer.last_encoding.elapsed)
+
+    # 같은 텍스트/제목/너비/테마/인코더면 디스크 캐시에서 재사용 (hardlink)
+    renderer = TerminalRenderer(cache=RenderCache())
+    renderer.render("$ make run", "out.png", title="실행 결과")
+    print(renderer.cache.stats.summary())
+
+폰트와 창 테두리(헤더·트래픽 라이트·라운드 박스)는 프로세스 전역 LRU 캐시에서 재사용 →
+여러 장을 렌더링할 때 비용은 대부분 본문 텍스트 그리기.
+본문은 기본적으로 glyph atlas(NumPy)로 그리고, 사용할 수 없으면 줄마다 draw.text
+(engine="pillow"로 강제 가능, 두 경로의 결과는 픽셀 동일).
+인코딩은 테마 색 + 안티에일리어싱 중간색 팔레트로 indexed PNG(또는 lossless WebP) —
+마지막 인코딩의 포맷 / 크기 / 시간은 last_encoding에 남는다.
+cache(RenderCache)를 주면 잘린 텍스트 기준으로 렌더링 결과를 재사용 — 반복 실행(batch)에서
+같은 데모/보일러플레이트 출력은 래스터화·인코딩 없이 파일 링크만.
 """
 
+if __name__ == "__main__" and not __package__:
+    # 디렉토리 이름에 하이픈이 있어 -m 실행이 불가 → 스크립트 실행 시 패키지로 등록
+    import importlib
+    import sys
+    from pathlib import Path as _Path
+
+    sys.path.insert(0, str(_Path(__file__).resolve().parent.parent))
+    __package__ = _Path(__file__).resolve().parent.name
+    importlib.import_module(__package__)
+
+import functools
+import hashlib
 import html
-import os
+import json
 import re
-import subprocess
 from pathlib import Path
 from typing import Optional
 
+from .command_output import run_command
+from .glyph_atlas import GlyphAtlas
+from .image_encoding import EncodedImage, ImageEncoder, PALETTE_SIZE
+from .render_cache import RenderCache
+from .workspace import CaptureWorkspace
+
 
 # ─────────────────────────────────────────────
 # Catppuccin Mocha 컬러 팔레트
@@ -38,18 +81,79 @@ CATPPUCCIN = {
     "overlay0": "#6c7086",
 }
 
+THEMES = {"catppuccin": CATPPUCCIN}
+
+
+# ─────────────────────────────────────────────
+# Pillow 레이아웃 (px)
+# ─────────────────────────────────────────────
+LINE_HEIGHT = 24
+PADDING_X = 28
+PADDING_Y = 24
+HEADER_HEIGHT = 44
+DOT_RADIUS = 6
+CORNER_RADIUS = 12
+IMG_PADDING = 24  # 터미널 박스 바깥 여백
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+FONT_BOLD_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf"
+FONT_SIZE = 14
+TITLE_FONT_SIZE = 13
+
+FONT_CACHE_SIZE = 16   # (폰트 파일, 크기) 조합 수
+CHROME_CACHE_SIZE = 8  # (너비, 테마) 조합 수
+
+# 본문 렌더링 엔진: auto(atlas 가능하면 atlas) / atlas / pillow(줄마다 draw.text)
+RENDER_ENGINES = ("auto", "atlas", "pillow")
+
+# 렌더링 결과(픽셀/레이아웃/팔레트)가 바뀌는 수정을 하면 올림 → 이전 렌더 캐시 무효화
+RENDER_CACHE_VERSION = 1
+
+SEPARATOR_LINE = re.compile(r"^[-─═]{3,}")
+
+# indexed 인코딩 팔레트의 안티에일리어싱 ramp — (배경, 전경) 테마 색 쌍
+# 본문 글자(base 위), 타이틀·트래픽 라이트·테두리(mantle 위), 박스 외곽선
+PALETTE_RAMPS = (
+    *(("base", fg) for fg in ("text", "green", "red", "yellow", "blue", "overlay0")),
+    *(("mantle", fg) for fg in ("overlay0", "red", "green", "yellow", "surface0", "base")),
+    ("base", "surface0"),
+)
+
 
 class TerminalRenderer:
     """터미널 출력을 스타일이 적용된 이미지로 렌더링"""
 
-    def __init__(self, theme: str = "catppuccin"):
-        self.colors = CATPPUCCIN
+    def __init__(
+        self,
+        theme: str = "catppuccin",
+        workspace: Optional[CaptureWorkspace] = None,
+        engine: str = "auto",
+        encoder: Optional[ImageEncoder] = None,
+        cache: Optional[RenderCache] = None,
+    ):
+        """
+        Args:
+            theme: 컬러 테마 (THEMES)
+            workspace: output_path 생략 시 이미지를 저장할 workspace
+            engine: 본문 렌더링 엔진 (RENDER_ENGINES)
+            encoder: 이미지 인코더 (None이면 팔레트 PNG, compress_level 6)
+            cache: 렌더링 결과 디스크 캐시 (None이면 매번 렌더링)
+        """
+        if engine not in RENDER_ENGINES:
+            raise ValueError(f"지원하지 않는 렌더링 엔진: {engine} ({', '.join(RENDER_ENGINES)})")
+        self.engine = engine
+        self.theme = theme if theme in THEMES else "catppuccin"
+        self.colors = THEMES[self.theme]
+        self.workspace = workspace
+        self.encoder = encoder or ImageEncoder()
+        self.cache = cache
+        self.last_encoding: Optional[EncodedImage] = None  # 캐시 hit이면 None
         self.font_family = "'JetBrains Mono', 'Fira Code', 'Cascadia Code', 'Consolas', monospace"
 
     def render(
         self,
         text: str,
-        output_path: str,
+        output_path: Optional[str] = None,
         title: str = "Terminal",
         max_lines: int = 50,
         width: int = 820,
@@ -59,7 +163,7 @@ class TerminalRenderer:
 
         Args:
             text: 터미널 출력 텍스트
-            output_path: 출력 이미지 경로
+            output_path: 출력 이미지 경로 (None이면 workspace 안에 생성)
             title: 터미널 창 제목
             max_lines: 최대 라인 수 (초과 시 잘림)
             width: 이미지 너비 (px)
@@ -67,76 +171,162 @@ class TerminalRenderer:
         Returns:
             출력 파일 경로
         """
-        # 텍스트 전처리
+        output_path = self._resolve_output_path(output_path, title)
         text = self._truncate_lines(text, max_lines)
 
-        # Pillow로 직접 렌더링
-        self._render_with_pillow(text, output_path, title, width)
+        # 캐시 hit이면 바이트를 읽지 않고 캐시 파일을 링크
+        key = self._cache_key(text, title, width)
+        if key and self.cache.link(key, output_path):
+            self.last_encoding = None
+            return output_path
 
+        self._write(output_path, self._rasterize(text, title, width))
         return output_path
 
+    def render_bytes(
+        self,
+        text: str,
+        title: str = "Terminal",
+        max_lines: int = 50,
+        width: int = 820,
+    ) -> bytes:
+        """
+        터미널 텍스트를 이미지 바이트로 렌더링 (파일을 쓰지 않음, 포맷은 encoder 설정).
+
+        Args:
+            text: 터미널 출력 텍스트
+            title: 터미널 창 제목
+            max_lines: 최대 라인 수 (초과 시 잘림)
+            width: 이미지 너비 (px)
+
+        Returns:
+            이미지 바이트 (PNG 또는 WebP)
+        """
+        # 텍스트 전처리
+        text = self._truncate_lines(text, max_lines)
+
+        return self._rasterize(text, title, width)
+
     def render_command(
         self,
         command: str,
-        output_path: str,
+        output_path: Optional[str] = None,
         title: str = "Terminal",
         cwd: str = None,
         timeout: int = 60,
         max_lines: int = 50,
+        in_memory: bool = False,
     ) -> dict:
         """
         명령을 실행하고 결과를 이미지로 렌더링.
+        출력은 스트리밍으로 읽으며 이미지에 들어갈 앞/뒤 줄만 보관한다
+        (stdout / stderr는 도착 순서대로 섞임, 타임아웃이면 그때까지의 출력 + 타임아웃 표시).
 
         Args:
             command: 실행할 명령
-            output_path: 출력 이미지 경로
+            output_path: 출력 이미지 경로 (None이면 workspace 안에 생성)
             title: 터미널 창 제목
             cwd: 작업 디렉토리
             timeout: 실행 타임아웃 (초)
-            max_lines: 최대 라인 수
+            max_lines: 최대 라인 수 ("$ 명령" 줄 포함, 초과 시 앞/뒤 절반만)
+            in_memory: True면 파일을 쓰지 않고 "data"(이미지 바이트)만 반환 ("path"는 "")
 
         Returns:
-            {"path": str, "stdout": str, "stderr": str, "returncode": int}
+            {"path": str, "data": bytes, "stdout": str, "stderr": str, "returncode": int,
+             "omitted_lines": int, "timed_out": bool, "format": str, "size": int,
+             "encode_seconds": float, "cached": bool}
+            stdout / stderr는 보관된(이미지에 그려진) 줄만 담는다.
         """
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=cwd,
-            )
+        if not in_memory:
+            output_path = self._resolve_output_path(output_path, title)
+
+        # "$ 명령" 줄 + 출력 head가 앞 절반, tail ring buffer가 나머지
+        half = max_lines // 2
+        head_lines = max(0, half - 1)
+        result = run_command(
+            command,
+            cwd=cwd,
+            timeout=timeout,
+            head_lines=head_lines,
+            tail_lines=max(0, max_lines - 1 - head_lines),
+        )
+
+        lines = [f"$ {command}"] + [line for _, line in result.head]
+        tail = [line for _, line in result.tail]
+        if result.omitted:
+            shown = tail[len(tail) - half:] if half else []
+            lines.append(self._omitted_marker(result.omitted + len(tail) - len(shown)))
+            lines.extend(shown)
+        else:
+            lines.extend(tail)
+        if result.timed_out:
+            lines.append(f"⏱ Timeout after {timeout}s")
+
+        # 이미 max_lines에 맞춰 잘렸으므로 render_bytes의 재절단 없이 렌더링
+        data = self._rasterize("\n".join(lines), title)
+        if not in_memory:
+            self._write(output_path, data)
+
+        return {
+            "path": "" if in_memory else output_path,
+            "data": data,
+            "stdout": result.text("stdout"),
+            "stderr": result.text("stderr") or (f"Timeout after {timeout}s" if result.timed_out else ""),
+            "returncode": result.returncode,
+            "omitted_lines": result.omitted,
+            "timed_out": result.timed_out,
+            "format": self.encoder.format,
+            "size": len(data),
+            "encode_seconds": self.last_encoding.elapsed if self.last_encoding else 0.0,
+            "cached": self.last_encoding is None,
+        }
+
+    def _resolve_output_path(self, output_path: Optional[str], title: str) -> str:
+        """output_path가 없으면 workspace(없으면 새로 생성)에서 경로 할당"""
+        if output_path:
+            return output_path
+        if self.workspace is None:
+            self.workspace = CaptureWorkspace()
+        return self.workspace.path_for(title, suffix=self.encoder.suffix)
+
+    def _rasterize(self, text: str, title: str, width: int = 820) -> bytes:
+        """잘린 텍스트 → 이미지 바이트 (캐시에 있으면 캐시에서, 없으면 렌더링 후 저장)"""
+        key = self._cache_key(text, title, width)
+        if key:
+            data = self.cache.get(key)
+            if data is not None:
+                self.last_encoding = None
+                return data
+
+        data = self._encode(self._render_with_pillow(text, title, width))
+        if key:
+            self.cache.put(key, data)
+        return data
+
+    def _cache_key(self, text: str, title: str, width: int) -> Optional[str]:
+        """렌더 캐시 키 — 출력 바이트를 결정하는 입력 전부 (캐시 미사용이면 None)"""
+        if self.cache is None:
+            return None
+        encoder = self.encoder
+        parts = [
+            RENDER_CACHE_VERSION, text, title, width, self.theme,
+            encoder.format, encoder.compress_level, encoder.palette,
+        ]
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
 
-            output = ""
-            if result.stdout:
-                output += result.stdout
-            if result.stderr:
-                if output:
-                    output += "\n"
-                output += result.stderr
-
-            # 명령어 프롬프트 추가
-            display_text = f"$ {command}\n{output}"
-
-            self.render(display_text, output_path, title, max_lines)
-
-            return {
-                "path": output_path,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-            }
-
-        except subprocess.TimeoutExpired:
-            error_text = f"$ {command}\n⏱ Timeout after {timeout}s"
-            self.render(error_text, output_path, title)
-            return {
-                "path": output_path,
-                "stdout": "",
-                "stderr": f"Timeout after {timeout}s",
-                "returncode": -1,
-            }
+    def _encode(self, img) -> bytes:
+        """테마 팔레트로 인코딩하고 결과 통계를 last_encoding에 기록"""
+        self.last_encoding = self.encoder.encode(img, terminal_palette(self.theme))
+        return self.last_encoding.data
+
+    @staticmethod
+    def _write(output_path: str, data: bytes) -> None:
+        """렌더링된 이미지를 파일로 저장 (output 디렉토리 생성 포함)"""
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 이전 render가 렌더 캐시 파일을 hardlink했을 수 있음 → 덮어쓰면 캐시가 바뀌므로 먼저 unlink
+        path.unlink(missing_ok=True)
+        path.write_bytes(data)
 
     # ─────────────────────────────────────────────
     # HTML 빌더
@@ -306,9 +496,13 @@ class TerminalRenderer:
             return text
 
         half = max_lines // 2
-        truncated = lines[:half] + [f"\n... ({len(lines) - max_lines} lines omitted) ...\n"] + lines[-half:]
+        truncated = lines[:half] + [self._omitted_marker(len(lines) - max_lines)] + lines[-half:]
         return "\n".join(truncated)
 
+    @staticmethod
+    def _omitted_marker(count: int) -> str:
+        return f"\n... ({count} lines omitted) ...\n"
+
     # ─────────────────────────────────────────────
     # 이미지 렌더링 (Pillow 기반)
     # ─────────────────────────────────────────────
@@ -320,90 +514,26 @@ class TerminalRenderer:
         pass  # render()에서 직접 호출
 
     def _render_with_pillow(
-        self, text: str, output_path: str, title: str = "Terminal", width: int = 820
-    ) -> None:
-        """Pillow로 터미널 스타일 이미지 직접 렌더링"""
-        from PIL import Image, ImageDraw, ImageFont
+        self, text: str, title: str = "Terminal", width: int = 820
+    ) -> "Image.Image":
+        """Pillow로 터미널 스타일 이미지 직접 렌더링 (인코딩/저장은 호출자 몫)"""
+        from PIL import ImageDraw
 
         c = self.colors
-
-        # 폰트 설정
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
-        ]
-        try:
-            font = ImageFont.truetype(font_paths[0], 14)
-            font_bold = ImageFont.truetype(font_paths[1], 14)
-            font_title = ImageFont.truetype(font_paths[0], 13)
-        except (OSError, IndexError):
-            font = ImageFont.load_default()
-            font_bold = font
-            font_title = font
+        font, font_bold, font_title = terminal_fonts()
 
         # 텍스트 라인 분석
         lines = text.split("\n")
-        line_height = 24
-        padding_x = 28
-        padding_y = 24
-        header_height = 44
-        dot_radius = 6
-        corner_radius = 12
-
-        # 이미지 크기 계산
-        content_height = len(lines) * line_height + padding_y * 2
-        total_height = header_height + content_height
-        img_padding = 24
-
-        img_width = width + img_padding * 2
-        img_height = total_height + img_padding * 2
-
-        # 이미지 생성
-        img = Image.new("RGB", (img_width, img_height), self._hex_to_rgb(c["mantle"]))
+        content_height = len(lines) * LINE_HEIGHT + PADDING_Y * 2
+        total_height = HEADER_HEIGHT + content_height
+
+        # 캐시된 창 테두리를 높이에 맞춰 붙인 캔버스
+        img = chrome_template(width, self.theme).render(total_height + IMG_PADDING * 2)
         draw = ImageDraw.Draw(img)
 
-        # 터미널 박스 (rounded rect)
-        box_x = img_padding
-        box_y = img_padding
+        box_x = IMG_PADDING
         box_w = width
-        box_h = total_height
-
-        # 배경 (rounded rectangle)
-        draw.rounded_rectangle(
-            [box_x, box_y, box_x + box_w, box_y + box_h],
-            radius=corner_radius,
-            fill=self._hex_to_rgb(c["base"]),
-            outline=self._hex_to_rgb(c["surface0"]),
-            width=1,
-        )
-
-        # 헤더 영역 배경
-        draw.rounded_rectangle(
-            [box_x, box_y, box_x + box_w, box_y + header_height],
-            radius=corner_radius,
-            fill=self._hex_to_rgb(c["mantle"]),
-        )
-        # 헤더 하단 직선 부분 채우기 (코너 아래)
-        draw.rectangle(
-            [box_x, box_y + corner_radius, box_x + box_w, box_y + header_height],
-            fill=self._hex_to_rgb(c["mantle"]),
-        )
-        # 헤더 구분선
-        draw.line(
-            [box_x, box_y + header_height, box_x + box_w, box_y + header_height],
-            fill=self._hex_to_rgb(c["surface0"]),
-            width=1,
-        )
-
-        # 트래픽 라이트 dots
-        dot_y = box_y + header_height // 2
-        dot_colors = [c["red"], c["green"], c["yellow"]]
-        for i, color in enumerate(dot_colors):
-            cx = box_x + 20 + i * 22
-            draw.ellipse(
-                [cx - dot_radius, dot_y - dot_radius, cx + dot_radius, dot_y + dot_radius],
-                fill=self._hex_to_rgb(color),
-            )
+        dot_y = IMG_PADDING + HEADER_HEIGHT // 2
 
         # 타이틀
         title_bbox = draw.textbbox((0, 0), title, font=font_title)
@@ -416,40 +546,56 @@ class TerminalRenderer:
             font=font_title,
         )
 
-        # 본문 텍스트
-        content_y = box_y + header_height + padding_y
-        for i, line in enumerate(lines):
-            y = content_y + i * line_height
-            color, use_bold = self._get_line_style(line)
-            f = font_bold if use_bold else font
+        # 본문 텍스트 — atlas로 한 번에 붙이고, atlas로 못 그린 줄만 draw.text
+        content_y = IMG_PADDING + HEADER_HEIGHT + PADDING_Y
+        styles = [self._get_line_style(line) for line in lines]
+        pending = range(len(lines))
+        atlas = self._atlas()
+        if atlas is not None:
+            pending = atlas.draw(
+                img,
+                lines,
+                [use_bold for _, use_bold in styles],
+                [self._hex_to_rgb(color) for color, _ in styles],
+                box_x + PADDING_X,
+                content_y,
+            )
+
+        for i in pending:
+            color, use_bold = styles[i]
             draw.text(
-                (box_x + padding_x, y),
-                line,
+                (box_x + PADDING_X, content_y + i * LINE_HEIGHT),
+                lines[i],
                 fill=self._hex_to_rgb(color),
-                font=f,
+                font=font_bold if use_bold else font,
             )
 
-        # output 디렉토리 생성 & 저장
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        img.save(output_path, "PNG", optimize=True)
+        return img
+
+    def _atlas(self) -> Optional[GlyphAtlas]:
+        """본문용 glyph atlas (engine="pillow"이거나 사용 불가면 None)"""
+        if self.engine == "pillow":
+            return None
+        return terminal_atlas()
 
     def _get_line_style(self, line: str) -> tuple[str, bool]:
         """라인 내용에 따라 색상과 볼드 여부 결정"""
         c = self.colors
+        lower = line.lower()
 
         if line.startswith("$ "):
             return c["green"], True
-        elif any(line.startswith(ch) for ch in ["✅", "✓", "⭐"]) or "complete" in line.lower() or "success" in line.lower():
+        elif line.startswith(("✅", "✓", "⭐")) or "complete" in lower or "success" in lower:
             return c["green"], False
-        elif any(line.startswith(ch) for ch in ["❌", "✗", "⛔"]) or "error" in line.lower() or "fail" in line.lower():
+        elif line.startswith(("❌", "✗", "⛔")) or "error" in lower or "fail" in lower:
             return c["red"], False
-        elif any(line.startswith(ch) for ch in ["⚠", "⚡"]) or "warning" in line.lower():
+        elif line.startswith(("⚠", "⚡")) or "warning" in lower:
             return c["yellow"], False
-        elif any(line.startswith(ch) for ch in ["ℹ", "📊", "📈", "📉", "🔍"]) or line.startswith("INFO"):
+        elif line.startswith(("ℹ", "📊", "📈", "📉", "🔍", "INFO")):
             return c["blue"], False
         elif line.startswith("#"):
             return c["overlay0"], False
-        elif re.match(r"^[-─═]{3,}", line):
+        elif SEPARATOR_LINE.match(line):
             return c["overlay0"], False
         else:
             return c["text"], False
@@ -457,8 +603,149 @@ class TerminalRenderer:
     @staticmethod
     def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         """#RRGGBB → (R, G, B)"""
-        h = hex_color.lstrip("#")
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
+
+
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    h = hex_color.lstrip("#")
+    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+
+
+# ─────────────────────────────────────────────
+# 렌더링 리소스 캐시 (프로세스 전역, LRU)
+# ─────────────────────────────────────────────
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(path: str, size: int):
+    """폰트 파일/크기 조합별로 프로세스에서 한 번만 로딩"""
+    from PIL import ImageFont
+
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def terminal_fonts() -> tuple:
+    """(본문, 볼드, 타이틀) 폰트 — DejaVu Sans Mono가 없으면 Pillow 기본 폰트"""
+    from PIL import ImageFont
+
+    try:
+        return (
+            load_font(FONT_PATH, FONT_SIZE),
+            load_font(FONT_BOLD_PATH, FONT_SIZE),
+            load_font(FONT_PATH, TITLE_FONT_SIZE),
+        )
+    except OSError:
+        font = ImageFont.load_default()
+        return font, font, font
+
+
+@functools.lru_cache(maxsize=1)
+def terminal_atlas() -> Optional[GlyphAtlas]:
+    """본문 폰트의 glyph atlas (프로세스 전역, 글리프는 처음 쓰일 때 추가)"""
+    font, font_bold, _ = terminal_fonts()
+    return GlyphAtlas.build(font, font_bold, LINE_HEIGHT)
+
+
+@functools.lru_cache(maxsize=len(THEMES))
+def terminal_palette(theme: str = "catppuccin") -> tuple:
+    """
+    테마의 indexed 인코딩 팔레트 — 테마 색 전부 + PALETTE_RAMPS 쌍마다 균등 간격 중간색.
+    테마 색은 정확히 보존되고 글자 가장자리는 가장 가까운 ramp 색으로 매핑된다.
+    """
+    c = THEMES[theme]
+    colors = list(dict.fromkeys(_hex_to_rgb(v) for v in c.values()))
+    steps = (PALETTE_SIZE - len(colors)) // len(PALETTE_RAMPS)
+    for bg_name, fg_name in PALETTE_RAMPS:
+        bg, fg = _hex_to_rgb(c[bg_name]), _hex_to_rgb(c[fg_name])
+        for k in range(1, steps + 1):
+            a = k / (steps + 1)
+            colors.append(tuple(round(b + (f - b) * a) for b, f in zip(bg, fg)))
+    return tuple(colors)
+
+
+class ChromeTemplate:
+    """
+    미리 그려 둔 창 테두리 조각 — 위(여백 + 헤더 + 구분선), 본문 1줄, 아래(라운드 코너 + 여백).
+    render(height)는 본문 줄을 세로로 늘려 세 조각을 붙인다 (직접 그린 것과 픽셀 동일).
+    """
+
+    def __init__(self, top, middle, bottom):
+        self.top = top
+        self.middle = middle
+        self.bottom = bottom
+
+    def render(self, height: int):
+        """높이 height의 새 캔버스 (캐시된 조각은 변경하지 않음)"""
+        from PIL import Image
+
+        body = height - self.top.height - self.bottom.height
+        if body < 0:
+            raise ValueError(f"창 높이가 너무 작음: {height}px")
+        img = Image.new("RGB", (self.top.width, height))
+        img.paste(self.top, (0, 0))
+        if body:
+            img.paste(self.middle.resize((self.middle.width, body), Image.NEAREST), (0, self.top.height))
+        img.paste(self.bottom, (0, height - self.bottom.height))
+        return img
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def chrome_template(width: int, theme: str = "catppuccin") -> ChromeTemplate:
+    """(너비, 테마)별 창 테두리 템플릿 — 최소 높이로 한 번 그린 뒤 잘라서 보관"""
+    from PIL import Image, ImageDraw
+
+    c = THEMES[theme]
+    # 위/아래 조각 사이에 본문 줄이 최소 1px 남는 높이
+    top_h = IMG_PADDING + HEADER_HEIGHT + 1
+    bottom_h = IMG_PADDING + CORNER_RADIUS + 2
+    box_h = top_h + bottom_h - IMG_PADDING * 2 + 1
+    img_w = width + IMG_PADDING * 2
+    img_h = box_h + IMG_PADDING * 2
+
+    img = Image.new("RGB", (img_w, img_h), _hex_to_rgb(c["mantle"]))
+    draw = ImageDraw.Draw(img)
+    box_x = box_y = IMG_PADDING
+
+    # 터미널 박스 (rounded rect)
+    draw.rounded_rectangle(
+        [box_x, box_y, box_x + width, box_y + box_h],
+        radius=CORNER_RADIUS,
+        fill=_hex_to_rgb(c["base"]),
+        outline=_hex_to_rgb(c["surface0"]),
+        width=1,
+    )
+
+    # 헤더 영역 배경
+    draw.rounded_rectangle(
+        [box_x, box_y, box_x + width, box_y + HEADER_HEIGHT],
+        radius=CORNER_RADIUS,
+        fill=_hex_to_rgb(c["mantle"]),
+    )
+    # 헤더 하단 직선 부분 채우기 (코너 아래)
+    draw.rectangle(
+        [box_x, box_y + CORNER_RADIUS, box_x + width, box_y + HEADER_HEIGHT],
+        fill=_hex_to_rgb(c["mantle"]),
+    )
+    # 헤더 구분선
+    draw.line(
+        [box_x, box_y + HEADER_HEIGHT, box_x + width, box_y + HEADER_HEIGHT],
+        fill=_hex_to_rgb(c["surface0"]),
+        width=1,
+    )
+
+    # 트래픽 라이트 dots
+    dot_y = box_y + HEADER_HEIGHT // 2
+    for i, color in enumerate([c["red"], c["green"], c["yellow"]]):
+        cx = box_x + 20 + i * 22
+        draw.ellipse(
+            [cx - DOT_RADIUS, dot_y - DOT_RADIUS, cx + DOT_RADIUS, dot_y + DOT_RADIUS],
+            fill=_hex_to_rgb(color),
+        )
+
+    return ChromeTemplate(
+        top=img.crop((0, 0, img_w, top_h)),
+        middle=img.crop((0, top_h, img_w, top_h + 1)),
+        bottom=img.crop((0, img_h - bottom_h, img_w, img_h)),
+    )
 
 
 # ─────────────────────────────────────────────
@@ -467,12 +754,12 @@ class TerminalRenderer:
 if __name__ == "__main__":
     import sys
 
-    renderer = TerminalRenderer()
+    renderer = TerminalRenderer(workspace=CaptureWorkspace(keep=True))
 
     if len(sys.argv) > 1 and sys.argv[1] == "--command":
         cmd = sys.argv[2] if len(sys.argv) > 2 else "echo 'Hello World!'"
-        result = renderer.render_command(cmd, "/tmp/terminal_test.png", title="Test")
-        print(f"✅ 캡처 완료: {result['path']}")
+        result = renderer.render_command(cmd, title="Test")
+        print(f"✅ 캡처 완료: {result['path']} ({result['size']:,} bytes, 인코딩 {result['encode_seconds'] * 1000:.0f}ms)")
     else:
         sample = """$ python analyze.py --dataset aws_costs.csv
 📊 Loading dataset: aws_costs.csv (12,345 rows)
@@ -491,5 +778,6 @@ Total Savings:  $8,340.00/month
 ✅ Analysis complete! Report saved to /output/report.html
 ✅ Dashboard updated at http://localhost:8501"""
 
-        renderer.render(sample, "/tmp/terminal_test.png", title="AWS Cost Analysis")
-        print("✅ 테스트 이미지 생성: /tmp/terminal_test.png")
+        path = renderer.render(sample, title="AWS Cost Analysis")
+        encoding = renderer.last_encoding
+        print(f"✅ 테스트 이미지 생성: {path} ({encoding.size:,} bytes, 인코딩 {encoding.elapsed * 1000:.0f}ms)")
@@ -0,0 +1,169 @@
+"""
+Upload Cache
+============
+(통합 토큰, 파일 내용의 SHA-256) → Notion file_upload_id 매핑을 로컬 SQLite에 보관한다.
+내용이 같은 이미지를 다시 올릴 때 create/send 두 번의 HTTP 왕복과 업로드 바이트를 생략.
+file upload는 만든 통합에서만 첨부할 수 있으므로 키 앞에 토큰 해시(scope)를 붙여
+같은 캐시 파일을 여러 통합이 공유해도 서로의 ID를 받지 않는다.
+
+유효성 규칙:
+- status "attached"  : 한 번 첨부된 file upload는 재첨부 가능 → 만료 없음
+- status "uploaded"  : 첨부 전이면 expiry_time까지만 유효 (여유 EXPIRY_MARGIN 적용)
+
+캐시는 선택 기능 — open_upload_cache()는 HOME이 읽기 전용인 환경 등에서 열기에 실패하면
+경고만 출력하고 None(캐시 미사용)을 반환한다.
+
+Usage:
+    cache = open_upload_cache()  # 또는 UploadCache() (실패 시 예외)
+    key = scoped_key(token_scope(notion_token), file_sha256("main.png"))
+    file_upload_id = cache.lookup(key)
+    if file_upload_id is None:
+        ...업로드...
+        cache.store(key, new_id, expiry_time)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Union
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "notion-project-upload", "file_uploads.sqlite3"
+)
+EXPIRY_MARGIN = 300  # 초 — 만료 직전 ID는 첨부 도중 만료될 수 있으므로 미사용
+
+STATUS_UPLOADED = "uploaded"
+STATUS_ATTACHED = "attached"
+
+
+class UploadCache:
+    """SHA-256 → file_upload_id 영속 캐시 (스레드/프로세스 공유 가능)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Raises:
+            OSError, sqlite3.Error: 캐시 디렉토리/DB를 만들거나 쓸 수 없음
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS file_uploads (
+                        sha256 TEXT PRIMARY KEY,
+                        file_upload_id TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        expiry_time TEXT,
+                        updated_at REAL NOT NULL
+                    )
+                    """
+                )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def lookup(self, sha256: str) -> Optional[str]:
+        """아직 유효한 file_upload_id가 있으면 반환, 없으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_upload_id, status, expiry_time FROM file_uploads WHERE sha256 = ?",
+                (sha256,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        file_upload_id, status, expiry_time = row
+        if status == STATUS_ATTACHED:
+            return file_upload_id
+
+        expires_at = _parse_expiry(expiry_time)
+        if expires_at is not None and expires_at - time.time() > EXPIRY_MARGIN:
+            return file_upload_id
+
+        self.invalidate(sha256)
+        return None
+
+    def store(self, sha256: str, file_upload_id: str, expiry_time: Optional[str]) -> None:
+        """새로 업로드한 (아직 첨부 전) file_upload_id 기록"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_uploads VALUES (?, ?, ?, ?, ?)",
+                (sha256, file_upload_id, STATUS_UPLOADED, expiry_time, time.time()),
+            )
+
+    def mark_attached(self, file_upload_id: str) -> None:
+        """첨부 성공 → 만료 없이 재사용 가능 상태로 변경"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE file_uploads SET status = ?, expiry_time = NULL, updated_at = ? "
+                "WHERE file_upload_id = ?",
+                (STATUS_ATTACHED, time.time(), file_upload_id),
+            )
+
+    def invalidate(self, sha256: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM file_uploads WHERE sha256 = ?", (sha256,))
+
+    def invalidate_id(self, file_upload_id: str) -> None:
+        """Notion이 거부한 file_upload_id 제거 (삭제/만료된 업로드)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM file_uploads WHERE file_upload_id = ?", (file_upload_id,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_upload_cache(path: str = DEFAULT_CACHE_PATH) -> Optional[UploadCache]:
+    """업로드 캐시 열기 — 실패하면 경고 후 None (캐시 없이 업로드 진행)"""
+    try:
+        return UploadCache(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"  ⚠️ 업로드 캐시를 열 수 없어 캐시 없이 진행: {path} ({e})")
+        return None
+
+
+def file_sha256(filepath: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 hex digest"""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bytes_sha256(data: Union[bytes, bytearray, memoryview]) -> str:
+    """메모리 이미지 내용의 SHA-256 hex digest (file_sha256과 같은 키 공간)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def token_scope(notion_token: str) -> str:
+    """통합 토큰의 캐시 scope (토큰 자체는 저장하지 않도록 해시 앞부분만)"""
+    return hashlib.sha256(notion_token.encode()).hexdigest()[:16]
+
+
+def scoped_key(scope: str, sha256: str) -> str:
+    """캐시 키 — scope + 내용 SHA-256"""
+    return f"{scope}:{sha256}"
+
+
+def _parse_expiry(expiry_time: Optional[str]) -> Optional[float]:
+    """Notion expiry_time (ISO 8601) → epoch 초"""
+    if not expiry_time:
+        return None
+    try:
+        return datetime.fromisoformat(expiry_time.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
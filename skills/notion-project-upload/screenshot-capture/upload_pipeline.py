@@ -0,0 +1,110 @@
+"""
+Upload Pipeline
+===============
+캡처와 Notion 업로드를 겹쳐 실행하는 producer/consumer 파이프라인.
+
+- 캡처가 성공할 때마다 submit() → bounded queue에 적재
+- 업로드 워커 스레드가 큐를 비우며 upload_capture() 호출
+  (메모리 이미지는 upload_bytes, 파일만 있으면 upload_image)
+- join()은 모든 업로드가 끝날 때까지 기다린 뒤 {index: file_upload_id | 예외} 반환
+
+페이지 첨부(이미지 블록 추가)는 하지 않는다 — 전략 순서대로 첨부하는 것은
+호출자(CaptureManager._upload_to_notion)의 몫.
+
+Usage:
+    pipeline = UploadPipeline(uploader).start()
+    pipeline.submit(0, result)      # 캡처 직후
+    uploads = pipeline.join()       # {0: "file-upload-id", ...}
+"""
+
+import os
+import queue
+import threading
+from typing import Union
+
+from .capture_executor import CaptureResult
+from .image_encoding import image_suffix
+from .notion_file_upload import FileValidationError, NotionFileUploader, NotionUploadError
+
+
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_UPLOAD_WORKERS = 1
+
+_STOP = object()
+
+
+def upload_capture(uploader: NotionFileUploader, result: CaptureResult) -> str:
+    """캡처 결과 업로드 — 메모리 이미지가 있으면 디스크를 거치지 않고 바이트로 전송"""
+    if result.data:
+        filename = os.path.basename(result.path) or f"{result.name}{image_suffix(result.data)}"
+        return uploader.upload_bytes(result.data, filename)
+    return uploader.upload_image(result.path)
+
+
+class UploadPipeline:
+    """캡처 결과를 받아 백그라운드에서 업로드하는 파이프라인"""
+
+    def __init__(
+        self,
+        uploader: NotionFileUploader,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        workers: int = DEFAULT_UPLOAD_WORKERS,
+    ):
+        self.uploader = uploader
+        self.workers = max(1, workers)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._threads: list[threading.Thread] = []
+        self._uploads: dict[int, Union[str, Exception]] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> "UploadPipeline":
+        """업로드 워커 스레드 시작"""
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker, name=f"notion-upload-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, index: int, result: CaptureResult) -> None:
+        """
+        캡처 결과를 업로드 큐에 추가. 실패했거나 이미지가 없는 결과는 무시.
+        큐가 가득 차면 워커가 따라잡을 때까지 블록된다 (backpressure).
+        """
+        if not result.success or not result.has_image:
+            return
+        self._queue.put((index, result))
+
+    def join(self) -> dict[int, Union[str, Exception]]:
+        """
+        남은 업로드를 모두 처리하고 워커 종료.
+
+        Returns:
+            {strategy index: file_upload_id 또는 업로드 중 발생한 예외}
+        """
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        return dict(self._uploads)
+
+    def _worker(self) -> None:
+        while True:
+            task = self._queue.get()
+            if task is _STOP:
+                break
+
+            index, result = task
+            print(f"  📤 업로드 중: {result.caption}...")
+            try:
+                outcome = upload_capture(self.uploader, result)
+            except Exception as e:
+                if isinstance(e, (NotionUploadError, FileValidationError)):
+                    outcome = e
+                else:
+                    outcome = NotionUploadError(str(e))
+
+            with self._lock:
+                self._uploads[index] = outcome
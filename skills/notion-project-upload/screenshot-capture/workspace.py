@@ -0,0 +1,86 @@
+"""
+Capture Workspace
+=================
+실행(run)마다 독립된 스크린샷 디렉토리를 만들고 끝나면 정리한다.
+
+- 디렉토리는 tempfile.mkdtemp로 생성 → 동시 실행/다중 프로세스에서도 충돌 없음
+- prefer_tmpfs=True면 /dev/shm(tmpfs)에 생성해 디스크 I/O 회피
+- path_for()는 같은 이름이 다시 요청되면 접미사를 붙여 덮어쓰기 방지
+- cleanup() 또는 with 블록 종료 시 디렉토리 통째로 삭제 (keep=True면 유지)
+
+Usage:
+    with CaptureWorkspace(prefer_tmpfs=True) as ws:
+        path = ws.path_for("main_dashboard")   # .../run-xxxx/main_dashboard.png
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_WORKSPACE_ROOT = os.path.join(tempfile.gettempdir(), "notion-screenshots")
+TMPFS_ROOT = "/dev/shm"
+
+
+class CaptureWorkspace:
+    """실행 단위 스크린샷 작업 디렉토리"""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        prefer_tmpfs: bool = False,
+        keep: bool = False,
+    ):
+        """
+        Args:
+            root: 작업 디렉토리들을 만들 상위 디렉토리 (기본: $TMPDIR/notion-screenshots)
+            prefer_tmpfs: root 미지정 시 /dev/shm 사용 (없으면 기본 root로 폴백)
+            keep: cleanup() 시 파일을 지우지 않고 유지
+        """
+        self.root = root or self._default_root(prefer_tmpfs)
+        self.keep = keep
+
+        Path(self.root).mkdir(parents=True, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix=f"run-{os.getpid()}-", dir=self.root)
+
+        self._used_names: set[str] = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, name: str, suffix: str = ".png") -> str:
+        """이 실행 안에서 고유한 출력 파일 경로 반환"""
+        stem = _safe_filename(name)
+        with self._lock:
+            candidate = f"{stem}{suffix}"
+            n = 2
+            while candidate in self._used_names:
+                candidate = f"{stem}-{n}{suffix}"
+                n += 1
+            self._used_names.add(candidate)
+        return os.path.join(self.path, candidate)
+
+    def cleanup(self) -> None:
+        """작업 디렉토리 삭제 (keep=True면 유지)"""
+        if not self.keep:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> "CaptureWorkspace":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cleanup()
+
+    @staticmethod
+    def _default_root(prefer_tmpfs: bool) -> str:
+        if prefer_tmpfs and os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK):
+            return os.path.join(TMPFS_ROOT, "notion-screenshots")
+        return DEFAULT_WORKSPACE_ROOT
+
+
+def _safe_filename(name: str) -> str:
+    """파일명으로 쓸 수 없는 문자 치환"""
+    cleaned = re.sub(r"[^\w.-]+", "_", name).strip("._")
+    return cleaned or "capture"